@@ -0,0 +1,26 @@
+"""add source_hash to assets_inventory
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2025-09-25 00:00:00
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Content hash of the materialized row + source document revision; lets incremental
+    # materialization skip rows whose source did not change since the previous scan.
+    op.add_column('assets_inventory', sa.Column('source_hash', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('assets_inventory', 'source_hash')
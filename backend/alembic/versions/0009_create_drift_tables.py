@@ -0,0 +1,64 @@
+"""Create drift findings tables
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2025-09-26 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '0009'
+down_revision = '0008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # One row per drifting asset, rebuilt by the drift stage at the end of each discovery scan
+    op.create_table('drift_findings',
+        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), nullable=False),
+        sa.Column('account_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('asset_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('resource_id', sa.String(), nullable=False),
+        sa.Column('resource_name', sa.String(), nullable=True),
+        sa.Column('service', sa.String(), nullable=True),
+        sa.Column('region', sa.String(), nullable=True),
+        sa.Column('provider', sa.String(), nullable=True),
+        sa.Column('severity', sa.String(), nullable=False),
+        sa.Column('severity_rank', sa.Integer(), nullable=False),
+        sa.Column('issue', sa.String(), nullable=True),
+        sa.Column('expected_config', sa.String(), nullable=True),
+        sa.Column('current_config', sa.String(), nullable=True),
+        sa.Column('impact', sa.String(), nullable=True),
+        sa.Column('tags', sa.JSON(), nullable=False, server_default=sa.text("'{}'::jsonb")),
+        sa.Column('drift_changes', sa.JSON(), nullable=False, server_default=sa.text("'[]'::jsonb")),
+        sa.Column('detected_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.ForeignKeyConstraint(['account_id'], ['cloud_accounts.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['asset_id'], ['assets_inventory.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('asset_id', name='uq_drift_findings_asset')
+    )
+    # Overview pages are read per account, most severe first
+    op.create_index('ix_drift_findings_account_rank', 'drift_findings', ['account_id', 'severity_rank', 'resource_id'])
+
+    # Per-account summary counts precomputed alongside the findings
+    op.create_table('drift_summaries',
+        sa.Column('account_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('total_resources', sa.Integer(), nullable=False, server_default=sa.text('0')),
+        sa.Column('drifting_resources', sa.Integer(), nullable=False, server_default=sa.text('0')),
+        sa.Column('critical_drift', sa.Integer(), nullable=False, server_default=sa.text('0')),
+        sa.Column('medium_drift', sa.Integer(), nullable=False, server_default=sa.text('0')),
+        sa.Column('low_drift', sa.Integer(), nullable=False, server_default=sa.text('0')),
+        sa.Column('computed_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.ForeignKeyConstraint(['account_id'], ['cloud_accounts.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('account_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('drift_summaries')
+    op.drop_index('ix_drift_findings_account_rank', table_name='drift_findings')
+    op.drop_table('drift_findings')
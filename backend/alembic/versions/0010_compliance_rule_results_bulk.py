@@ -0,0 +1,27 @@
+"""add failed_count and lookup index to compliance_rule_results
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2025-09-27 00:00:00
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0010'
+down_revision = '0009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # failed_resources is capped per row; failed_count keeps the real number of failing resources
+    op.add_column('compliance_rule_results', sa.Column('failed_count', sa.Integer(), nullable=False, server_default=sa.text('0')))
+    op.create_index('ix_compliance_rule_results_evaluation_rule', 'compliance_rule_results', ['evaluation_id', 'rule_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_compliance_rule_results_evaluation_rule', table_name='compliance_rule_results')
+    op.drop_column('compliance_rule_results', 'failed_count')
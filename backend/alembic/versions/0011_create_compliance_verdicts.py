@@ -0,0 +1,42 @@
+"""Create compliance_verdicts table
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2025-09-28 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '0011'
+down_revision = '0010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Latest verdict per (rule, asset); incremental evaluations only rewrite stale pairs
+    op.create_table('compliance_verdicts',
+        sa.Column('rule_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('asset_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('account_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('passed', sa.Boolean(), nullable=False),
+        sa.Column('actual_value', sa.JSON(), nullable=True),
+        sa.Column('asset_hash', sa.String(), nullable=True),
+        sa.Column('rule_updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('evaluated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.ForeignKeyConstraint(['rule_id'], ['compliance_rules.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['asset_id'], ['assets_inventory.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['account_id'], ['cloud_accounts.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('rule_id', 'asset_id')
+    )
+    op.create_index('ix_compliance_verdicts_account_rule', 'compliance_verdicts', ['account_id', 'rule_id', 'passed'])
+    op.create_index('ix_compliance_verdicts_account_asset', 'compliance_verdicts', ['account_id', 'asset_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_compliance_verdicts_account_asset', table_name='compliance_verdicts')
+    op.drop_index('ix_compliance_verdicts_account_rule', table_name='compliance_verdicts')
+    op.drop_table('compliance_verdicts')
@@ -0,0 +1,32 @@
+"""add assets_inventory indexes for paginated listing
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2025-09-29 00:00:00
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0012'
+down_revision = '0011'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Inventory filters (and the per-status summary counts) are scoped by account first
+    op.create_index('ix_assets_inventory_account_service_status', 'assets_inventory', ['account_id', 'service', 'status'])
+    op.create_index('ix_assets_inventory_account_region', 'assets_inventory', ['account_id', 'region'])
+    op.create_index('ix_assets_inventory_account_kind', 'assets_inventory', ['account_id', 'kind'])
+    # Keyset order of the default sort: display name, then id as the tie-breaker
+    op.create_index('ix_assets_inventory_display_name_id', 'assets_inventory', [sa.text('coalesce(name, resource_id)'), 'id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_assets_inventory_display_name_id', table_name='assets_inventory')
+    op.drop_index('ix_assets_inventory_account_kind', table_name='assets_inventory')
+    op.drop_index('ix_assets_inventory_account_region', table_name='assets_inventory')
+    op.drop_index('ix_assets_inventory_account_service_status', table_name='assets_inventory')
@@ -0,0 +1,25 @@
+"""add (account_id, status) index to assets_inventory
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2025-09-30 00:00:00
+
+"""
+
+from alembic import op
+
+
+revision = '0013'
+down_revision = '0012'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Per-account protected/unprotected counts; (account_id, service[, status]) and
+    # (account_id, region) come from 0012
+    op.create_index('ix_assets_inventory_account_status', 'assets_inventory', ['account_id', 'status'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_assets_inventory_account_status', table_name='assets_inventory')
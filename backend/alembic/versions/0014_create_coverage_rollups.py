@@ -0,0 +1,44 @@
+"""Create coverage_rollups table
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2025-10-01 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '0014'
+down_revision = '0013'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Asset counts per (account, service, region, status), rebuilt at the end of materialization
+    op.create_table('coverage_rollups',
+        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), nullable=False),
+        sa.Column('account_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('service', sa.String(), nullable=False),
+        sa.Column('region', sa.String(), nullable=True),
+        sa.Column('status', sa.String(), nullable=True),
+        sa.Column('asset_count', sa.Integer(), nullable=False),
+        sa.Column('computed_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.ForeignKeyConstraint(['account_id'], ['cloud_accounts.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_coverage_rollups_account', 'coverage_rollups', ['account_id'])
+
+    # Backfill from the current inventory so dashboards are populated before the next scan
+    op.execute(
+        "INSERT INTO coverage_rollups (account_id, service, region, status, asset_count) "
+        "SELECT account_id, service, region, status, count(*) FROM assets_inventory "
+        "GROUP BY account_id, service, region, status"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_coverage_rollups_account', table_name='coverage_rollups')
+    op.drop_table('coverage_rollups')
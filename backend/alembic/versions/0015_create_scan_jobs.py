@@ -0,0 +1,52 @@
+"""Create scan_jobs queue table
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2025-10-02 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '0015'
+down_revision = '0014'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Durable scan queue; workers claim rows with SELECT ... FOR UPDATE SKIP LOCKED
+    op.create_table('scan_jobs',
+        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), nullable=False),
+        sa.Column('scan_id', sa.String(), nullable=False),
+        sa.Column('account_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('scan_type', sa.String(), nullable=False),
+        sa.Column('triggered_by', sa.String(), nullable=True),
+        sa.Column('status', sa.String(), nullable=False, server_default=sa.text("'queued'")),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default=sa.text('0')),
+        sa.Column('worker_id', sa.String(), nullable=True),
+        sa.Column('error_message', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('heartbeat_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['account_id'], ['cloud_accounts.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('scan_id', name='uq_scan_jobs_scan_id')
+    )
+    op.create_index('ix_scan_jobs_status_created', 'scan_jobs', ['status', 'created_at'])
+    op.create_index('ix_scan_jobs_account_status', 'scan_jobs', ['account_id', 'status'])
+    # At most one queued job per account and scan type; duplicate requests join it
+    op.create_index(
+        'uq_scan_jobs_queued_account_type', 'scan_jobs', ['account_id', 'scan_type'],
+        unique=True, postgresql_where=sa.text("status = 'queued'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_scan_jobs_queued_account_type', table_name='scan_jobs')
+    op.drop_index('ix_scan_jobs_account_status', table_name='scan_jobs')
+    op.drop_index('ix_scan_jobs_status_created', table_name='scan_jobs')
+    op.drop_table('scan_jobs')
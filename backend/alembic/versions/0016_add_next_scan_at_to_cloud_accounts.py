@@ -0,0 +1,34 @@
+"""add next_scan_at to cloud_accounts
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2025-10-03 00:00:00
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0016'
+down_revision = '0015'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Set by the scan scheduler from discovery_frequency/preferred_time_utc; NULL until it first
+    # plans the account
+    op.add_column('cloud_accounts', sa.Column('next_scan_at', sa.DateTime(timezone=True), nullable=True))
+    # Due-account lookup of each scheduler tick
+    op.create_index(
+        'ix_cloud_accounts_next_scan_at',
+        'cloud_accounts',
+        ['next_scan_at'],
+        postgresql_where=sa.text('discovery_enabled'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_cloud_accounts_next_scan_at', table_name='cloud_accounts')
+    op.drop_column('cloud_accounts', 'next_scan_at')
@@ -0,0 +1,50 @@
+"""notify scan progress changes on the scan_progress channel
+
+Revision ID: 0017
+Revises: 0016
+Create Date: 2025-10-04 00:00:00
+
+"""
+
+from alembic import op
+
+
+revision = '0017'
+down_revision = '0016'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Every progress write (API, scan workers, compliance jobs) is published on commit; the API's
+    # listener fans it out to streaming clients. Payloads stay far below the 8000-byte NOTIFY limit.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notify_scan_progress() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('scan_progress', json_build_object(
+                'scan_id', NEW.scan_id,
+                'status', NEW.status,
+                'current_phase', NEW.current_phase,
+                'phase_progress', NEW.phase_progress,
+                'overall_progress', NEW.progress,
+                'total_phases', NEW.total_phases,
+                'estimated_completion', NEW.estimated_completion,
+                'error_message', left(NEW.error_message, 500),
+                'phase_rows', NEW.scan_metadata -> 'phase_rows',
+                'updated_at', NEW.updated_at
+            )::text);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_discovery_scans_notify_progress
+        AFTER INSERT OR UPDATE OF status, current_phase, phase_progress, progress, scan_metadata, error_message
+        ON discovery_scans
+        FOR EACH ROW EXECUTE FUNCTION notify_scan_progress()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_discovery_scans_notify_progress ON discovery_scans")
+    op.execute("DROP FUNCTION IF EXISTS notify_scan_progress()")
@@ -24,11 +24,18 @@ def cleanup_config():
 
 @router.post("/restart-fixworker-and-collect")
 def restart_fixworker_and_collect():
-    """Restart fixworker container and run collection workflow."""
+    """Start a fixworker restart and collection in the background and return right away.
+
+    Each collected account is queued for a discovery scan as soon as its collect finishes.
+    """
     try:
         from app.services.config_service import ConfigService
-        success = ConfigService().restart_fixworker_and_collect()
-        return {"ok": success, "message": "Fixworker restart and collection completed" if success else "Fixworker restart and collection failed"}
+        started = ConfigService().start_restart_fixworker_and_collect()
+        return {
+            "ok": True,
+            "message": "Fixworker restart and collection started" if started
+            else "Fixworker restart and collection already running; another run will follow it",
+        }
     except Exception as e:
         return {"ok": False, "message": f"Error during restart and collection: {str(e)}"}
 
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from fastapi import APIRouter
+
+from app.db.arango_indexes import ensure_indexes, index_report
+
+router = APIRouter(prefix="/api/admin/arango", tags=["admin"])
+
+
+@router.get("/indexes")
+def get_arango_indexes():
+    """Presence and selectivity of the Arango indexes used by inventory/drift queries"""
+    return index_report()
+
+
+@router.post("/indexes")
+def create_arango_indexes():
+    """Create any missing Arango indexes (e.g. after the first collect created the collections)"""
+    return {"results": ensure_indexes(), **index_report()}
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query
 from typing import List, Optional
 
 from app.models.compliance import (
@@ -72,10 +72,23 @@ def delete_rule(rule_id: str):
 
 
 @router.post("/evaluate", response_model=ComplianceEvaluationResponse)
-def evaluate_compliance(request: ComplianceEvaluationRequest):
-    """Evaluate compliance for an account"""
+def evaluate_compliance(request: ComplianceEvaluationRequest, background_tasks: BackgroundTasks):
+    """Queue a compliance evaluation for an account; poll GET /evaluate/{evaluation_id} for progress"""
     service = ComplianceService()
-    return service.evaluate_compliance(request)
+    response = service.start_evaluation_job(request)
+    if response.success:
+        background_tasks.add_task(ComplianceService().run_evaluation_job, response.evaluation_id, request)
+    return response
+
+
+@router.get("/evaluate/{evaluation_id}")
+def get_evaluation_progress(evaluation_id: str):
+    """Get progress (phase, rules evaluated, resources processed) and result of an evaluation job"""
+    service = ComplianceService()
+    job = service.get_evaluation_job(evaluation_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Evaluation job not found")
+    return job
 
 
 @router.get("/scores/{account_id}", response_model=List[ComplianceScoreResponse])
@@ -85,6 +98,18 @@ def get_compliance_scores(account_id: str):
     return service.get_compliance_scores(account_id)
 
 
+@router.get("/evaluations/{evaluation_id}/results")
+def get_rule_results(
+    evaluation_id: str,
+    passed: Optional[bool] = Query(None, description="Only passed (true) or failed (false) rules"),
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+):
+    """Get per-rule results of an evaluation, paginated"""
+    service = ComplianceService()
+    return service.get_rule_results(evaluation_id, passed=passed, limit=limit, offset=offset)
+
+
 @router.get("/dashboard/{account_id}", response_model=ComplianceDashboardData)
 def get_dashboard_data(account_id: str):
     """Get compliance dashboard data for an account"""
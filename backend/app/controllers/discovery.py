@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import asyncio
+import json
 from datetime import datetime
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from app.models.discovery import (
     ScanItem,
     ScanSummary,
@@ -11,9 +15,13 @@ from app.models.discovery import (
 )
 from app.services.discovery_service import DiscoveryService
 from app.services.scan_progress_service import ScanProgressService
+from app.services.scan_events import ALL_SCANS, TERMINAL_STATUSES, bus, listener, progress_event
 
 router = APIRouter(prefix="/api/tenant/discovery/history", tags=["discovery-history"])
 
+# Seconds between SSE comment lines that keep idle proxies from closing the stream
+SSE_KEEPALIVE_SECONDS = 15
+
 
 def _mock_scans() -> list[ScanItem]:
     base_image = "/placeholder.jpg"
@@ -126,12 +134,82 @@ def get_scan(scan_id: str) -> ScanDetailResponse:
     return DiscoveryService().get(scan_id)
 
 
-@router.post("/scan/{account_identifier}", response_model=ScanDetailResponse)
+@router.post("/scan/{account_identifier}", response_model=ScanDetailResponse, status_code=202)
 def trigger_scan(account_identifier: str) -> ScanDetailResponse:
-    """Trigger a discovery scan for a given account identifier and return the scan details."""
+    """Queue a discovery scan for a given account identifier and return the pending scan.
+
+    A scan worker (`python -m app.workers.scan_worker`) runs it; poll /progress/{scan_id}.
+    """
     from app.services.discovery_service import DiscoveryService
 
-    return DiscoveryService().run_scan_for_account_by_identifier(account_identifier, triggered_by="manual")
+    return DiscoveryService().enqueue_scan(account_identifier, triggered_by="manual")
+
+
+def _load_progress_event(scan_id: str):
+    progress_service = ScanProgressService()
+    try:
+        progress_data = progress_service.get_scan_progress(scan_id)
+        return progress_event(progress_data) if progress_data else None
+    finally:
+        progress_service.session.close()
+
+
+def _sse(event: dict) -> str:
+    return f"event: progress\ndata: {json.dumps(event, default=str)}\n\n"
+
+
+async def _progress_stream(request: Request, key: str, queue: asyncio.Queue, initial: list, until_done: bool):
+    try:
+        for event in initial:
+            yield _sse(event)
+        if until_done and initial and initial[-1].get("status") in TERMINAL_STATUSES:
+            return
+        while True:
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout=SSE_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    return
+                yield ": keepalive\n\n"
+                continue
+            yield _sse(event)
+            if until_done and event.get("status") in TERMINAL_STATUSES:
+                return
+    finally:
+        bus.unsubscribe(key, queue)
+
+
+def _sse_response(stream) -> StreamingResponse:
+    return StreamingResponse(
+        stream,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/progress/stream")
+async def stream_all_scan_progress(request: Request) -> StreamingResponse:
+    """Server-sent `progress` events for every scan, pushed from Postgres LISTEN/NOTIFY.
+
+    Opens with the last known state of scans still in flight; no query runs per client or event.
+    """
+    listener.ensure_started()
+    queue = bus.subscribe(ALL_SCANS)
+    initial = [e for e in bus.snapshot() if e.get("status") not in TERMINAL_STATUSES]
+    return _sse_response(_progress_stream(request, ALL_SCANS, queue, initial, until_done=False))
+
+
+@router.get("/progress/{scan_id}/stream")
+async def stream_scan_progress(scan_id: str, request: Request) -> StreamingResponse:
+    """Server-sent `progress` events for one scan; the stream ends once the scan finishes."""
+    listener.ensure_started()
+    queue = bus.subscribe(scan_id)
+    # Read after subscribing, so no transition falls between the two; the cache may be stale
+    initial = await run_in_threadpool(_load_progress_event, scan_id)
+    if initial is None:
+        bus.unsubscribe(scan_id, queue)
+        raise HTTPException(status_code=404, detail="Scan not found")
+    return _sse_response(_progress_stream(request, scan_id, queue, [initial], until_done=True))
 
 
 @router.get("/progress/{scan_id}")
@@ -149,7 +227,7 @@ def get_scan_progress(scan_id: str):
             "status": progress_data.get("status", "unknown"),
             "current_phase": progress_data.get("current_phase", "unknown"),
             "phase_progress": progress_data.get("phase_progress", 0),
-            "overall_progress": progress_data.get("progress", 0),
+            "overall_progress": progress_data.get("overall_progress", 0),
             "total_phases": progress_data.get("total_phases", 1),
             "estimated_completion": progress_data.get("estimated_completion"),
             "current_phase_start": progress_data.get("current_phase_start"),
@@ -3,9 +3,12 @@ from __future__ import annotations
 from fastapi import APIRouter, HTTPException, Query
 from typing import Dict, Any, Optional, List
 from app.db.arango import get_db
-from app.orm.models import AssetsInventory, CloudAccount
+from app.orm.models import AssetsInventory, CloudAccount, DriftFinding, DriftSummary
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from app.db.session import get_session
+from app.services import structural_diff
+from app.services.scan_scheduler_service import upcoming_scan
 import logging
 from datetime import datetime, timezone
 import json
@@ -16,117 +19,80 @@ router = APIRouter()
 
 
 @router.get("/api/tenant/drift/overview")
-async def get_drift_overview(account_identifier: str = Query(None)) -> Dict[str, Any]:
-    """Get drift overview data by comparing current fix collection with fix_node_history."""
+async def get_drift_overview(
+    account_identifier: str = Query(None),
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+) -> Dict[str, Any]:
+    """Get drift overview data from the findings precomputed by the last discovery scan."""
     try:
-        # Get all assets from PostgreSQL
         session: Session = get_session()
         try:
-            query = session.query(AssetsInventory, CloudAccount).join(
-                CloudAccount, CloudAccount.id == AssetsInventory.account_id
+            summary_q = session.query(
+                func.coalesce(func.sum(DriftSummary.total_resources), 0),
+                func.coalesce(func.sum(DriftSummary.drifting_resources), 0),
+                func.coalesce(func.sum(DriftSummary.critical_drift), 0),
+                func.coalesce(func.sum(DriftSummary.medium_drift), 0),
+                func.coalesce(func.sum(DriftSummary.low_drift), 0),
+                func.max(DriftSummary.computed_at),
             )
+            items_q = session.query(DriftFinding)
             
             if account_identifier:
-                query = query.filter(CloudAccount.account_identifier == account_identifier)
-            
-            assets = query.all()
+                account_ids = session.query(CloudAccount.id).filter(
+                    CloudAccount.account_identifier == account_identifier
+                ).scalar_subquery()
+                summary_q = summary_q.filter(DriftSummary.account_id.in_(account_ids))
+                items_q = items_q.filter(DriftFinding.account_id.in_(account_ids))
             
-            if not assets:
-                return {
-                    "summary": {
-                        "totalResources": 0,
-                        "driftingResources": 0,
-                        "criticalDrift": 0,
-                        "mediumDrift": 0,
-                        "lowDrift": 0,
-                        "lastScan": datetime.now(timezone.utc).isoformat(),
-                        "nextScan": None
-                    },
-                    "items": []
-                }
+            total, drifting, critical, medium, low, computed_at = summary_q.one()
+            next_scan = upcoming_scan(session, account_identifier)
             
-            # Get ArangoDB connection
-            db = get_db()
-            fix_collection = db.collection('fix')
-            
-            drifting_resources = []
-            total_resources = len(assets)
-            critical_count = 0
-            medium_count = 0
-            low_count = 0
+            # Most severe first; served by ix_drift_findings_account_rank
+            findings = (
+                items_q.order_by(DriftFinding.severity_rank, DriftFinding.resource_id, DriftFinding.id)
+                .offset(offset)
+                .limit(limit)
+                .all()
+            )
             
-            for asset, account in assets:
-                try:
-                    # Get current document from fix collection
-                    current_doc = fix_collection.get(asset.arango_id)
-                    if not current_doc:
-                        continue
-                    
-                    # Get first historical document from fix_node_history
-                    history_query = f"""
-                    FOR doc IN fix_node_history
-                    FILTER doc._key == @resource_key
-                    SORT doc.created ASC
-                    LIMIT 1
-                    RETURN doc
-                    """
-                    
-                    history_cursor = db.aql.execute(history_query, bind_vars={"resource_key": asset.arango_id.split('/')[-1]})
-                    history_docs = list(history_cursor)
-                    
-                    if not history_docs:
-                        continue
-                    
-                    historical_doc = history_docs[0]
-                    
-                    # Compare current vs historical
-                    drift_changes = compare_documents(current_doc, historical_doc)
-                    
-                    if drift_changes:
-                        severity = determine_severity(drift_changes, asset.kind)
-                        drift_item = {
-                            "id": f"drift-{asset.id}",
-                            "asset_id": str(asset.id),
-                            "resource_id": asset.resource_id,
-                            "resource_name": asset.name or asset.resource_id,
-                            "service": asset.service.upper() if asset.service else "UNKNOWN",
-                            "region": asset.region or "unknown",
-                            "provider": asset.provider.upper() if asset.provider else "UNKNOWN",
-                            "severity": severity,
-                            "issue": generate_issue_description(drift_changes),
-                            "detected_at": datetime.now(timezone.utc).isoformat(),
-                            "expected_config": generate_expected_config(historical_doc, drift_changes),
-                            "current_config": generate_current_config(current_doc, drift_changes),
-                            "impact": generate_impact_assessment(drift_changes, severity),
-                            "tags": asset.tags or {},
-                            "drift_changes": drift_changes
-                        }
-                        
-                        drifting_resources.append(drift_item)
-                        
-                        # Count by severity
-                        if severity == "High":
-                            critical_count += 1
-                        elif severity == "Medium":
-                            medium_count += 1
-                        else:
-                            low_count += 1
-                
-                except Exception as e:
-                    logger.warning(f"Failed to process drift for asset {asset.id}: {e}")
-                    continue
+            items = [
+                {
+                    "id": f"drift-{f.asset_id}",
+                    "asset_id": str(f.asset_id),
+                    "resource_id": f.resource_id,
+                    "resource_name": f.resource_name,
+                    "service": f.service,
+                    "region": f.region,
+                    "provider": f.provider,
+                    "severity": f.severity,
+                    "issue": f.issue,
+                    "detected_at": f.detected_at.isoformat() if f.detected_at else None,
+                    "expected_config": f.expected_config,
+                    "current_config": f.current_config,
+                    "impact": f.impact,
+                    "tags": f.tags or {},
+                    "drift_changes": f.drift_changes or [],
+                }
+                for f in findings
+            ]
             
             return {
                 "summary": {
-                    "totalResources": total_resources,
-                    "driftingResources": len(drifting_resources),
-                    "criticalDrift": critical_count,
-                    "mediumDrift": medium_count,
-                    "lowDrift": low_count,
-                    "lastScan": datetime.now(timezone.utc).isoformat(),
-                    "nextScan": None
+                    "totalResources": int(total),
+                    "driftingResources": int(drifting),
+                    "criticalDrift": int(critical),
+                    "mediumDrift": int(medium),
+                    "lowDrift": int(low),
+                    "lastScan": (computed_at or datetime.now(timezone.utc)).isoformat(),
+                    "nextScan": next_scan.isoformat() if next_scan else None
+                },
+                "items": items,
+                "pagination": {
+                    "limit": limit,
+                    "offset": offset,
+                    "total": int(drifting),
                 },
-                "items": drifting_resources
             }
             
         finally:
@@ -236,27 +202,25 @@ async def get_resource_drift_details(asset_id: str, account_identifier: str = Qu
 
 
 def compare_documents(current: Dict[str, Any], historical: Dict[str, Any]) -> List[Dict[str, Any]]:
-    """Compare current and historical documents to find changes."""
+    """Compare current and historical documents to find changes.
+
+    Walks the whole `reported` section: every changed leaf (or added/removed subtree) becomes one
+    change with its JSON-pointer `path`; `field` is the same path in dotted form.
+    """
     changes = []
     
     # Compare reported section (most important for configuration drift)
     current_reported = current.get('reported', {})
     historical_reported = historical.get('reported', {})
     
-    # Get all keys from both documents
-    all_keys = set(current_reported.keys()) | set(historical_reported.keys())
-    
-    for key in all_keys:
-        current_value = current_reported.get(key)
-        historical_value = historical_reported.get(key)
-        
-        if current_value != historical_value:
-            changes.append({
-                "field": key,
-                "current_value": current_value,
-                "historical_value": historical_value,
-                "change_type": determine_change_type(current_value, historical_value)
-            })
+    for entry in structural_diff.diff(historical_reported, current_reported):
+        changes.append({
+            "field": structural_diff.pointer_to_field(entry["path"]),
+            "path": entry["path"],
+            "current_value": entry["new"],
+            "historical_value": entry["old"],
+            "change_type": determine_change_type(entry["new"], entry["old"])
+        })
     
     return changes
 
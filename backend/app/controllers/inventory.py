@@ -1,10 +1,16 @@
-from fastapi import APIRouter
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 
 from app.services.inventory_service import InventoryService
-from sqlalchemy import select, func
+from app.services.inventory_export import InventoryExporter, MEDIA_TYPES, export_supported
+from sqlalchemy import select, false
 from sqlalchemy.orm import Session
 from app.db.session import get_session
 from app.orm.models import AssetsInventory
+from app.services.account_service import resolve_account_id
+from app.services.coverage_rollup_service import CoverageRollupService
 from app.db.arango import get_db
 from datetime import datetime
 
@@ -14,28 +20,68 @@ router = APIRouter(prefix="/api", tags=["inventory"])
 
 @router.get("/tenant/inventory")
 @router.get("/inventory")
-def get_inventory_list():
+def get_inventory_list(
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    service: Optional[str] = Query(None),
+    status: Optional[str] = Query(None),
+    region: Optional[str] = Query(None),
+    account_id: Optional[str] = Query(None),
+    kind: Optional[str] = Query(None),
+    sort: str = Query("name", description="name, service, kind, status, region or last_backup"),
+    order: str = Query("asc", pattern="^(asc|desc)$"),
+    account_identifier: Optional[str] = Query(None),
+):
     svc = InventoryService()
     # Use persisted assets inventory for responses
-    return svc.list_persisted()
+    try:
+        return svc.list_persisted(
+            limit=limit, cursor=cursor, service=service, status=status, region=region,
+            account_id=account_id, kind=kind, sort=sort, order=order,
+            account_identifier=account_identifier,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/tenant/inventory/export")
+def export_inventory(
+    format: str = Query("ndjson", pattern="^(ndjson|csv|parquet)$"),
+    account_identifier: Optional[str] = Query(None),
+):
+    """Stream the asset inventory as NDJSON, CSV or Parquet without building it in memory."""
+    if not export_supported(format):
+        raise HTTPException(status_code=400, detail=f"Export format '{format}' is not available on this server")
+    return StreamingResponse(
+        InventoryExporter().stream(format, account_identifier),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="inventory.{format}"'},
+    )
 
 
 @router.get("/tenant/inventory/details")
 @router.get("/inventory/details")
-def get_inventory_details():
+def get_inventory_details(account_identifier: Optional[str] = Query(None)):
     svc = InventoryService()
-    return svc.details()
+    return svc.details(account_identifier)
 
 
 @router.get("/tenant/inventory/coverage")
-def get_inventory_coverage():
+def get_inventory_coverage(account_identifier: Optional[str] = Query(None)):
     """Aggregate coverage by service and region from Postgres assets_inventory."""
     session: Session = get_session()
     try:
-        rows = session.execute(
-            select(AssetsInventory.service, AssetsInventory.region, AssetsInventory.status, func.count())
-            .group_by(AssetsInventory.service, AssetsInventory.region, AssetsInventory.status)
-        ).all()
+        # Resolve the account once; every query below is then served by the account_id indexes
+        scope = []
+        rows = []
+        if account_identifier:
+            acct_id = resolve_account_id(session, account_identifier)
+            scope.append(AssetsInventory.account_id == acct_id if acct_id else false())
+            if acct_id:
+                rows = CoverageRollupService.load(session, acct_id)
+        else:
+            rows = CoverageRollupService.load(session)
+
         by_service = {}
         by_region = {}
         total = 0
@@ -95,7 +141,7 @@ def get_inventory_coverage():
                 AssetsInventory.region,
                 AssetsInventory.status,
                 AssetsInventory.last_backup,
-            ).limit(500)
+            ).where(*scope).limit(500)
         ).all()
         items = [
             {
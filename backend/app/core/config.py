@@ -11,6 +11,7 @@ class Settings:
     arango_inventory_collection: str = os.getenv("ARANGO_INVENTORY_COLLECTION", "inventory")
     arango_fix_collection: str = os.getenv("ARANGO_FIX_COLLECTION", "fix")
     arango_fix_history_collection: str | None = os.getenv("ARANGO_FIX_HISTORY_COLLECTION", "fix_node_history")
+    arango_protection_index_collection: str = os.getenv("ARANGO_PROTECTION_INDEX_COLLECTION", "protection_index")
 
     # Postgres
     pg_host: str = os.getenv("POSTGRES_HOST", "localhost")
@@ -19,6 +20,71 @@ class Settings:
     pg_user: str = os.getenv("POSTGRES_USER", "ascintra")
     pg_password: str = os.getenv("POSTGRES_PASSWORD", "ascintra")
 
+    # Protection index: incremental refreshes re-aggregate volumes whose snapshots were written to
+    # `fix` since the previous refresh started (minus an overlap for collects still committing), and
+    # every Nth refresh is a full rebuild that also corrects counts of partially deleted snapshot sets
+    protection_index_overlap_seconds: int = int(os.getenv("PROTECTION_INDEX_OVERLAP_SECONDS", "600"))
+    protection_index_full_every: int = int(os.getenv("PROTECTION_INDEX_FULL_EVERY", "24"))
+
+    # Materialization (fix -> assets_inventory)
+    # Rows per INSERT ... ON CONFLICT statement; 11 bound params per row keeps the
+    # default well under the 65535 parameter limit of the Postgres wire protocol.
+    materialize_batch_size: int = int(os.getenv("MATERIALIZE_BATCH_SIZE", "1000"))
+    # Seconds the streaming AQL cursor stays alive between batch fetches
+    materialize_cursor_ttl: int = int(os.getenv("MATERIALIZE_CURSOR_TTL", "600"))
+    # Incremental mode only writes rows whose source changed and deletes rows whose source vanished;
+    # full mode wipes the account's rows and rebuilds them.
+    materialize_incremental: bool = os.getenv("MATERIALIZE_INCREMENTAL", "true").lower() in ("1", "true", "yes")
+
+    # Drift: keys per get_many/history AQL round-trip, and chunks fetched in parallel
+    drift_chunk_size: int = int(os.getenv("DRIFT_CHUNK_SIZE", "500"))
+    drift_workers: int = int(os.getenv("DRIFT_WORKERS", "4"))
+
+    # Compliance: assets per Arango lookup when loading resources for evaluation
+    compliance_fetch_chunk_size: int = int(os.getenv("COMPLIANCE_FETCH_CHUNK_SIZE", "1000"))
+    # Failing resources stored per rule result (failed_count keeps the full number)
+    compliance_failed_resources_cap: int = int(os.getenv("COMPLIANCE_FAILED_RESOURCES_CAP", "100"))
+    # Rule evaluation pool: "process" (spawned workers, scales with cores), "thread" (GIL-bound),
+    # "serial" or "fork" (only for single-threaded hosts, not the API server); 0 workers = CPU count
+    compliance_executor: str = os.getenv("COMPLIANCE_EXECUTOR", "process")
+    compliance_workers: int = int(os.getenv("COMPLIANCE_WORKERS", "0"))
+    # Vectorized (NumPy) evaluation of simple operators; ignored when NumPy is not installed
+    compliance_columnar: bool = os.getenv("COMPLIANCE_COLUMNAR", "true").lower() in ("1", "true", "yes")
+    # Re-evaluate only rules/assets changed since the stored verdicts (force_evaluation bypasses it)
+    compliance_incremental: bool = os.getenv("COMPLIANCE_INCREMENTAL", "true").lower() in ("1", "true", "yes")
+
+    # Scan queue workers: processes per `python -m app.workers.scan_worker`, concurrent scans allowed
+    # per account, idle poll interval, and seconds without a heartbeat before a job is requeued
+    scan_worker_processes: int = int(os.getenv("SCAN_WORKER_PROCESSES", "2"))
+    scan_account_concurrency: int = int(os.getenv("SCAN_ACCOUNT_CONCURRENCY", "1"))
+    scan_worker_poll_seconds: float = float(os.getenv("SCAN_WORKER_POLL_SECONDS", "2"))
+    scan_job_stale_seconds: int = int(os.getenv("SCAN_JOB_STALE_SECONDS", "300"))
+    # Scan scheduler (runs in the scan worker parent process): seconds between ticks, window after
+    # preferred_time_utc that scheduled starts are spread over, and cap on queued + running scans
+    scan_scheduler_enabled: bool = os.getenv("SCAN_SCHEDULER_ENABLED", "true").lower() in ("1", "true", "yes")
+    scan_scheduler_poll_seconds: float = float(os.getenv("SCAN_SCHEDULER_POLL_SECONDS", "30"))
+    scan_schedule_jitter_seconds: int = int(os.getenv("SCAN_SCHEDULE_JITTER_SECONDS", "900"))
+    scan_schedule_max_inflight: int = int(os.getenv("SCAN_SCHEDULE_MAX_INFLIGHT", "10"))
+    # Live phase progress while materializing: at most one progress write per this many rows or
+    # seconds, whichever comes first
+    scan_progress_every_rows: int = int(os.getenv("SCAN_PROGRESS_EVERY_ROWS", "5000"))
+    scan_progress_every_seconds: float = float(os.getenv("SCAN_PROGRESS_EVERY_SECONDS", "1"))
+
+    # Collection (fixinventory collect): command per account, formatted with {provider} and {account}
+    # after shell-style splitting; accounts that render the same command share one run. Distinct runs
+    # execute concurrently up to collect_concurrency, each bounded by collect_timeout_seconds.
+    # The default command collects every account in one run, so concurrency only applies once
+    # COLLECT_COMMAND uses the placeholders to address per-provider or per-account collectors.
+    # Collects run in the background; API requests do not wait for them.
+    collect_command: str = os.getenv(
+        "COLLECT_COMMAND", "docker exec fixshell bash -c \"echo 'workflow run collect' | fixsh\""
+    )
+    collect_concurrency: int = int(os.getenv("COLLECT_CONCURRENCY", "4"))
+    collect_timeout_seconds: int = int(os.getenv("COLLECT_TIMEOUT_SECONDS", "900"))
+
+    # Inventory export: rows per server-side cursor fetch (and per Parquet row group)
+    export_batch_size: int = int(os.getenv("EXPORT_BATCH_SIZE", "5000"))
+
     @property
     def pg_dsn(self) -> str:
         # Use psycopg3 driver for SQLAlchemy
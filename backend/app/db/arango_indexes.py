@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, List, Tuple
+
+from app.core.config import settings
+from app.db.arango import get_db
+
+logger = logging.getLogger(__name__)
+
+
+def _required_indexes() -> List[Tuple[str, Dict[str, Any]]]:
+    """Indexes the hot queries rely on, as (collection, index spec).
+
+    - fix.kinds[*]: array index for `'aws_ec2_snapshot' IN s.kinds` style kind filters
+    - fix.reported.volume_id: sparse, only snapshots/attachments carry it
+    - fix_node_history.created: history lookups match on the primary `_key` index and
+      sort by `created`
+    """
+    history = settings.arango_fix_history_collection or "fix_node_history"
+    return [
+        (settings.arango_fix_collection, {"name": "idx_fix_kinds", "fields": ["kinds[*]"], "sparse": False}),
+        (settings.arango_fix_collection, {"name": "idx_fix_reported_volume_id", "fields": ["reported.volume_id"], "sparse": True}),
+        (history, {"name": "idx_fix_node_history_created", "fields": ["created"], "sparse": False}),
+    ]
+
+
+def _find_index(existing: List[Dict[str, Any]], spec: Dict[str, Any]) -> Dict[str, Any] | None:
+    for idx in existing:
+        if idx.get("name") == spec["name"]:
+            return idx
+        if idx.get("type") == "persistent" and list(idx.get("fields") or []) == spec["fields"]:
+            return idx
+    return None
+
+
+def ensure_indexes() -> List[Dict[str, Any]]:
+    """Create any missing persistent/array indexes. Safe to call repeatedly.
+
+    Collections that do not exist yet (e.g. before the first collect) are skipped and
+    picked up on the next call.
+    """
+    db = get_db()
+    if db is None:
+        return []
+
+    results: List[Dict[str, Any]] = []
+    for collection, spec in _required_indexes():
+        entry = {"collection": collection, "name": spec["name"], "fields": spec["fields"]}
+        try:
+            if not db.has_collection(collection):
+                results.append({**entry, "status": "missing_collection"})
+                continue
+            col = db.collection(collection)
+            if _find_index(col.indexes(), spec) is not None:
+                results.append({**entry, "status": "present"})
+                continue
+            col.add_persistent_index(
+                fields=spec["fields"],
+                sparse=spec["sparse"],
+                name=spec["name"],
+                in_background=True,
+            )
+            logger.info(f"Created Arango index {spec['name']} on {collection}{spec['fields']}")
+            results.append({**entry, "status": "created"})
+        except Exception as e:
+            logger.warning(f"Failed to ensure Arango index {spec['name']} on {collection}: {e}")
+            results.append({**entry, "status": "error", "error": str(e)})
+    return results
+
+
+def index_report() -> Dict[str, Any]:
+    """Report presence and selectivity estimate of each required index."""
+    db = get_db()
+    if db is None:
+        return {"enabled": False, "indexes": []}
+
+    report: List[Dict[str, Any]] = []
+    for collection, spec in _required_indexes():
+        entry: Dict[str, Any] = {"collection": collection, "name": spec["name"], "fields": spec["fields"]}
+        try:
+            if not db.has_collection(collection):
+                report.append({**entry, "present": False, "reason": "collection does not exist"})
+                continue
+            col = db.collection(collection)
+            idx = _find_index(col.indexes(), spec)
+            report.append({
+                **entry,
+                "present": idx is not None,
+                "type": idx.get("type") if idx else None,
+                "sparse": idx.get("sparse") if idx else None,
+                "selectivity": idx.get("selectivity") if idx else None,
+                "documents": col.count(),
+            })
+        except Exception as e:
+            report.append({**entry, "present": False, "reason": str(e)})
+    return {"enabled": True, "all_present": all(r["present"] for r in report), "indexes": report}
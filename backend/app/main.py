@@ -31,6 +31,8 @@ from app.controllers.navigation import router as navigation_router
 from app.controllers.asset_details import router as asset_details_router
 from app.controllers.compliance import router as compliance_router
 from app.controllers.overview import router as overview_router
+from app.controllers.admin import router as admin_router
+from app.db.arango_indexes import ensure_indexes
 
 # Include more specific routers first to avoid accidental overrides
 app.include_router(inventory_router)
@@ -42,9 +44,27 @@ app.include_router(navigation_router)
 app.include_router(asset_details_router)
 app.include_router(compliance_router)
 app.include_router(overview_router)
+app.include_router(admin_router)
 app.include_router(generated_router)
 
 
+@app.on_event("startup")
+def ensure_arango_indexes() -> None:
+    # Best-effort: Arango may be unavailable or not yet populated at startup
+    try:
+        ensure_indexes()
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"Arango index bootstrap skipped: {e}")
+
+
+@app.on_event("shutdown")
+async def stop_scan_progress_listener() -> None:
+    # Started lazily by the first progress stream client
+    from app.services.scan_events import listener
+
+    await listener.stop()
+
+
 @app.get("/healthz")
 async def health() -> Dict[str, str]:
     return {"status": "ok"}
@@ -95,6 +95,7 @@ class ComplianceRuleResultBase(BaseModel):
     rule_id: str
     passed: bool
     failed_resources: List[Dict[str, Any]] = []
+    failed_count: int = 0
     error_message: Optional[str] = None
 
 
@@ -139,12 +140,18 @@ class ComplianceEvaluationRequest(BaseModel):
 
 class ComplianceEvaluationResponse(BaseModel):
     success: bool
+    # First framework's evaluation (kept for compatibility); evaluation_ids lists one per framework
     evaluation_id: str
+    evaluation_ids: List[str] = []
     compliance_score: float
     total_rules: int
     passed_rules: int
     failed_rules: int
     message: str
+    # Job status for queued evaluations: pending | running | completed | failed
+    status: Optional[str] = None
+    # Engine stats: rules_evaluated, resources_total, resources_touched, elapsed_seconds, rules_per_second
+    stats: Optional[Dict[str, Any]] = None
 
 
 class ComplianceRuleEvaluationRequest(BaseModel):
@@ -39,6 +39,7 @@ class ScanItem(BaseModel):
     estimated_completion: Optional[str] = None  # Estimated completion time
     error_message: Optional[str] = None  # Error details if scan failed
     scan_metadata: Optional[dict] = None  # Additional scan-specific data
+    next_scan: Optional[str] = None  # Next scheduled scan of the account (None when unscheduled)
 
 
 class ScanSummary(BaseModel):
@@ -27,6 +27,8 @@ class InventoryListResponse(BaseModel):
     mock: bool = False
     summary: InventorySummary
     items: List[InventoryItem]
+    next_cursor: Optional[str] = None  # pass back as `cursor` for the next page
+    limit: Optional[int] = None
 
 
 class InventoryDetails(BaseModel):
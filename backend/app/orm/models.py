@@ -12,6 +12,7 @@ from sqlalchemy import (
     Integer,
     Float,
     ForeignKey,
+    Index,
 )
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.dialects.postgresql import UUID
@@ -40,6 +41,7 @@ class CloudAccount(Base):
     # discovery schedule
     discovery_frequency = Column(String)  # e.g., '6h', '12h', 'daily', 'weekly'
     preferred_time_utc = Column(String)   # e.g., '02:00'
+    next_scan_at = Column(DateTime(timezone=True))  # planned by the scan scheduler
     connection_status = Column(String, nullable=False, server_default=text("'unknown'"))
     connection_last_tested_at = Column(DateTime(timezone=True))
 
@@ -49,6 +51,7 @@ class CloudAccount(Base):
     __table_args__ = (
         CheckConstraint("provider IN ('aws','gcp')", name="ck_cloud_accounts_provider"),
         UniqueConstraint("provider", "account_identifier", name="uq_cloud_accounts_provider_identifier"),
+        Index("ix_cloud_accounts_next_scan_at", "next_scan_at", postgresql_where=text("discovery_enabled")),
     )
 
 
@@ -88,6 +91,31 @@ class DiscoveryScan(Base):
     updated_at = Column(DateTime(timezone=True), nullable=False, server_default=text("now()"))
 
 
+class ScanJob(Base):
+    __tablename__ = "scan_jobs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
+    scan_id = Column(String, nullable=False, unique=True)  # discovery_scans.scan_id this job fills in
+    account_id = Column(UUID(as_uuid=True), ForeignKey("cloud_accounts.id", ondelete="CASCADE"), nullable=False)
+    scan_type = Column(String, nullable=False)
+    triggered_by = Column(String)
+    status = Column(String, nullable=False, server_default=text("'queued'"))  # queued | running | completed | failed
+    attempts = Column(Integer, nullable=False, server_default=text("0"))
+    worker_id = Column(String)
+    error_message = Column(String)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=text("now()"))
+    started_at = Column(DateTime(timezone=True))
+    heartbeat_at = Column(DateTime(timezone=True))
+    finished_at = Column(DateTime(timezone=True))
+
+    __table_args__ = (
+        Index(
+            "uq_scan_jobs_queued_account_type", "account_id", "scan_type",
+            unique=True, postgresql_where=text("status = 'queued'"),
+        ),
+    )
+
+
 class AssetsInventory(Base):
     __tablename__ = "assets_inventory"
 
@@ -103,6 +131,7 @@ class AssetsInventory(Base):
     region = Column(String)
     last_backup = Column(DateTime(timezone=True))
     arango_id = Column(String)  # e.g., collection/_key for cross-ref
+    source_hash = Column(String)  # hash of materialized row + source _rev, for incremental rescans
     tags = Column(JSON, nullable=False, server_default=text("'{}'::jsonb"))
 
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=text("now()"))
@@ -113,6 +142,18 @@ class AssetsInventory(Base):
     )
 
 
+class CoverageRollup(Base):
+    __tablename__ = "coverage_rollups"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
+    account_id = Column(UUID(as_uuid=True), ForeignKey("cloud_accounts.id", ondelete="CASCADE"), nullable=False)
+    service = Column(String, nullable=False)
+    region = Column(String)
+    status = Column(String)
+    asset_count = Column(Integer, nullable=False)
+    computed_at = Column(DateTime(timezone=True), nullable=False, server_default=text("now()"))
+
+
 class ComplianceFramework(Base):
     __tablename__ = "compliance_frameworks"
 
@@ -174,6 +215,59 @@ class ComplianceRuleResult(Base):
     evaluation_id = Column(UUID(as_uuid=True), ForeignKey("compliance_evaluations.id", ondelete="CASCADE"), nullable=False)
     rule_id = Column(UUID(as_uuid=True), ForeignKey("compliance_rules.id", ondelete="CASCADE"), nullable=False)
     passed = Column(Boolean, nullable=False)
-    failed_resources = Column(JSON, nullable=False, server_default=text("'[]'::jsonb"))
+    failed_resources = Column(JSON, nullable=False, server_default=text("'[]'::jsonb"))  # capped sample
+    failed_count = Column(Integer, nullable=False, server_default=text("0"))
     error_message = Column(String)
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=text("now()"))
+
+
+class ComplianceVerdict(Base):
+    __tablename__ = "compliance_verdicts"
+
+    rule_id = Column(UUID(as_uuid=True), ForeignKey("compliance_rules.id", ondelete="CASCADE"), primary_key=True)
+    asset_id = Column(UUID(as_uuid=True), ForeignKey("assets_inventory.id", ondelete="CASCADE"), primary_key=True)
+    account_id = Column(UUID(as_uuid=True), ForeignKey("cloud_accounts.id", ondelete="CASCADE"), nullable=False)
+    passed = Column(Boolean, nullable=False)
+    actual_value = Column(JSON)  # value read by the rule, kept for failed-resource samples
+    asset_hash = Column(String)  # assets_inventory.source_hash the verdict was computed from
+    rule_updated_at = Column(DateTime(timezone=True), nullable=False)  # compliance_rules.updated_at at evaluation
+    evaluated_at = Column(DateTime(timezone=True), nullable=False, server_default=text("now()"))
+
+
+class DriftFinding(Base):
+    __tablename__ = "drift_findings"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
+    account_id = Column(UUID(as_uuid=True), ForeignKey("cloud_accounts.id", ondelete="CASCADE"), nullable=False)
+    asset_id = Column(UUID(as_uuid=True), ForeignKey("assets_inventory.id", ondelete="CASCADE"), nullable=False)
+    resource_id = Column(String, nullable=False)
+    resource_name = Column(String)
+    service = Column(String)
+    region = Column(String)
+    provider = Column(String)
+    severity = Column(String, nullable=False)  # High | Medium | Low
+    severity_rank = Column(Integer, nullable=False)  # 0 = High, 1 = Medium, 2 = Low (sort key)
+    issue = Column(String)
+    expected_config = Column(String)
+    current_config = Column(String)
+    impact = Column(String)
+    tags = Column(JSON, nullable=False, server_default=text("'{}'::jsonb"))
+    drift_changes = Column(JSON, nullable=False, server_default=text("'[]'::jsonb"))
+    detected_at = Column(DateTime(timezone=True), nullable=False, server_default=text("now()"))
+
+    __table_args__ = (
+        UniqueConstraint("asset_id", name="uq_drift_findings_asset"),
+        Index("ix_drift_findings_account_rank", "account_id", "severity_rank", "resource_id"),
+    )
+
+
+class DriftSummary(Base):
+    __tablename__ = "drift_summaries"
+
+    account_id = Column(UUID(as_uuid=True), ForeignKey("cloud_accounts.id", ondelete="CASCADE"), primary_key=True)
+    total_resources = Column(Integer, nullable=False, server_default=text("0"))
+    drifting_resources = Column(Integer, nullable=False, server_default=text("0"))
+    critical_drift = Column(Integer, nullable=False, server_default=text("0"))
+    medium_drift = Column(Integer, nullable=False, server_default=text("0"))
+    low_drift = Column(Integer, nullable=False, server_default=text("0"))
+    computed_at = Column(DateTime(timezone=True), nullable=False, server_default=text("now()"))
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timezone
-from typing import List
+from typing import List, Optional
 
 from sqlalchemy import select
 from sqlalchemy.orm import Session
@@ -11,12 +11,23 @@ from app.db.session import get_session
 from app.models.account import AccountCreate, Account
 from app.models.account_detail import AccountDetail
 from app.orm.models import CloudAccount
+from app.services.scan_scheduler_service import next_run_at
 from fastapi import HTTPException
 from uuid import UUID
 
 logger = logging.getLogger(__name__)
 
 
+def resolve_account_id(session: Session, account_identifier: str) -> Optional[UUID]:
+    """cloud_accounts.id for a provider account identifier (e.g. an AWS account number), or None."""
+    return session.execute(
+        select(CloudAccount.id)
+        .where(CloudAccount.account_identifier == account_identifier)
+        .order_by(CloudAccount.created_at)
+        .limit(1)
+    ).scalar_one_or_none()
+
+
 class AccountService:
     def create(self, data: AccountCreate) -> Account:
         session: Session = get_session()
@@ -74,13 +85,18 @@ class AccountService:
                 connection_last_tested_at=datetime.now(timezone.utc),
             )
             session.add(obj)
+            session.flush()
+            # First scheduled scan; the initial one is queued below
+            obj.next_scan_at = next_run_at(
+                obj.id, obj.discovery_frequency, obj.preferred_time_utc, datetime.now(timezone.utc)
+            )
             session.commit()
             session.refresh(obj)
-            # Kick off initial discovery scan and inventory materialization (best-effort)
+            # Queue the initial discovery scan and inventory materialization (best-effort)
             try:
                 from app.services.discovery_service import DiscoveryService
 
-                DiscoveryService().run_scan_for_account_by_identifier(data.account_identifier, triggered_by="setup")
+                DiscoveryService().enqueue_scan(data.account_identifier, triggered_by="setup")
             except Exception:
                 # Ignore failures here to not block account creation
                 pass
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import shlex
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.session import get_session
+from app.orm.models import CloudAccount
+
+logger = logging.getLogger(__name__)
+
+# Characters of collect output kept in logs and results
+OUTPUT_TAIL_CHARS = 2000
+
+
+@dataclass(frozen=True)
+class CollectTarget:
+    provider: str
+    account_identifier: str
+
+
+@dataclass
+class CollectResult:
+    command: List[str]
+    accounts: List[str]
+    returncode: Optional[int] = None
+    timed_out: bool = False
+    error: Optional[str] = None
+    elapsed_seconds: float = 0.0
+    output: str = ""
+    scans: Dict[str, str] = field(default_factory=dict)  # account_identifier -> queued scan_id
+
+    @property
+    def collected(self) -> bool:
+        """The command ran to completion (a non-zero exit may still have collected some accounts)."""
+        return self.returncode is not None and not self.timed_out
+
+
+def collect_command(target: CollectTarget, template: Optional[str] = None) -> List[str]:
+    """argv for collecting one target; placeholders are filled after splitting, so values stay one argument."""
+    parts = shlex.split(template or settings.collect_command)
+    return [p.format(provider=target.provider, account=target.account_identifier) for p in parts]
+
+
+def enabled_targets(session: Session) -> List[CollectTarget]:
+    rows = session.execute(
+        select(CloudAccount.provider, CloudAccount.account_identifier)
+        .where(CloudAccount.discovery_enabled.is_(True))
+        .order_by(CloudAccount.provider, CloudAccount.account_identifier)
+    ).all()
+    return [CollectTarget(r.provider, r.account_identifier) for r in rows]
+
+
+def queue_materialization(targets: List[CollectTarget]) -> Dict[str, str]:
+    """Queue a discovery scan (materialization, drift, rollups) for each freshly collected account."""
+    # Import here to avoid circular imports
+    from app.services.discovery_service import DiscoveryService
+
+    scans = {}
+    for target in targets:
+        scan = DiscoveryService().enqueue_scan(target.account_identifier, triggered_by="collect")
+        # Accounts collected during setup are not stored yet; their creation queues the first scan
+        if scan.status != "cancelled":
+            scans[target.account_identifier] = scan.id
+    return scans
+
+
+class CollectOrchestrator:
+    """Runs collects for many accounts concurrently and hands each account on as soon as its collect ends.
+
+    Targets are grouped by their rendered `collect_command`; each distinct command is one asyncio
+    subprocess, and at most `concurrency` of them run at once. When a run finishes, `on_collected`
+    (default: queue a discovery scan per account) is called for its accounts right away, so total
+    time is bounded by the slowest collect rather than the sum of all of them.
+    """
+
+    def __init__(
+        self,
+        concurrency: Optional[int] = None,
+        timeout_seconds: Optional[float] = None,
+        command_template: Optional[str] = None,
+        on_collected: Callable[[List[CollectTarget]], Dict[str, str]] = queue_materialization,
+    ) -> None:
+        self.concurrency = max(1, concurrency or settings.collect_concurrency)
+        self.timeout_seconds = timeout_seconds or settings.collect_timeout_seconds
+        self.command_template = command_template
+        self.on_collected = on_collected
+        self._indexes_lock = threading.Lock()
+        self._indexes_ready = False
+
+    def plan(self, targets: List[CollectTarget]) -> Dict[Tuple[str, ...], List[CollectTarget]]:
+        runs: Dict[Tuple[str, ...], List[CollectTarget]] = {}
+        for target in targets:
+            runs.setdefault(tuple(collect_command(target, self.command_template)), []).append(target)
+        return runs
+
+    async def run(self, targets: List[CollectTarget]) -> List[CollectResult]:
+        runs = self.plan(targets)
+        logger.info(
+            f"Collecting {len(targets)} accounts in {len(runs)} runs (up to {self.concurrency} at a time)"
+        )
+        semaphore = asyncio.Semaphore(self.concurrency)
+        return list(await asyncio.gather(
+            *(self._collect_and_hand_off(list(command), group, semaphore) for command, group in runs.items())
+        ))
+
+    def run_sync(self, targets: List[CollectTarget]) -> List[CollectResult]:
+        """Blocking entry point for sync callers (the background restart-and-collect thread)."""
+        return asyncio.run(self.run(targets))
+
+    async def _collect_and_hand_off(
+        self, command: List[str], targets: List[CollectTarget], semaphore: asyncio.Semaphore
+    ) -> CollectResult:
+        result = CollectResult(command=command, accounts=[t.account_identifier for t in targets])
+        async with semaphore:
+            await self._collect(result)
+
+        if not result.collected:
+            return result
+        try:
+            # Sync database/Arango work; off the event loop so other collects keep streaming
+            result.scans = await asyncio.to_thread(self._hand_off, targets)
+        except Exception as e:
+            logger.error(f"Post-collect hand-off failed for {result.accounts}: {e}")
+            result.error = str(e)
+        return result
+
+    async def _collect(self, result: CollectResult) -> None:
+        started = time.monotonic()
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *result.command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+            )
+        except OSError as e:
+            result.error = str(e)
+            logger.error(f"Could not start collect for {result.accounts}: {e}")
+            return
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=self.timeout_seconds)
+            result.returncode = proc.returncode
+            result.output = stdout.decode("utf-8", errors="replace")[-OUTPUT_TAIL_CHARS:]
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            result.timed_out = True
+            result.error = f"collect timed out after {self.timeout_seconds}s"
+        finally:
+            result.elapsed_seconds = round(time.monotonic() - started, 1)
+
+        if result.timed_out:
+            logger.error(f"Collect for {result.accounts} timed out after {result.elapsed_seconds}s")
+        elif result.returncode != 0:
+            logger.warning(
+                f"Collect for {result.accounts} exited with {result.returncode} after "
+                f"{result.elapsed_seconds}s: {result.output}"
+            )
+        else:
+            logger.info(f"Collect for {result.accounts} finished in {result.elapsed_seconds}s")
+
+    def _hand_off(self, targets: List[CollectTarget]) -> Dict[str, str]:
+        with self._indexes_lock:
+            if not self._indexes_ready:
+                # Index collections created by the first collect (materialization refreshes the
+                # protection index itself)
+                try:
+                    from app.db.arango_indexes import ensure_indexes
+                    ensure_indexes()
+                except Exception as e:
+                    logger.warning(f"Arango index refresh after collect failed: {e}")
+                self._indexes_ready = True
+        return self.on_collected(targets)
+
+
+def collect_accounts(extra_targets: Optional[List[CollectTarget]] = None) -> List[CollectResult]:
+    """Collect every discovery-enabled account (plus `extra_targets`) and queue their materialization."""
+    session: Session = get_session()
+    try:
+        targets = enabled_targets(session)
+    finally:
+        session.close()
+    for target in extra_targets or []:
+        if target not in targets:
+            targets.append(target)
+    return CollectOrchestrator().run_sync(targets)
@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+try:
+    import numpy as np
+except ImportError:  # columnar evaluation is optional; rules fall back to the row path
+    np = None
+
+logger = logging.getLogger(__name__)
+
+# Operators with a vectorized implementation; everything else is evaluated row by row
+COLUMNAR_OPERATORS = frozenset({
+    "equals", "not_equals", "greater_than", "less_than",
+    "is_true", "is_false", "is_null", "is_not_null",
+})
+
+Accessor = Callable[[Dict[str, Any]], Any]
+Predicate = Callable[[Any], bool]
+
+
+def compile_accessor(field_path: str) -> Accessor:
+    """Pre-split a dot path once; same lookup semantics as ComplianceService.get_nested_field."""
+    keys = tuple(field_path.split('.'))
+
+    def get(data: Dict[str, Any]) -> Any:
+        value = data
+        for key in keys:
+            if isinstance(value, dict) and key in value:
+                value = value[key]
+            else:
+                return None
+        return value
+
+    return get
+
+
+def compile_predicate(operator: str, expected_value: Any) -> Predicate:
+    """Build the operator closure; same semantics as ComplianceService._evaluate_condition.
+
+    Anything that raises while evaluating (e.g. a non-numeric value for greater_than) fails the
+    check, as before.
+    """
+    if operator == "equals":
+        check = lambda v: v == expected_value  # noqa: E731
+    elif operator == "not_equals":
+        check = lambda v: v != expected_value  # noqa: E731
+    elif operator == "contains":
+        check = lambda v: expected_value in str(v) if v else False  # noqa: E731
+    elif operator == "not_contains":
+        check = lambda v: expected_value not in str(v) if v else False  # noqa: E731
+    elif operator in ("greater_than", "less_than"):
+        try:
+            bound = float(expected_value)
+        except Exception:
+            logger.error(f"Non-numeric expected value for {operator}: {expected_value!r}")
+            return lambda v: False
+        if operator == "greater_than":
+            check = lambda v: float(v) > bound if v is not None else False  # noqa: E731
+        else:
+            check = lambda v: float(v) < bound if v is not None else False  # noqa: E731
+    elif operator == "is_true":
+        check = lambda v: bool(v) is True  # noqa: E731
+    elif operator == "is_false":
+        check = lambda v: bool(v) is False  # noqa: E731
+    elif operator == "is_null":
+        check = lambda v: v is None  # noqa: E731
+    elif operator == "is_not_null":
+        check = lambda v: v is not None  # noqa: E731
+    else:
+        logger.warning(f"Unknown operator: {operator}")
+        return lambda v: False
+
+    def safe(value: Any) -> bool:
+        try:
+            return check(value)
+        except Exception:
+            return False
+
+    return safe
+
+
+@dataclass
+class CompiledRule:
+    rule: Any  # ComplianceRule (ORM or API model)
+    rule_id: str
+    resource_type: str
+    field_path: str
+    operator: str
+    expected_value: Any
+    accessor: Accessor
+    predicate: Predicate
+
+
+def compile_rule(rule: Any) -> CompiledRule:
+    return CompiledRule(
+        rule=rule,
+        rule_id=rule.rule_id,
+        resource_type=rule.resource_type,
+        field_path=rule.field_path,
+        operator=rule.operator,
+        expected_value=rule.expected_value,
+        accessor=compile_accessor(rule.field_path),
+        predicate=compile_predicate(rule.operator, rule.expected_value),
+    )
+
+
+def bucket_resources(resources: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Group resources by `type` once so each rule only visits the resources it targets."""
+    buckets: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for resource in resources:
+        buckets[resource.get("type")].append(resource)
+    return buckets
+
+
+class Column:
+    """One field_path extracted for every candidate of a resource type, plus cached typed views."""
+
+    def __init__(self, values: List[Any]) -> None:
+        self.values = np.fromiter(values, dtype=object, count=len(values))
+        self._null = None
+        self._truthy = None
+        self._floats = None
+
+    @property
+    def null(self):
+        if self._null is None:
+            self._null = np.fromiter((v is None for v in self.values), dtype=bool, count=len(self.values))
+        return self._null
+
+    @property
+    def truthy(self):
+        if self._truthy is None:
+            self._truthy = self.values.astype(bool)
+        return self._truthy
+
+    @property
+    def floats(self):
+        """float(v) per value; NaN where it is None or not convertible (so every comparison fails)."""
+        if self._floats is None:
+            floats = np.full(len(self.values), np.nan)
+            present = ~self.null
+            try:
+                floats[present] = self.values[present].astype(float)
+            except (TypeError, ValueError):
+                for i in np.flatnonzero(present):
+                    try:
+                        floats[i] = float(self.values[i])
+                    except Exception:
+                        pass
+            self._floats = floats
+        return self._floats
+
+
+def columnar_supported(compiled: CompiledRule) -> bool:
+    """Whether the rule can run as one vectorized comparison (scalar expected values only)."""
+    if np is None or compiled.operator not in COLUMNAR_OPERATORS:
+        return False
+    expected = compiled.expected_value
+    if compiled.operator in ("greater_than", "less_than"):
+        try:
+            float(expected)
+        except Exception:
+            return False
+        return True
+    return expected is None or isinstance(expected, (bool, int, float, str))
+
+
+def columnar_pass_mask(compiled: CompiledRule, column: Column):
+    """Boolean array of passing rows; same semantics as compile_predicate for the same operator."""
+    op, expected = compiled.operator, compiled.expected_value
+    with np.errstate(invalid="ignore"):
+        if op == "equals":
+            return np.asarray(column.values == expected, dtype=bool)
+        if op == "not_equals":
+            return np.asarray(column.values != expected, dtype=bool)
+        if op == "greater_than":
+            return column.floats > float(expected)
+        if op == "less_than":
+            return column.floats < float(expected)
+    if op == "is_true":
+        return column.truthy
+    if op == "is_false":
+        return ~column.truthy
+    if op == "is_null":
+        return column.null
+    return ~column.null
+
+
+@dataclass
+class EvaluationStats:
+    rules_evaluated: int = 0
+    resources_total: int = 0
+    resources_touched: int = 0
+    started: float = field(default_factory=time.perf_counter)
+
+    def as_dict(self) -> Dict[str, Any]:
+        elapsed = time.perf_counter() - self.started
+        return {
+            "rules_evaluated": self.rules_evaluated,
+            "resources_total": self.resources_total,
+            "resources_touched": self.resources_touched,
+            "elapsed_seconds": round(elapsed, 4),
+            "rules_per_second": round(self.rules_evaluated / elapsed, 2) if elapsed > 0 else None,
+        }
+
+
+class RuleEngine:
+    """Evaluates compiled rules against resources bucketed by type.
+
+    With `columnar` (default: COMPLIANCE_COLUMNAR, when NumPy is installed) simple operators run
+    as vectorized comparisons over per-type field columns; other operators stay row by row.
+    """
+
+    def __init__(self, resources: List[Dict[str, Any]], columnar: Optional[bool] = None) -> None:
+        self.resources = resources
+        self.buckets = bucket_resources(resources)
+        self.stats = EvaluationStats(resources_total=len(resources))
+        self.columnar = (settings.compliance_columnar if columnar is None else columnar) and np is not None
+        self._columns: Dict[Tuple[str, str], Column] = {}
+
+    def candidates(self, compiled: CompiledRule) -> List[Dict[str, Any]]:
+        if compiled.resource_type == "any":
+            return self.resources
+        return self.buckets.get(compiled.resource_type, [])
+
+    def evaluate(self, compiled: CompiledRule) -> Tuple[bool, List[Dict[str, Any]]]:
+        """Same result shape as ComplianceService.evaluate_rule: (passed, failed_resources)."""
+        failed_count, failed_resources = self.evaluate_sample(compiled)
+        return failed_count == 0, failed_resources
+
+    def column(self, compiled: CompiledRule) -> Column:
+        """Field column for the rule's resource type, extracted once and shared by its rules."""
+        key = (compiled.resource_type, compiled.field_path)
+        column = self._columns.get(key)
+        if column is None:
+            accessor = compiled.accessor
+            column = self._columns[key] = Column([accessor(r) for r in self.candidates(compiled)])
+        return column
+
+    def evaluate_sample(self, compiled: CompiledRule, limit: Optional[int] = None) -> Tuple[int, List[Dict[str, Any]]]:
+        """Count failing resources, materializing at most `limit` of them."""
+        candidates = self.candidates(compiled)
+        if self.columnar and candidates and columnar_supported(compiled):
+            failed_count, failed_resources = self._evaluate_columnar(compiled, candidates, limit)
+        else:
+            failed_count, failed_resources = self._evaluate_rows(compiled, candidates, limit)
+        self.stats.rules_evaluated += 1
+        self.stats.resources_touched += len(candidates)
+        return failed_count, failed_resources
+
+    def _failed(self, compiled: CompiledRule, resource: Dict[str, Any], actual_value: Any) -> Dict[str, Any]:
+        return {
+            "resource_id": resource.get("id"),
+            "resource_name": resource.get("name"),
+            "resource_type": resource.get("type"),
+            "actual_value": actual_value,
+            "expected_value": compiled.expected_value,
+            "field_path": compiled.field_path,
+        }
+
+    def _evaluate_rows(
+        self, compiled: CompiledRule, candidates: List[Dict[str, Any]], limit: Optional[int]
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        failed_resources = []
+        failed_count = 0
+        accessor, predicate = compiled.accessor, compiled.predicate
+        for resource in candidates:
+            actual_value = accessor(resource)
+            if not predicate(actual_value):
+                failed_count += 1
+                if limit is not None and len(failed_resources) >= limit:
+                    continue
+                failed_resources.append(self._failed(compiled, resource, actual_value))
+        return failed_count, failed_resources
+
+    def _evaluate_columnar(
+        self, compiled: CompiledRule, candidates: List[Dict[str, Any]], limit: Optional[int]
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        column = self.column(compiled)
+        failing = np.flatnonzero(~columnar_pass_mask(compiled, column))
+        sample = failing if limit is None else failing[:limit]
+        values = column.values
+        return len(failing), [self._failed(compiled, candidates[i], values[i]) for i in sample.tolist()]
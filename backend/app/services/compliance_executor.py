@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import threading
+from functools import partial
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.services.compliance_engine import RuleEngine, compile_rule
+
+logger = logging.getLogger(__name__)
+
+# Below this many (rule, resource) visits, pool start-up costs more than it saves
+MIN_PARALLEL_WORK = 50_000
+
+# Read-only resource snapshot shared with workers. Forked processes inherit it copy-on-write;
+# spawned ones receive it once per worker through the pool initializer.
+_SNAPSHOT: List[Dict[str, Any]] = []
+_ENGINE: Optional[RuleEngine] = None
+# Serializes fork-pool runs so concurrent evaluations do not swap the snapshot under a fork
+_SNAPSHOT_LOCK = threading.Lock()
+
+# (index, rule_id, resource_type, field_path, operator, expected_value)
+RuleSpec = Tuple[int, str, str, str, str, Any]
+
+
+def _init_worker(resources: List[Dict[str, Any]]) -> None:
+    global _SNAPSHOT, _ENGINE
+    _SNAPSHOT = resources
+    _ENGINE = None
+
+
+def _engine() -> RuleEngine:
+    global _ENGINE
+    if _ENGINE is None:
+        _ENGINE = RuleEngine(_SNAPSHOT)
+    return _ENGINE
+
+
+def _evaluate_shard(specs: List[RuleSpec], failed_cap: Optional[int], engine: Optional[RuleEngine] = None) -> List[Dict[str, Any]]:
+    engine = engine or _engine()
+    out = []
+    for index, rule_id, resource_type, field_path, operator, expected_value in specs:
+        rule = SimpleNamespace(
+            rule_id=rule_id,
+            resource_type=resource_type,
+            field_path=field_path,
+            operator=operator,
+            expected_value=expected_value,
+        )
+        try:
+            compiled = compile_rule(rule)
+            failed_count, failed_resources = engine.evaluate_sample(compiled, failed_cap)
+            passed = failed_count == 0
+            touched = len(engine.candidates(compiled))
+            error_message = None
+        except Exception as e:
+            passed, failed_count, failed_resources, touched, error_message = False, 0, [], 0, str(e)
+        out.append({
+            "index": index,
+            "passed": passed,
+            "failed_resources": failed_resources,
+            "failed_count": failed_count,
+            "resources_touched": touched,
+            "error_message": error_message,
+        })
+    return out
+
+
+class EvaluationExecutor:
+    """Shards compliance rules across a worker pool and merges the results in rule order.
+
+    `mode` is "process" (default: spawned workers, scales with cores), "thread", "serial" or
+    "fork". Rule evaluation is pure Python, so threads hold the GIL and only help when little
+    else competes for it. Forking copies the snapshot for free but is only safe in a single-threaded host: the
+    API process holds database and HTTP connection pools whose locks other threads may own at fork
+    time, so it is opt-in. Small workloads always run serially.
+    """
+
+    def __init__(self, workers: Optional[int] = None, mode: Optional[str] = None) -> None:
+        self.workers = max(1, workers or settings.compliance_workers or os.cpu_count() or 1)
+        self.mode = (mode or settings.compliance_executor).lower()
+
+    def _process_pool(self, resources: List[Dict[str, Any]], workers: int) -> Executor:
+        if self.mode == "fork" and "fork" in multiprocessing.get_all_start_methods():
+            return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork"))
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(resources,),
+        )
+
+    def _run_pool(self, pool: Executor, shards, failed_cap, results, on_progress) -> None:
+        for shard_results in pool.map(_evaluate_shard, shards, [failed_cap] * len(shards)):
+            results.extend(shard_results)
+            if on_progress:
+                on_progress(len(results))
+
+    def run(
+        self,
+        rules: List[Any],
+        resources: List[Dict[str, Any]],
+        failed_cap: Optional[int],
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Evaluate `rules` against `resources`; one result dict per rule, in input order.
+
+        `failed_cap` limits the failing resources returned per rule (None returns all of them).
+        `on_progress` is called with the number of rules evaluated so far as shards complete.
+        """
+        specs: List[RuleSpec] = [
+            (i, r.rule_id, r.resource_type, r.field_path, r.operator, r.expected_value)
+            for i, r in enumerate(rules)
+        ]
+        workers = min(self.workers, len(specs))
+        if self.mode == "serial" or workers <= 1 or len(specs) * len(resources) < MIN_PARALLEL_WORK:
+            results = _evaluate_shard(specs, failed_cap, RuleEngine(resources))
+            if on_progress:
+                on_progress(len(results))
+            return results
+
+        # Round-robin shards keep rules of the same resource type spread across workers
+        shards = [specs[w::workers] for w in range(workers)]
+        results: List[Dict[str, Any]] = []
+        if self.mode == "thread":
+            evaluate = partial(_evaluate_shard, failed_cap=failed_cap, engine=RuleEngine(resources))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for shard_results in pool.map(evaluate, shards):
+                    results.extend(shard_results)
+                    if on_progress:
+                        on_progress(len(results))
+        elif self.mode == "fork":
+            with _SNAPSHOT_LOCK:
+                # Forked children inherit the module-level snapshot
+                _init_worker(resources)
+                try:
+                    with self._process_pool(resources, workers) as pool:
+                        self._run_pool(pool, shards, failed_cap, results, on_progress)
+                finally:
+                    _init_worker([])
+        else:
+            # Spawned workers get their own copy through the initializer; runs do not contend
+            with self._process_pool(resources, workers) as pool:
+                self._run_pool(pool, shards, failed_cap, results, on_progress)
+        logger.info(f"Evaluated {len(specs)} rules on {workers} {self.mode} workers")
+        return sorted(results, key=lambda r: r["index"])
@@ -2,15 +2,19 @@ from __future__ import annotations
 
 import json
 import logging
+import time
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from uuid import uuid4
 from collections import defaultdict
 
-from sqlalchemy import select, func, desc
+from sqlalchemy import select, func, desc, insert, case
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.db.session import get_session
 from app.db.arango import get_db
+from app.models.scan_types import ScanPhase, ScanType, get_scan_phases
 from app.models.compliance import (
     ComplianceFramework,
     ComplianceRule,
@@ -28,6 +32,10 @@ from app.models.compliance import (
     ComplianceFrameworkSummary,
     ComplianceDashboardData,
 )
+from app.services.compliance_engine import RuleEngine, bucket_resources, compile_rule
+from app.services.compliance_executor import EvaluationExecutor
+from app.services.compliance_verdict_service import ComplianceVerdictStore, plan_incremental, verdict_rows
+from app.services.scan_progress_service import ScanProgressService
 from app.orm.models import (
     ComplianceFramework as ComplianceFrameworkORM,
     ComplianceRule as ComplianceRuleORM,
@@ -35,6 +43,7 @@ from app.orm.models import (
     ComplianceRuleResult as ComplianceRuleResultORM,
     AssetsInventory,
     CloudAccount,
+    DiscoveryScan,
 )
 
 logger = logging.getLogger(__name__)
@@ -138,6 +147,8 @@ class ComplianceService:
 
             for field, value in rule_data.model_dump(exclude_unset=True).items():
                 setattr(rule, field, value)
+            # Stored compliance verdicts are keyed on updated_at; bumping it invalidates them
+            rule.updated_at = func.now()
 
             self.session.commit()
             self.session.refresh(rule)
@@ -185,30 +196,7 @@ class ComplianceService:
     def evaluate_rule(self, rule: ComplianceRuleORM, resources: List[Dict[str, Any]]) -> Tuple[bool, List[Dict[str, Any]]]:
         """Evaluate a single rule against a list of resources"""
         try:
-            failed_resources = []
-            
-            for resource in resources:
-                # Check if resource type matches
-                if rule.resource_type != "any" and resource.get("type") != rule.resource_type:
-                    continue
-
-                # Get the actual value from the resource
-                actual_value = self.get_nested_field(resource, rule.field_path)
-                
-                # Evaluate based on operator
-                passed = self._evaluate_condition(actual_value, rule.operator, rule.expected_value)
-                
-                if not passed:
-                    failed_resources.append({
-                        "resource_id": resource.get("id"),
-                        "resource_name": resource.get("name"),
-                        "resource_type": resource.get("type"),
-                        "actual_value": actual_value,
-                        "expected_value": rule.expected_value,
-                        "field_path": rule.field_path,
-                    })
-
-            return len(failed_resources) == 0, failed_resources
+            return RuleEngine(resources).evaluate(compile_rule(rule))
         except Exception as e:
             logger.error(f"Error evaluating rule {rule.rule_id}: {e}")
             return False, []
@@ -243,8 +231,31 @@ class ComplianceService:
             logger.error(f"Error evaluating condition: {e}")
             return False
 
-    def get_inventory_resources(self, account_id: str) -> List[Dict[str, Any]]:
-        """Get inventory resources for compliance evaluation"""
+    @staticmethod
+    def referenced_reported_fields(rules: List[Any]) -> Optional[List[str]]:
+        """Top-level `reported` attributes the rules read, or None when a rule needs all of `reported`."""
+        fields = set()
+        for rule in rules:
+            parts = rule.field_path.split('.')
+            if parts[0] != "reported":
+                continue
+            if len(parts) == 1:
+                return None
+            fields.add(parts[1])
+        return sorted(fields)
+
+    def get_inventory_resources(
+        self,
+        account_id: str,
+        reported_fields: Optional[List[str]] = None,
+        asset_ids: Optional[Set[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get inventory resources for compliance evaluation
+
+        Arango documents are fetched in chunks with one AQL lookup per chunk. When
+        `reported_fields` is given only those top-level `reported` attributes are returned;
+        `asset_ids` restricts the result to those assets.
+        """
         try:
             # Get assets from PostgreSQL
             assets = self.session.execute(
@@ -252,16 +263,19 @@ class ComplianceService:
                 .join(CloudAccount, CloudAccount.id == AssetsInventory.account_id)
                 .filter(AssetsInventory.account_id == account_id)
             ).all()
+            if asset_ids is not None:
+                assets = [(asset, provider) for asset, provider in assets if str(asset.id) in asset_ids]
 
-            resources = []
-            db = get_db()
+            # arango_id contains the full document ID, extract the key part
+            keys = [asset.arango_id.split('/')[-1] for asset, _ in assets if asset.arango_id]
+            reported_by_key = self._fetch_reported(keys, reported_fields)
 
+            resources = []
             for asset, provider in assets:
-                # Get the raw ArangoDB document
-                # arango_id contains the full document ID, extract the key part
-                arango_key = asset.arango_id.split('/')[-1] if '/' in asset.arango_id else asset.arango_id
-                arango_doc = db.collection('fix').get(arango_key)
-                if arango_doc:
+                if not asset.arango_id:
+                    continue
+                reported = reported_by_key.get(asset.arango_id.split('/')[-1])
+                if reported is not None:
                     resource = {
                         "id": str(asset.id),
                         "resource_id": asset.resource_id,
@@ -270,7 +284,7 @@ class ComplianceService:
                         "provider": provider,
                         "region": asset.region,
                         "tags": asset.tags or {},
-                        "reported": arango_doc.get("reported", {}),
+                        "reported": reported,
                     }
                     resources.append(resource)
 
@@ -279,8 +293,43 @@ class ComplianceService:
             logger.error(f"Error fetching inventory resources: {e}")
             return []
 
-    def evaluate_compliance(self, request: ComplianceEvaluationRequest) -> ComplianceEvaluationResponse:
-        """Evaluate compliance for an account"""
+    def _fetch_reported(self, keys: List[str], reported_fields: Optional[List[str]]) -> Dict[str, Dict[str, Any]]:
+        """Map fix document key -> (projected) `reported`, for the documents that exist."""
+        db = get_db()
+        if db is None or not keys:
+            return {}
+        projection = "d.reported || {}" if reported_fields is None else "KEEP(d.reported || {}, @fields)"
+        aql = f"""
+        FOR k IN @keys
+          LET d = DOCUMENT(@col, k)
+          FILTER d != null
+          RETURN {{ key: d._key, reported: {projection} }}
+        """
+        chunk_size = max(1, settings.compliance_fetch_chunk_size)
+        out: Dict[str, Dict[str, Any]] = {}
+        for i in range(0, len(keys), chunk_size):
+            chunk = keys[i:i + chunk_size]
+            bind_vars: Dict[str, Any] = {"keys": chunk, "col": settings.arango_fix_collection}
+            if reported_fields is not None:
+                bind_vars["fields"] = reported_fields
+            for row in db.aql.execute(aql, bind_vars=bind_vars, batch_size=len(chunk)):
+                out[row["key"]] = row["reported"]
+        return out
+
+    def evaluate_compliance(
+        self,
+        request: ComplianceEvaluationRequest,
+        progress: Optional[Callable[[ScanPhase, Dict[str, Any]], None]] = None,
+    ) -> ComplianceEvaluationResponse:
+        """Evaluate compliance for an account
+
+        `progress`, when given, is called on every phase change with counters for the job record
+        (rules_total, rules_evaluated, resources_processed).
+        """
+        def report(phase: ScanPhase, **counters: Any) -> None:
+            if progress:
+                progress(phase, counters)
+
         try:
             # Get frameworks to evaluate
             if request.framework_id:
@@ -301,9 +350,16 @@ class ComplianceService:
                     message="No enabled frameworks found"
                 )
 
-            # Get inventory resources
-            resources = self.get_inventory_resources(request.account_id)
-            if not resources:
+            # Load enabled rules first so only the fields they reference are fetched
+            rules_by_framework = {}
+            for framework in frameworks:
+                rules_by_framework[framework.id] = [r for r in self.get_rules(framework.id) if r.enabled]
+            all_rules = [r for rules in rules_by_framework.values() for r in rules]
+            report(ScanPhase.DISCOVERING, rules_total=len(all_rules))
+
+            verdicts = ComplianceVerdictStore(self.session)
+            assets = verdicts.load_assets(request.account_id)
+            if not assets:
                 return ComplianceEvaluationResponse(
                     success=False,
                     evaluation_id="",
@@ -314,23 +370,83 @@ class ComplianceService:
                     message="No resources found for evaluation"
                 )
 
+            # Only rules edited since their stored verdicts, and assets whose source changed, are re-run
+            incremental = settings.compliance_incremental and not request.force_evaluation
+            plan = plan_incremental(
+                all_rules,
+                assets,
+                verdicts.load_rule_state(request.account_id) if incremental else {},
+                verdicts.load_asset_state(request.account_id) if incremental else {},
+                force=not incremental,
+            )
+            resources = []
+            if plan.fetch_assets:
+                resources = self.get_inventory_resources(
+                    request.account_id, self.referenced_reported_fields(all_rules), asset_ids=plan.fetch_assets
+                )
+
+            report(ScanPhase.ANALYZING, resources_processed=len(resources), rules_evaluated=0)
+
             total_rules = 0
             total_passed = 0
             total_failed = 0
-            evaluation_results = []
+            evaluation_ids = []
+            failed_cap = max(0, settings.compliance_failed_resources_cap)
+            hashes = {a.asset_id: a.source_hash for a in assets}
+
+            # Stale rules see every fetched resource, fresh rules only the changed ones
+            started = time.perf_counter()
+            executor = EvaluationExecutor()
+            changed = [r for r in resources if r["id"] in plan.changed_assets]
+            runs = [
+                ([r for r in all_rules if r.id in plan.stale_rules], resources),
+                ([r for r in all_rules if r.id in plan.fresh_rules], changed),
+            ]
+            outcomes: Dict[str, Dict[str, Any]] = {}
+            rows: List[Dict[str, Any]] = []
+            done = 0
+            for rules, pool in runs:
+                if not rules or not pool:
+                    continue
+                buckets = bucket_resources(pool)
+                results = executor.run(
+                    rules, pool, None,
+                    on_progress=lambda n, base=done: report(ScanPhase.ANALYZING, rules_evaluated=base + n),
+                )
+                for rule, outcome in zip(rules, results):
+                    outcomes[rule.id] = outcome
+                    if outcome["error_message"]:
+                        # Drop every verdict of a rule that errored so the next run re-evaluates it
+                        plan.stale_rules.add(rule.id)
+                        plan.fresh_rules.discard(rule.id)
+                        continue
+                    candidates = pool if rule.resource_type == "any" else buckets.get(rule.resource_type, [])
+                    failed = {f["resource_id"]: f["actual_value"] for f in outcome["failed_resources"]}
+                    rows.extend(verdict_rows(request.account_id, rule, candidates, failed, hashes))
+                done += len(rules)
+            elapsed = time.perf_counter() - started
+            report(ScanPhase.MATERIALIZING)
+
+            # Scores come from the stored verdicts, so unchanged pairs cost nothing
+            verdicts.replace(request.account_id, plan, rows)
+            self.session.flush()
+            summary = verdicts.summarize(request.account_id, all_rules, failed_cap)
+            resources_touched = sum(o["resources_touched"] for o in outcomes.values())
 
             for framework in frameworks:
-                # Get rules for this framework
-                rules = self.get_rules(framework.id)
-                enabled_rules = [r for r in rules if r.enabled]
+                enabled_rules = rules_by_framework[framework.id]
 
                 framework_passed = 0
                 framework_failed = 0
+                rule_results = []
 
                 for rule in enabled_rules:
                     total_rules += 1
-                    passed, failed_resources = self.evaluate_rule(rule, resources)
-                    
+                    error_message = outcomes.get(rule.id, {}).get("error_message")
+                    if error_message:
+                        logger.error(f"Error evaluating rule {rule.rule_id}: {error_message}")
+                    passed = not error_message and summary[rule.id]["failed_count"] == 0
+
                     if passed:
                         total_passed += 1
                         framework_passed += 1
@@ -338,38 +454,64 @@ class ComplianceService:
                         total_failed += 1
                         framework_failed += 1
 
-                    evaluation_results.append({
-                        "rule_id": rule.rule_id,
+                    rule_results.append({
+                        "rule_id": rule.id,
                         "passed": passed,
-                        "failed_resources": failed_resources,
+                        "failed_resources": summary[rule.id]["failed_resources"],
+                        "failed_count": summary[rule.id]["failed_count"],
+                        "error_message": error_message,
                     })
 
+                framework_total = len(enabled_rules)
+                # One evaluation per framework; per-rule detail lives in compliance_rule_results
+                evaluation = ComplianceEvaluationORM(
+                    account_id=request.account_id,
+                    framework_id=framework.id,
+                    total_rules=framework_total,
+                    passed_rules=framework_passed,
+                    failed_rules=framework_failed,
+                    compliance_score=(framework_passed / framework_total * 100) if framework_total > 0 else 0.0,
+                    evaluation_data={"resources_evaluated": len(assets)},
+                )
+                self.session.add(evaluation)
+                self.session.flush()
+
+                if rule_results:
+                    for row in rule_results:
+                        row["evaluation_id"] = evaluation.id
+                    # executemany: one round-trip batch instead of one ORM insert per rule
+                    self.session.execute(insert(ComplianceRuleResultORM), rule_results)
+                evaluation_ids.append(str(evaluation.id))
+
             # Calculate overall compliance score
             compliance_score = (total_passed / total_rules * 100) if total_rules > 0 else 0.0
 
-            # Create evaluation record
-            evaluation = ComplianceEvaluationORM(
-                account_id=request.account_id,
-                framework_id=frameworks[0].id,  # Use first framework for now
-                total_rules=total_rules,
-                passed_rules=total_passed,
-                failed_rules=total_failed,
-                compliance_score=compliance_score,
-                evaluation_data={"results": evaluation_results}
-            )
-
-            self.session.add(evaluation)
             self.session.commit()
-            self.session.refresh(evaluation)
 
             return ComplianceEvaluationResponse(
                 success=True,
-                evaluation_id=str(evaluation.id),
+                evaluation_id=evaluation_ids[0] if evaluation_ids else "",
+                evaluation_ids=evaluation_ids,
                 compliance_score=compliance_score,
                 total_rules=total_rules,
                 passed_rules=total_passed,
                 failed_rules=total_failed,
-                message="Compliance evaluation completed successfully"
+                message="Compliance evaluation completed successfully",
+                stats={
+                    # Rules run by the executor this time; the others kept their stored verdicts
+                    "rules_evaluated": done,
+                    "rules_reused": len(all_rules) - done,
+                    "resources_total": len(assets),
+                    "resources_fetched": len(resources),
+                    "resources_touched": resources_touched,
+                    "incremental": incremental,
+                    "stale_rules": len(plan.stale_rules),
+                    "changed_assets": len(plan.changed_assets),
+                    "elapsed_seconds": round(elapsed, 4),
+                    "rules_per_second": round(done / elapsed, 2) if elapsed > 0 else None,
+                    "executor": executor.mode,
+                    "workers": executor.workers,
+                },
             )
 
         except Exception as e:
@@ -387,59 +529,176 @@ class ComplianceService:
         finally:
             self.session.close()
 
+    def start_evaluation_job(self, request: ComplianceEvaluationRequest) -> ComplianceEvaluationResponse:
+        """Record a compliance evaluation job (a DiscoveryScan of type compliance) and return its id.
+
+        The caller runs `run_evaluation_job` in the background; progress is polled through
+        `get_evaluation_job`.
+        """
+        try:
+            account = self.session.get(CloudAccount, request.account_id)
+            if not account:
+                return ComplianceEvaluationResponse(
+                    success=False,
+                    evaluation_id="",
+                    compliance_score=0.0,
+                    total_rules=0,
+                    passed_rules=0,
+                    failed_rules=0,
+                    message="Account not found",
+                    status="failed",
+                )
+
+            job_id = f"eval-{uuid4().hex[:8]}"
+            start = datetime.now(timezone.utc)
+            self.session.add(DiscoveryScan(
+                scan_id=job_id,
+                account_id=account.id,
+                type="compliance",  # Legacy field
+                status="pending",
+                start_time=start,
+                duration_seconds=0,
+                resources_scanned=0,
+                resources_with_backups=0,
+                findings={"critical": 0, "high": 0, "medium": 0, "low": 0},
+                recovery_score=0,
+                backup_coverage=0.0,
+                triggered_by="api",
+                region=account.primary_region or "",
+                progress=0,
+                scan_type=ScanType.COMPLIANCE.value,
+                current_phase=ScanPhase.INITIALIZING.value,
+                phase_progress=0,
+                total_phases=len(get_scan_phases(ScanType.COMPLIANCE)),
+                current_phase_start=start,
+                scan_metadata={
+                    "account_identifier": account.account_identifier,
+                    "request": request.model_dump(),
+                },
+            ))
+            self.session.commit()
+
+            return ComplianceEvaluationResponse(
+                success=True,
+                evaluation_id=job_id,
+                compliance_score=0.0,
+                total_rules=0,
+                passed_rules=0,
+                failed_rules=0,
+                message="Compliance evaluation queued",
+                status="pending",
+            )
+        except Exception as e:
+            logger.error(f"Error queueing compliance evaluation: {e}")
+            self.session.rollback()
+            return ComplianceEvaluationResponse(
+                success=False,
+                evaluation_id="",
+                compliance_score=0.0,
+                total_rules=0,
+                passed_rules=0,
+                failed_rules=0,
+                message=f"Error queueing evaluation: {str(e)}",
+                status="failed",
+            )
+        finally:
+            self.session.close()
+
+    def run_evaluation_job(self, job_id: str, request: ComplianceEvaluationRequest) -> None:
+        """Run a queued evaluation, reporting phases and counters on the job's DiscoveryScan row"""
+        progress_service = ScanProgressService()
+        try:
+            account_identifier = (progress_service.get_scan_progress(job_id) or {}).get("scan_metadata", {}).get("account_identifier", "")
+            progress_service.start_scan(job_id, ScanType.COMPLIANCE, account_identifier)
+            progress_service.update_status(job_id, "running")
+
+            def on_progress(phase: ScanPhase, counters: Dict[str, Any]) -> None:
+                scan = progress_service.get_scan_progress(job_id) or {}
+                if scan.get("current_phase") != phase.value:
+                    progress_service.update_phase(job_id, phase, 0)
+                if counters:
+                    progress_service.update_scan_metadata(job_id, counters)
+                total = (scan.get("scan_metadata") or {}).get("rules_total")
+                if phase == ScanPhase.ANALYZING and total and "rules_evaluated" in counters:
+                    progress_service.update_phase_progress(job_id, int(counters["rules_evaluated"] / total * 100))
+
+            result = self.evaluate_compliance(request, progress=on_progress)
+
+            progress_service.update_phase(job_id, ScanPhase.FINALIZING, 0)
+            progress_service.update_scan_metadata(job_id, {"result": result.model_dump()})
+            progress_service.complete_scan(job_id, success=result.success, error_message=None if result.success else result.message)
+        except Exception as e:
+            logger.error(f"Compliance evaluation job {job_id} failed: {e}")
+            progress_service.complete_scan(job_id, success=False, error_message=str(e))
+        finally:
+            progress_service.session.close()
+
+    def get_evaluation_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Progress of an evaluation job: phase, rules evaluated, resources processed and, once done, the result"""
+        progress_service = ScanProgressService()
+        try:
+            scan = progress_service.get_scan_progress(job_id)
+            if not scan or scan.get("scan_type") != ScanType.COMPLIANCE.value:
+                return None
+            meta = scan.get("scan_metadata") or {}
+            return {
+                "evaluation_id": job_id,
+                "status": scan["status"],
+                "current_phase": scan["current_phase"],
+                "phase_progress": scan["phase_progress"],
+                "overall_progress": scan["overall_progress"],
+                "elapsed_time_seconds": scan["elapsed_time_seconds"],
+                "rules_total": meta.get("rules_total"),
+                "rules_evaluated": meta.get("rules_evaluated", 0),
+                "resources_processed": meta.get("resources_processed", 0),
+                "error_message": scan["error_message"],
+                "result": meta.get("result"),
+            }
+        finally:
+            progress_service.session.close()
+            self.session.close()
+
     def get_compliance_scores(self, account_id: str) -> List[ComplianceScoreResponse]:
         """Get compliance scores for an account"""
         try:
-            # Get latest evaluations for each framework
+            # Latest evaluation per framework
             evaluations = self.session.execute(
                 select(ComplianceEvaluationORM, ComplianceFrameworkORM)
                 .join(ComplianceFrameworkORM, ComplianceFrameworkORM.id == ComplianceEvaluationORM.framework_id)
                 .filter(ComplianceEvaluationORM.account_id == account_id)
-                .order_by(ComplianceEvaluationORM.evaluation_date.desc())
+                .distinct(ComplianceEvaluationORM.framework_id)
+                .order_by(ComplianceEvaluationORM.framework_id, ComplianceEvaluationORM.evaluation_date.desc())
             ).all()
 
-            # Group by framework and get latest
-            framework_evaluations = {}
-            for evaluation, framework in evaluations:
-                if framework.id not in framework_evaluations:
-                    framework_evaluations[framework.id] = {
-                        "evaluation": evaluation,
-                        "framework": framework
-                    }
-
-            scores = []
-            for framework_id, data in framework_evaluations.items():
-                evaluation = data["evaluation"]
-                framework = data["framework"]
-
-                # Calculate category breakdown
-                categories = defaultdict(lambda: {"total": 0, "passed": 0, "failed": 0})
-                
-                # Get rule results for this evaluation
-                rule_results = self.session.execute(
-                    select(ComplianceRuleResultORM, ComplianceRuleORM)
+            # Category breakdown for all of them in one aggregation
+            categories: Dict[Any, Dict[str, Dict[str, Any]]] = defaultdict(dict)
+            if evaluations:
+                passed_sum = func.sum(case((ComplianceRuleResultORM.passed, 1), else_=0))
+                rows = self.session.execute(
+                    select(
+                        ComplianceRuleResultORM.evaluation_id,
+                        ComplianceRuleORM.category,
+                        func.count(ComplianceRuleResultORM.id),
+                        passed_sum,
+                    )
                     .join(ComplianceRuleORM, ComplianceRuleORM.id == ComplianceRuleResultORM.rule_id)
-                    .filter(ComplianceRuleResultORM.evaluation_id == evaluation.id)
+                    .filter(ComplianceRuleResultORM.evaluation_id.in_([e.id for e, _ in evaluations]))
+                    .group_by(ComplianceRuleResultORM.evaluation_id, ComplianceRuleORM.category)
                 ).all()
-
-                for rule_result, rule in rule_results:
-                    categories[rule.category]["total"] += 1
-                    if rule_result.passed:
-                        categories[rule.category]["passed"] += 1
-                    else:
-                        categories[rule.category]["failed"] += 1
-
-                # Calculate category scores
-                category_scores = {}
-                for category, stats in categories.items():
-                    if stats["total"] > 0:
-                        category_scores[category] = {
-                            "score": (stats["passed"] / stats["total"]) * 100,
-                            "total": stats["total"],
-                            "passed": stats["passed"],
-                            "failed": stats["failed"]
+                for evaluation_id, category, total, passed in rows:
+                    passed = int(passed or 0)
+                    if total > 0:
+                        categories[evaluation_id][category] = {
+                            "score": (passed / total) * 100,
+                            "total": total,
+                            "passed": passed,
+                            "failed": total - passed
                         }
 
+            scores = []
+            for evaluation, framework in sorted(evaluations, key=lambda r: r[0].evaluation_date, reverse=True):
+                category_scores = categories.get(evaluation.id, {})
+
                 scores.append(ComplianceScoreResponse(
                     framework_id=str(framework.id),
                     framework_name=framework.name,
@@ -459,6 +718,57 @@ class ComplianceService:
         finally:
             self.session.close()
 
+    def get_rule_results(
+        self,
+        evaluation_id: str,
+        passed: Optional[bool] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> Dict[str, Any]:
+        """Page through the per-rule results of one evaluation (failed rules first)"""
+        try:
+            query = (
+                select(ComplianceRuleResultORM, ComplianceRuleORM)
+                .join(ComplianceRuleORM, ComplianceRuleORM.id == ComplianceRuleResultORM.rule_id)
+                .filter(ComplianceRuleResultORM.evaluation_id == evaluation_id)
+            )
+            if passed is not None:
+                query = query.filter(ComplianceRuleResultORM.passed == passed)
+
+            total = self.session.execute(
+                select(func.count()).select_from(query.subquery())
+            ).scalar() or 0
+            rows = self.session.execute(
+                query.order_by(
+                    ComplianceRuleResultORM.passed,
+                    ComplianceRuleResultORM.failed_count.desc(),
+                    ComplianceRuleORM.rule_id,
+                )
+                .offset(offset)
+                .limit(limit)
+            ).all()
+
+            items = []
+            for result, rule in rows:
+                items.append({
+                    "id": str(result.id),
+                    "rule_id": rule.rule_id,
+                    "category": rule.category,
+                    "description": rule.description,
+                    "severity": rule.severity,
+                    "passed": result.passed,
+                    "failed_count": result.failed_count,
+                    "failed_resources": result.failed_resources or [],
+                    "error_message": result.error_message,
+                })
+
+            return {"items": items, "total": total, "limit": limit, "offset": offset}
+        except Exception as e:
+            logger.error(f"Error fetching rule results for evaluation {evaluation_id}: {e}")
+            return {"items": [], "total": 0, "limit": limit, "offset": offset}
+        finally:
+            self.session.close()
+
     def get_dashboard_data(self, account_id: str) -> ComplianceDashboardData:
         """Get compliance dashboard data"""
         try:
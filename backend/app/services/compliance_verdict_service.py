@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import select, func, delete, insert
+from sqlalchemy.orm import Session
+
+from app.orm.models import AssetsInventory, ComplianceVerdict
+
+logger = logging.getLogger(__name__)
+
+# Rows per INSERT/DELETE round-trip when rewriting verdicts
+WRITE_BATCH_SIZE = 5000
+
+
+@dataclass
+class AssetState:
+    asset_id: str
+    kind: Optional[str]
+    source_hash: Optional[str]
+
+
+@dataclass
+class VerdictPlan:
+    """Which rules and assets an incremental evaluation has to look at again."""
+
+    stale_rules: Set[str] = field(default_factory=set)  # re-run against every candidate asset
+    fresh_rules: Set[str] = field(default_factory=set)  # re-run only against changed assets
+    changed_assets: Set[str] = field(default_factory=set)
+    fetch_assets: Set[str] = field(default_factory=set)  # assets whose documents must be loaded
+
+
+def plan_incremental(
+    rules: List[Any],
+    assets: List[AssetState],
+    rule_state: Dict[str, Tuple[Any, Any]],
+    asset_state: Dict[str, Tuple[Optional[str], Optional[str]]],
+    force: bool = False,
+) -> VerdictPlan:
+    """Split rules into stale/fresh and find the assets whose verdicts are out of date.
+
+    A rule is stale when any stored verdict was computed from a different `updated_at` (or it has
+    none); an asset changed when any stored verdict was computed from a different `source_hash`.
+    Assets without a hash are always treated as changed.
+    """
+    plan = VerdictPlan()
+    for rule in rules:
+        state = rule_state.get(rule.id)
+        if force or state is None or state[0] != state[1] or state[0] != rule.updated_at:
+            plan.stale_rules.add(rule.id)
+        else:
+            plan.fresh_rules.add(rule.id)
+
+    stale_types = {r.resource_type for r in rules if r.id in plan.stale_rules}
+    fresh_types = {r.resource_type for r in rules if r.id in plan.fresh_rules}
+    for asset in assets:
+        state = asset_state.get(asset.asset_id)
+        changed = (
+            asset.source_hash is None
+            or state is None
+            or state[0] != state[1]
+            or state[0] != asset.source_hash
+        )
+        # Changed assets only matter to fresh rules that target them; stale rules see everything
+        if changed and ("any" in fresh_types or asset.kind in fresh_types):
+            plan.changed_assets.add(asset.asset_id)
+            plan.fetch_assets.add(asset.asset_id)
+        if "any" in stale_types or asset.kind in stale_types:
+            plan.fetch_assets.add(asset.asset_id)
+    return plan
+
+
+def verdict_rows(
+    account_id: str,
+    rule: Any,
+    candidates: List[Dict[str, Any]],
+    failed: Dict[str, Any],
+    hashes: Dict[str, Optional[str]],
+) -> List[Dict[str, Any]]:
+    """One verdict row per candidate resource; `failed` maps failing resource ids to actual values."""
+    return [
+        {
+            "rule_id": rule.id,
+            "asset_id": resource["id"],
+            "account_id": account_id,
+            "passed": resource["id"] not in failed,
+            "actual_value": failed.get(resource["id"]),
+            "asset_hash": hashes.get(resource["id"]),
+            "rule_updated_at": rule.updated_at,
+        }
+        for resource in candidates
+    ]
+
+
+def _chunks(items: List[Any], size: int = WRITE_BATCH_SIZE) -> Iterable[List[Any]]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+class ComplianceVerdictStore:
+    """Reads and rewrites the per-(rule, asset) verdicts of one account."""
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def load_assets(self, account_id: str) -> List[AssetState]:
+        rows = self.session.execute(
+            select(AssetsInventory.id, AssetsInventory.kind, AssetsInventory.source_hash)
+            .where(AssetsInventory.account_id == account_id)
+        ).all()
+        return [AssetState(str(r.id), r.kind, r.source_hash) for r in rows]
+
+    def load_rule_state(self, account_id: str) -> Dict[str, Tuple[Any, Any]]:
+        rows = self.session.execute(
+            select(
+                ComplianceVerdict.rule_id,
+                func.min(ComplianceVerdict.rule_updated_at),
+                func.max(ComplianceVerdict.rule_updated_at),
+            )
+            .where(ComplianceVerdict.account_id == account_id)
+            .group_by(ComplianceVerdict.rule_id)
+        ).all()
+        return {str(rule_id): (lo, hi) for rule_id, lo, hi in rows}
+
+    def load_asset_state(self, account_id: str) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+        rows = self.session.execute(
+            select(
+                ComplianceVerdict.asset_id,
+                func.min(ComplianceVerdict.asset_hash),
+                func.max(ComplianceVerdict.asset_hash),
+            )
+            .where(ComplianceVerdict.account_id == account_id)
+            .group_by(ComplianceVerdict.asset_id)
+        ).all()
+        return {str(asset_id): (lo, hi) for asset_id, lo, hi in rows}
+
+    def replace(self, account_id: str, plan: VerdictPlan, rows: List[Dict[str, Any]]) -> None:
+        """Drop the verdicts the plan invalidated and insert the freshly computed ones."""
+        if plan.stale_rules:
+            self.session.execute(
+                delete(ComplianceVerdict).where(
+                    ComplianceVerdict.account_id == account_id,
+                    ComplianceVerdict.rule_id.in_(list(plan.stale_rules)),
+                )
+            )
+        if plan.fresh_rules and plan.changed_assets:
+            fresh_rules = list(plan.fresh_rules)
+            for chunk in _chunks(list(plan.changed_assets)):
+                self.session.execute(
+                    delete(ComplianceVerdict).where(
+                        ComplianceVerdict.account_id == account_id,
+                        ComplianceVerdict.rule_id.in_(fresh_rules),
+                        ComplianceVerdict.asset_id.in_(chunk),
+                    )
+                )
+        for chunk in _chunks(rows):
+            self.session.execute(insert(ComplianceVerdict), chunk)
+        logger.info(
+            f"Rewrote {len(rows)} compliance verdicts for account {account_id} "
+            f"({len(plan.stale_rules)} stale rules, {len(plan.changed_assets)} changed assets)"
+        )
+
+    def summarize(self, account_id: str, rules: List[Any], failed_cap: int) -> Dict[str, Dict[str, Any]]:
+        """Per rule id: failed_count and a sample of at most `failed_cap` failing resources."""
+        if not rules:
+            return {}
+        rule_ids = [r.id for r in rules]
+        counts = self.session.execute(
+            select(ComplianceVerdict.rule_id, func.count())
+            .where(
+                ComplianceVerdict.account_id == account_id,
+                ComplianceVerdict.rule_id.in_(rule_ids),
+                ComplianceVerdict.passed.is_(False),
+            )
+            .group_by(ComplianceVerdict.rule_id)
+        ).all()
+        summary = {
+            rule_id: {"failed_count": 0, "failed_resources": []} for rule_id in rule_ids
+        }
+        for rule_id, failed in counts:
+            summary[str(rule_id)]["failed_count"] = failed
+
+        if failed_cap <= 0 or not counts:
+            return summary
+
+        ranked = (
+            select(
+                ComplianceVerdict.rule_id,
+                ComplianceVerdict.asset_id,
+                ComplianceVerdict.actual_value,
+                func.row_number().over(
+                    partition_by=ComplianceVerdict.rule_id, order_by=ComplianceVerdict.asset_id
+                ).label("rn"),
+            )
+            .where(
+                ComplianceVerdict.account_id == account_id,
+                ComplianceVerdict.rule_id.in_(rule_ids),
+                ComplianceVerdict.passed.is_(False),
+            )
+            .subquery()
+        )
+        samples = self.session.execute(
+            select(ranked.c.rule_id, ranked.c.asset_id, ranked.c.actual_value, AssetsInventory.name, AssetsInventory.kind)
+            .join(AssetsInventory, AssetsInventory.id == ranked.c.asset_id)
+            .where(ranked.c.rn <= failed_cap)
+            .order_by(ranked.c.rule_id, ranked.c.rn)
+        ).all()
+        rules_by_id = {r.id: r for r in rules}
+        for rule_id, asset_id, actual_value, name, kind in samples:
+            rule = rules_by_id[str(rule_id)]
+            summary[str(rule_id)]["failed_resources"].append({
+                "resource_id": str(asset_id),
+                "resource_name": name,
+                "resource_type": kind,
+                "actual_value": actual_value,
+                "expected_value": rule.expected_value,
+                "field_path": rule.field_path,
+            })
+        return summary
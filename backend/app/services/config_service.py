@@ -3,13 +3,23 @@ from __future__ import annotations
 import json
 import logging
 import subprocess
+import threading
 import time
-from typing import Optional
+from typing import List, Optional, TYPE_CHECKING
 
 from app.db.arango import get_db
 
+if TYPE_CHECKING:
+    from app.services.collect_orchestrator import CollectTarget
+
 logger = logging.getLogger(__name__)
 
+# Background restart-and-collect runs of this process: one at a time; requests made during a run
+# are folded into a single follow-up run (their extra targets merged)
+_collect_lock = threading.Lock()
+_collect_running = False
+_collect_pending: Optional[List["CollectTarget"]] = None
+
 
 class ConfigService:
     def update_fix_worker_aws_credentials(
@@ -167,13 +177,14 @@ class ConfigService:
             logger.error(f"DEBUG: Error during cleanup: {e}")
             return False
 
-    def restart_fixworker_and_collect(self) -> bool:
+    def restart_fixworker_and_collect(self, extra_targets: Optional[List["CollectTarget"]] = None) -> bool:
         """Restart fixworker container and run collection workflow.
         
         This function:
         1. Restarts the fixworker container
         2. Waits for it to be ready
-        3. Runs the collection workflow inside fixshell
+        3. Collects all discovery-enabled accounts (plus `extra_targets`, e.g. an account being set
+           up) through the CollectOrchestrator and queues their materialization
         """
         try:
             logger.info("DEBUG: Starting fixworker restart and collection workflow...")
@@ -217,26 +228,17 @@ class ConfigService:
                 else:
                     logger.warning("DEBUG: Fixworker did not become ready in time, proceeding anyway...")
             
-            # Step 3: Run collection workflow inside fixshell
-            logger.info("DEBUG: Running collection workflow in fixshell...")
-            
-            # Run the workflow command inside fixsh
-            logger.info("DEBUG: Running 'workflow run collect' in fixsh...")
-            result = subprocess.run(
-                ["docker", "exec", "fixshell", "bash", "-c", "echo 'workflow run collect' | fixsh"],
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minutes timeout for collection
+            # Step 3: Collect every account concurrently; each one is queued for
+            # materialization as soon as its own collect finishes
+            from app.services.collect_orchestrator import collect_accounts
+
+            results = collect_accounts(extra_targets)
+            logger.info(
+                "DEBUG: Collection finished: "
+                + ", ".join(f"{r.accounts} -> {'ok' if r.collected else r.error} ({r.elapsed_seconds}s)" for r in results)
             )
-            
-            if result.returncode != 0:
-                logger.warning(f"DEBUG: collect command returned non-zero exit code: {result.returncode}")
-                logger.warning(f"DEBUG: stderr: {result.stderr}")
-            else:
-                logger.info("DEBUG: collect completed successfully")
-                logger.info(f"DEBUG: stdout: {result.stdout}")
-            
-            logger.info("DEBUG: Collection workflow completed")
+            if results and not any(r.collected for r in results):
+                return False
             return True
             
         except subprocess.TimeoutExpired:
@@ -246,6 +248,39 @@ class ConfigService:
             logger.error(f"DEBUG: Error during fixworker restart and collection: {e}")
             return False
 
+    def start_restart_fixworker_and_collect(self, extra_targets: Optional[List["CollectTarget"]] = None) -> bool:
+        """Run restart_fixworker_and_collect on a background thread and return right away.
+
+        Returns True when a run started, False when one is already running; the request then
+        triggers one more run after it, so configuration changed in the meantime is collected.
+        """
+        global _collect_running, _collect_pending
+        with _collect_lock:
+            if _collect_running:
+                _collect_pending = (_collect_pending or []) + list(extra_targets or [])
+                logger.info("Fixworker restart and collection already running; queued a follow-up run")
+                return False
+            _collect_running = True
+        threading.Thread(
+            target=self._restart_and_collect_loop,
+            args=(list(extra_targets or []),),
+            name="fixworker-collect",
+            daemon=True,
+        ).start()
+        return True
+
+    def _restart_and_collect_loop(self, extra_targets: List["CollectTarget"]) -> None:
+        global _collect_running, _collect_pending
+        while True:
+            try:
+                self.restart_fixworker_and_collect(extra_targets)
+            finally:
+                with _collect_lock:
+                    if _collect_pending is None:
+                        _collect_running = False
+                        return
+                    extra_targets, _collect_pending = _collect_pending, None
+
     def update_fix_worker_gcp_credentials(
         self,
         project_id: str,
@@ -363,13 +398,11 @@ class ConfigService:
             col.update(doc)
             logger.info(f"DEBUG: Successfully updated fix.worker config for GCP project {project_id}")
             
-            # Restart fixworker and run collection workflow
+            # Restart fixworker and collect in the background; the collect queues the project's
+            # materialization when it finishes
             logger.info("DEBUG: Starting fixworker restart and collection workflow...")
-            restart_success = self.restart_fixworker_and_collect()
-            if restart_success:
-                logger.info("DEBUG: Fixworker restart and collection completed successfully")
-            else:
-                logger.warning("DEBUG: Fixworker restart and collection failed, but config was updated")
+            from app.services.collect_orchestrator import CollectTarget
+            self.start_restart_fixworker_and_collect([CollectTarget("gcp", project_id)])
             
             return True
         except Exception as e:
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import logging
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import select, delete, func, insert, literal
+from sqlalchemy.orm import Session
+
+from app.orm.models import AssetsInventory, CoverageRollup
+
+logger = logging.getLogger(__name__)
+
+# (service, region, status, asset_count)
+RollupRow = Tuple[str, Optional[str], Optional[str], int]
+
+
+class CoverageRollupService:
+    """Per-account asset counts by (service, region, status), rebuilt after each materialization.
+
+    Dashboards read these few rows instead of grouping assets_inventory on every request.
+    """
+
+    @staticmethod
+    def refresh(session: Session, account_id: UUID) -> int:
+        """Rebuild the account's rollups inside the caller's transaction; returns the group count."""
+        session.execute(delete(CoverageRollup).where(CoverageRollup.account_id == account_id))
+        grouped = (
+            select(
+                literal(account_id).label("account_id"),
+                AssetsInventory.service,
+                AssetsInventory.region,
+                AssetsInventory.status,
+                func.count().label("asset_count"),
+            )
+            .where(AssetsInventory.account_id == account_id)
+            .group_by(AssetsInventory.service, AssetsInventory.region, AssetsInventory.status)
+        )
+        result = session.execute(
+            insert(CoverageRollup).from_select(
+                ["account_id", "service", "region", "status", "asset_count"], grouped
+            )
+        )
+        groups = result.rowcount or 0
+        logger.info(f"Refreshed {groups} coverage rollups for account {account_id}")
+        return groups
+
+    @staticmethod
+    def load(session: Session, account_id: Optional[UUID] = None) -> List[RollupRow]:
+        """Rollup rows for one account, or summed over all accounts."""
+        query = select(
+            CoverageRollup.service,
+            CoverageRollup.region,
+            CoverageRollup.status,
+            func.sum(CoverageRollup.asset_count),
+        )
+        if account_id is not None:
+            query = query.where(CoverageRollup.account_id == account_id)
+        rows = session.execute(
+            query.group_by(CoverageRollup.service, CoverageRollup.region, CoverageRollup.status)
+        ).all()
+        return [(svc, region, status, int(count)) for svc, region, status, count in rows]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List
+from typing import List, Tuple
 from sqlalchemy import select, func
 from sqlalchemy.orm import Session
 
@@ -8,7 +8,7 @@ from app.db.session import get_session
 from app.orm.models import DiscoveryScan, CloudAccount
 from app.models.discovery import ScanItem, Findings, ScanListResponse, ScanSummary, ScanDetailResponse
 from app.models.scan_types import ScanType, ScanPhase
-from app.services.scan_progress_service import ScanProgressService
+from app.services.scan_progress_service import ScanProgressService, PhaseProgressReporter
 from datetime import datetime, timezone
 from uuid import uuid4
 
@@ -23,6 +23,7 @@ class DiscoveryService:
                     DiscoveryScan.scan_id,
                     CloudAccount.name,
                     CloudAccount.account_identifier,
+                    CloudAccount.next_scan_at,
                     DiscoveryScan.type,
                     DiscoveryScan.status,
                     DiscoveryScan.start_time,
@@ -46,6 +47,8 @@ class DiscoveryService:
                     DiscoveryScan.error_message,
                     DiscoveryScan.scan_metadata,
                 ).join(CloudAccount, CloudAccount.id == DiscoveryScan.account_id)
+                # Compliance evaluation jobs share the table but are not discovery scans
+                .where(DiscoveryScan.scan_type == ScanType.INVENTORY.value)
                 .order_by(DiscoveryScan.start_time.desc())
             ).all()
 
@@ -78,6 +81,7 @@ class DiscoveryService:
                         estimated_completion=(r.estimated_completion.isoformat() if r.estimated_completion else None),
                         error_message=r.error_message,
                         scan_metadata=r.scan_metadata or {},
+                        next_scan=(r.next_scan_at.isoformat() if r.next_scan_at else None),
                     )
                 )
 
@@ -108,6 +112,7 @@ class DiscoveryService:
                     DiscoveryScan.scan_id,
                     CloudAccount.name,
                     CloudAccount.account_identifier,
+                    CloudAccount.next_scan_at,
                     DiscoveryScan.type,
                     DiscoveryScan.status,
                     DiscoveryScan.start_time,
@@ -189,15 +194,129 @@ class DiscoveryService:
                 estimated_completion=(r.estimated_completion.isoformat() if r.estimated_completion else None),
                 error_message=r.error_message,
                 scan_metadata=r.scan_metadata or {},
+                next_scan=(r.next_scan_at.isoformat() if r.next_scan_at else None),
             )
             return ScanDetailResponse(**item.model_dump())
         finally:
             session.close()
 
+    @staticmethod
+    def _cancelled_scan(account_identifier: str, triggered_by: str) -> ScanDetailResponse:
+        """Placeholder returned when the account does not exist."""
+        return ScanDetailResponse(
+            id=f"scan-{uuid4().hex[:8]}",
+            account_name="",
+            account_id=account_identifier,
+            type="full",
+            status="cancelled",
+            start_time="",
+            end_time=None,
+            duration_seconds=0,
+            resources_scanned=0,
+            resources_with_backups=0,
+            findings=Findings(critical=0, high=0, medium=0, low=0),
+            recovery_score=0,
+            backup_coverage=0.0,
+            triggered_by=triggered_by,
+            region="",
+            progress=None,
+            scan_type="inventory",
+        )
+
+    @staticmethod
+    def _create_scan(
+        session: Session,
+        acct: CloudAccount,
+        triggered_by: str,
+        scan_type: ScanType,
+        status: str,
+    ) -> str:
+        """Insert the discovery_scans row for a new scan (not committed) and return its scan_id."""
+        start = datetime.now(timezone.utc)
+        scan_id = f"scan-{uuid4().hex[:8]}"
+        session.add(DiscoveryScan(
+            scan_id=scan_id,
+            account_id=acct.id,
+            type="full",  # Legacy field
+            status=status,
+            start_time=start,
+            duration_seconds=0,
+            resources_scanned=0,
+            resources_with_backups=0,
+            findings={"critical": 0, "high": 0, "medium": 0, "low": 0},
+            recovery_score=0,
+            backup_coverage=0.0,
+            triggered_by=triggered_by,
+            region=acct.primary_region or "",
+            progress=0,
+            # New progress tracking fields
+            scan_type=scan_type.value,
+            current_phase=ScanPhase.INITIALIZING.value,
+            phase_progress=0,
+            total_phases=4,  # Will be updated by progress service
+            current_phase_start=start,
+            estimated_completion=None,  # Will be set by progress service
+            error_message=None,
+            scan_metadata={"account_identifier": acct.account_identifier}
+        ))
+        return scan_id
+
+    def enqueue_scan(self, account_identifier: str, triggered_by: str = "manual", scan_type: ScanType = ScanType.INVENTORY) -> ScanDetailResponse:
+        """Record a pending scan and queue it for the scan workers; returns immediately.
+
+        A request for an account that already has the same scan type queued returns that scan.
+        """
+        session: Session = get_session()
+        try:
+            acct = (
+                session.query(CloudAccount)
+                .filter(CloudAccount.account_identifier == account_identifier)
+                .one_or_none()
+            )
+            if not acct:
+                return self._cancelled_scan(account_identifier, triggered_by)
+
+            scan_id, _ = self.queue_scan(session, acct, triggered_by, scan_type)
+            session.commit()
+        finally:
+            session.close()
+        return self.get(scan_id)
+
+    @classmethod
+    def queue_scan(
+        cls,
+        session: Session,
+        acct: CloudAccount,
+        triggered_by: str,
+        scan_type: ScanType = ScanType.INVENTORY,
+    ) -> Tuple[str, bool]:
+        """Add a pending scan and its queue job in the caller's transaction (not committed).
+
+        Returns (scan_id, queued); queued is False when the request was folded into the scan
+        already queued for the account.
+        """
+        # Import here to avoid circular imports
+        from app.services.scan_queue_service import ScanQueueService
+
+        existing = ScanQueueService.find_queued(session, acct.id, scan_type.value)
+        if existing is not None:
+            return existing, False
+        savepoint = session.begin_nested()
+        scan_id = cls._create_scan(session, acct, triggered_by, scan_type, status="pending")
+        session.flush()
+        existing = ScanQueueService.enqueue(session, acct.id, scan_id, scan_type.value, triggered_by)
+        if existing is not None:
+            # Lost a race with another request: drop our scan row and report the queued one
+            savepoint.rollback()
+            return existing, False
+        savepoint.commit()
+        return scan_id, True
+
     def run_scan_for_account_by_identifier(self, account_identifier: str, triggered_by: str = "manual", scan_type: ScanType = ScanType.INVENTORY) -> ScanDetailResponse:
         """Create a discovery scan record, materialize assets from fix into inventory, and finalize the scan.
 
-        Returns the finalized ScanDetailResponse (or minimal if failure).
+        Runs synchronously; API callers use `enqueue_scan` instead. Returns the finalized
+        ScanDetailResponse (or minimal if failure).
         """
         # Lookup account
         session: Session = get_session()
@@ -209,56 +328,26 @@ class DiscoveryService:
             )
             if not acct:
                 # Not found: return a cancelled placeholder
-                return ScanDetailResponse(
-                    id=f"scan-{uuid4().hex[:8]}",
-                    account_name="",
-                    account_id=account_identifier,
-                    type="full",
-                    status="cancelled",
-                    start_time="",
-                    end_time=None,
-                    duration_seconds=0,
-                    resources_scanned=0,
-                    resources_with_backups=0,
-                    findings=Findings(critical=0, high=0, medium=0, low=0),
-                    recovery_score=0,
-                    backup_coverage=0.0,
-                    triggered_by=triggered_by,
-                    region="",
-                    progress=None,
-                    scan_type="inventory",
-                )
+                return self._cancelled_scan(account_identifier, triggered_by)
 
-            start = datetime.now(timezone.utc)
-            scan_id = f"scan-{uuid4().hex[:8]}"
-            
             # Create running scan with progress tracking
-            row = DiscoveryScan(
-                scan_id=scan_id,
-                account_id=acct.id,
-                type="full",  # Legacy field
-                status="running",
-                start_time=start,
-                duration_seconds=0,
-                resources_scanned=0,
-                resources_with_backups=0,
-                findings={"critical": 0, "high": 0, "medium": 0, "low": 0},
-                recovery_score=0,
-                backup_coverage=0.0,
-                triggered_by=triggered_by,
-                region=acct.primary_region or "",
-                progress=0,
-                # New progress tracking fields
-                scan_type=scan_type.value,
-                current_phase=ScanPhase.INITIALIZING.value,
-                phase_progress=0,
-                total_phases=4,  # Will be updated by progress service
-                current_phase_start=start,
-                estimated_completion=None,  # Will be set by progress service
-                error_message=None,
-                scan_metadata={"account_identifier": account_identifier}
-            )
-            session.add(row)
+            scan_id = self._create_scan(session, acct, triggered_by, scan_type, status="running")
+            session.commit()
+        finally:
+            session.close()
+        return self.execute_scan(scan_id)
+
+    def execute_scan(self, scan_id: str) -> ScanDetailResponse:
+        """Run the phases of an existing (pending or running) scan and record its results."""
+        session: Session = get_session()
+        try:
+            row = session.query(DiscoveryScan).filter(DiscoveryScan.scan_id == scan_id).one()
+            acct = session.get(CloudAccount, row.account_id)
+            account_identifier = acct.account_identifier
+            scan_type = ScanType(row.scan_type)
+            start = datetime.now(timezone.utc)
+            row.status = "running"
+            row.start_time = start
             session.commit()
 
             # Initialize progress tracking
@@ -293,16 +382,30 @@ class DiscoveryService:
                 progress_service.update_phase(scan_id, ScanPhase.MATERIALIZING, 0)
                 logger.info("Materializing discovered resources...")
                 
-                # Actually run the materialization
+                # Actually run the materialization, reporting rows processed as batches are written
                 inventory_service = InventoryService()
-                totals = inventory_service.materialize_assets_from_fix(account_identifier=account_identifier)
-                
-                progress_service.update_phase_progress(scan_id, 100)
+                reporter = PhaseProgressReporter(scan_id)
+                try:
+                    totals = inventory_service.materialize_assets_from_fix(
+                        account_identifier=account_identifier, progress=reporter
+                    )
+                except Exception:
+                    reporter.close(finished=False)
+                    raise
+                reporter.close()
                 
                 # Phase 4: Finalizing
                 progress_service.update_phase(scan_id, ScanPhase.FINALIZING, 0)
                 logger.info("Finalizing scan results...")
                 
+                # Drift detection: refresh precomputed drift findings for this account.
+                # A drift failure should not fail an otherwise successful inventory scan.
+                try:
+                    from app.services.drift_detection_service import DriftDetectionService
+                    DriftDetectionService().refresh_account(account.id)
+                except Exception as e:
+                    logger.warning(f"Drift detection failed for account {account_identifier}: {e}")
+                
                 # Calculate recovery score based on backup coverage
                 total = int(totals.get("total", 0))
                 protected = int(totals.get("protected", 0))
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+from uuid import UUID
+
+from sqlalchemy import delete, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.db.arango import get_db
+from app.db.session import get_session
+from app.orm.models import AssetsInventory, DriftFinding, DriftSummary
+from app.services.drift_engine import DriftEngine
+
+logger = logging.getLogger(__name__)
+
+SEVERITY_RANK = {"High": 0, "Medium": 1, "Low": 2}
+
+
+class DriftDetectionService:
+    """Drift-detection stage run after materialization.
+
+    Compares every asset's current `fix` document against its earliest `fix_node_history`
+    entry and replaces the account's rows in `drift_findings` / `drift_summaries`, so the drift
+    overview is a plain indexed read instead of a diff per request.
+    """
+
+    def refresh_account(self, account_id: UUID) -> Dict[str, int]:
+        # Import here to avoid circular imports
+        from app.controllers.drift import (
+            compare_documents,
+            determine_severity,
+            generate_current_config,
+            generate_expected_config,
+            generate_impact_assessment,
+            generate_issue_description,
+        )
+
+        counts = {"total": 0, "drifting": 0, "High": 0, "Medium": 0, "Low": 0}
+        db = get_db()
+        if db is None:
+            logger.info("Arango not configured; skipping drift detection")
+            return counts
+
+        session: Session = get_session()
+        try:
+            assets = session.query(AssetsInventory).filter(AssetsInventory.account_id == account_id).all()
+            counts["total"] = len(assets)
+            pairs = DriftEngine(db).load_pairs([a.arango_id for a in assets])
+
+            detected_at = datetime.now(timezone.utc)
+            rows: List[Dict[str, Any]] = []
+            for asset, pair in zip(assets, pairs):
+                if pair is None:
+                    continue
+                current_doc, historical_doc = pair
+                try:
+                    drift_changes = compare_documents(current_doc, historical_doc)
+                    if not drift_changes:
+                        continue
+                    severity = determine_severity(drift_changes, asset.kind)
+                    rows.append({
+                        "account_id": account_id,
+                        "asset_id": asset.id,
+                        "resource_id": asset.resource_id,
+                        "resource_name": asset.name or asset.resource_id,
+                        "service": asset.service.upper() if asset.service else "UNKNOWN",
+                        "region": asset.region or "unknown",
+                        "provider": asset.provider.upper() if asset.provider else "UNKNOWN",
+                        "severity": severity,
+                        "severity_rank": SEVERITY_RANK.get(severity, 2),
+                        "issue": generate_issue_description(drift_changes),
+                        "expected_config": generate_expected_config(historical_doc, drift_changes),
+                        "current_config": generate_current_config(current_doc, drift_changes),
+                        "impact": generate_impact_assessment(drift_changes, severity),
+                        "tags": asset.tags or {},
+                        "drift_changes": drift_changes,
+                        "detected_at": detected_at,
+                    })
+                    counts[severity] = counts.get(severity, 0) + 1
+                except Exception as e:
+                    logger.warning(f"Failed to process drift for asset {asset.id}: {e}")
+            counts["drifting"] = len(rows)
+
+            # Replace the account's findings and summary in one transaction
+            session.execute(delete(DriftFinding).where(DriftFinding.account_id == account_id))
+            if rows:
+                session.execute(insert(DriftFinding), rows)
+            summary = {
+                "total_resources": counts["total"],
+                "drifting_resources": counts["drifting"],
+                "critical_drift": counts["High"],
+                "medium_drift": counts["Medium"],
+                "low_drift": counts["Low"],
+                "computed_at": detected_at,
+            }
+            session.execute(
+                pg_insert(DriftSummary)
+                .values(account_id=account_id, **summary)
+                .on_conflict_do_update(index_elements=[DriftSummary.account_id], set_=summary)
+            )
+            session.commit()
+            logger.info(f"Drift detection for account {account_id}: {counts}")
+            return counts
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
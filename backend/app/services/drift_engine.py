@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# (current fix document, earliest fix_node_history document) for one asset
+DocPair = Tuple[Dict[str, Any], Dict[str, Any]]
+
+
+class DriftEngine:
+    """Batched loader for drift comparisons.
+
+    Instead of one `fix` get plus one `fix_node_history` query per asset, keys are split into
+    chunks; each chunk costs one `get_many` and one COLLECT query returning the earliest history
+    entry per key. Chunks are fetched concurrently on a small thread pool.
+    """
+
+    def __init__(self, db, chunk_size: Optional[int] = None, workers: Optional[int] = None) -> None:
+        self.db = db
+        self.chunk_size = max(1, chunk_size or settings.drift_chunk_size)
+        self.workers = max(1, workers or settings.drift_workers)
+        self.fix_collection = settings.arango_fix_collection
+        self.history_collection = settings.arango_fix_history_collection or "fix_node_history"
+
+    @staticmethod
+    def _key(arango_id: str) -> str:
+        return arango_id.split('/')[-1]
+
+    def _earliest_history(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        aql = f"""
+        FOR doc IN {self.history_collection}
+          FILTER doc._key IN @keys
+          COLLECT k = doc._key INTO grp = doc
+          RETURN {{
+            key: k,
+            doc: FIRST(FOR d IN grp SORT d.created ASC LIMIT 1 RETURN d)
+          }}
+        """
+        cursor = self.db.aql.execute(aql, bind_vars={"keys": keys}, batch_size=len(keys))
+        return {row["key"]: row["doc"] for row in cursor if row.get("doc")}
+
+    def _load_chunk(self, keys: List[str]) -> Dict[str, DocPair]:
+        current = {
+            doc["_key"]: doc
+            for doc in self.db.collection(self.fix_collection).get_many(keys)
+            if doc
+        }
+        if not current:
+            return {}
+        history = self._earliest_history(list(current.keys()))
+        return {k: (current[k], history[k]) for k in current if k in history}
+
+    def load_pairs(self, arango_ids: Sequence[Optional[str]]) -> List[Optional[DocPair]]:
+        """Return (current, historical) documents aligned with `arango_ids`.
+
+        Entries are None where the asset has no current document or no history, matching the
+        assets the per-asset loop used to skip.
+        """
+        keys = list(dict.fromkeys(self._key(a) for a in arango_ids if a))
+        chunks = [keys[i:i + self.chunk_size] for i in range(0, len(keys), self.chunk_size)]
+
+        pairs: Dict[str, DocPair] = {}
+        if len(chunks) <= 1 or self.workers == 1:
+            for chunk in chunks:
+                pairs.update(self._load_chunk(chunk))
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(chunks))) as pool:
+                for loaded in pool.map(self._load_chunk, chunks):
+                    pairs.update(loaded)
+
+        logger.info(f"Drift engine loaded {len(pairs)}/{len(keys)} document pairs in {len(chunks)} chunks")
+        return [pairs.get(self._key(a)) if a else None for a in arango_ids]
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from datetime import datetime, timezone
 
 from app.core.config import settings
 from app.db.arango import get_db, has_collection
+from app.db.session import get_session
+from app.services import structural_diff
+from app.services.scan_scheduler_service import upcoming_scan
 
 
 def _first_non_empty(*vals):
@@ -14,6 +17,17 @@ def _first_non_empty(*vals):
     return None
 
 
+def _next_scan() -> Optional[str]:
+    session = get_session()
+    try:
+        next_scan = upcoming_scan(session)
+        return next_scan.isoformat() if next_scan else None
+    except Exception:
+        return None
+    finally:
+        session.close()
+
+
 class DriftService:
     def overview(self, limit: int = 200) -> Dict[str, Any]:
         db = get_db()
@@ -26,7 +40,7 @@ class DriftService:
                     "mediumDrift": 0,
                     "lowDrift": 0,
                     "lastScan": datetime.now(timezone.utc).isoformat(),
-                    "nextScan": None,
+                    "nextScan": _next_scan(),
                 },
                 "items": [],
             }
@@ -78,18 +92,6 @@ class DriftService:
         items: List[Dict[str, Any]] = []
         crit = med = low = 0
 
-        def flat(d: Dict[str, Any], prefix: str = "", depth: int = 0) -> Dict[str, Any]:
-            out: Dict[str, Any] = {}
-            if not isinstance(d, dict):
-                return out
-            for k, v in d.items():
-                key = f"{prefix}.{k}" if prefix else k
-                if isinstance(v, dict) and depth < 1:  # limit depth to 2 levels
-                    out.update(flat(v, key, depth + 1))
-                else:
-                    out[key] = v
-            return out
-
         critical_keys = {
             "security_groups",
             "public_ip_address",
@@ -105,21 +107,15 @@ class DriftService:
             old = r.get("earliest") or {}
             if not old:
                 continue
-            fcur = flat(cur)
-            fold = flat(old)
-            keys = set(fcur.keys()) | set(fold.keys())
             changes = []
-            for k in keys:
-                ov = fold.get(k)
-                nv = fcur.get(k)
-                if ov != nv:
-                    # stringify small values
-                    def s(x):
-                        if isinstance(x, (str, int, float, bool)) or x is None:
-                            return str(x)
-                        return "…"
-
-                    changes.append({"path": k, "from": s(ov), "to": s(nv)})
+            for entry in structural_diff.diff(old, cur):
+                # stringify small values
+                def s(x):
+                    if isinstance(x, (str, int, float, bool)) or x is None:
+                        return str(x)
+                    return "…"
+
+                changes.append({"path": structural_diff.pointer_to_field(entry["path"]), "from": s(entry["old"]), "to": s(entry["new"])})
 
             if not changes:
                 continue
@@ -161,7 +157,7 @@ class DriftService:
             "mediumDrift": med,
             "lowDrift": low,
             "lastScan": datetime.now(timezone.utc).isoformat(),
-            "nextScan": None,
+            "nextScan": _next_scan(),
         }
 
         return {"summary": summary, "items": items}
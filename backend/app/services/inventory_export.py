@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+import logging
+from typing import Any, Dict, Iterator, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.session import get_session
+from app.orm.models import AssetsInventory
+from app.services.account_service import resolve_account_id
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # parquet export is optional
+    pa = None
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+EXPORT_COLUMNS = [
+    "id", "account_id", "provider", "service", "kind", "resource_id",
+    "name", "type", "status", "region", "last_backup", "tags",
+]
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+def export_supported(fmt: str) -> bool:
+    return fmt in MEDIA_TYPES and (fmt != "parquet" or pa is not None)
+
+
+class _ChunkSink:
+    """Write-only file object that hands out what was written since the last drain."""
+
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        out = b"".join(self._chunks)
+        self._chunks.clear()
+        return out
+
+
+class InventoryExporter:
+    """Streams assets_inventory rows as NDJSON, CSV or Parquet over a server-side cursor.
+
+    Rows are pulled `batch_size` at a time (`yield_per`), so memory stays flat and the first
+    bytes go out as soon as the first batch is read.
+    """
+
+    def __init__(self, batch_size: Optional[int] = None) -> None:
+        self.batch_size = max(1, batch_size or settings.export_batch_size)
+
+    def _batches(self, account_identifier: Optional[str]) -> Iterator[List[Dict[str, Any]]]:
+        session: Session = get_session()
+        try:
+            query = select(*[getattr(AssetsInventory, c) for c in EXPORT_COLUMNS]).order_by(AssetsInventory.id)
+            if account_identifier:
+                acct_id = resolve_account_id(session, account_identifier)
+                if acct_id is None:
+                    return
+                query = query.where(AssetsInventory.account_id == acct_id)
+            result = session.execute(query.execution_options(yield_per=self.batch_size))
+            for partition in result.partitions():
+                yield [self._row(r) for r in partition]
+        finally:
+            session.close()
+
+    @staticmethod
+    def _row(r) -> Dict[str, Any]:
+        return {
+            "id": str(r.id),
+            "account_id": str(r.account_id),
+            "provider": r.provider,
+            "service": r.service,
+            "kind": r.kind,
+            "resource_id": r.resource_id,
+            "name": r.name,
+            "type": r.type,
+            "status": r.status,
+            "region": r.region,
+            "last_backup": r.last_backup.isoformat() if r.last_backup else None,
+            "tags": r.tags or {},
+        }
+
+    def stream(self, fmt: str, account_identifier: Optional[str] = None) -> Iterator[bytes]:
+        batches = self._batches(account_identifier)
+        if fmt == "ndjson":
+            return self._ndjson(batches)
+        if fmt == "csv":
+            return self._csv(batches)
+        if fmt == "parquet":
+            return self._parquet(batches)
+        raise ValueError(f"Unsupported export format: {fmt}")
+
+    @staticmethod
+    def _ndjson(batches: Iterator[List[Dict[str, Any]]]) -> Iterator[bytes]:
+        for batch in batches:
+            yield "".join(json.dumps(row, default=str) + "\n" for row in batch).encode("utf-8")
+
+    @staticmethod
+    def _csv(batches: Iterator[List[Dict[str, Any]]]) -> Iterator[bytes]:
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        writer.writerow(EXPORT_COLUMNS)
+        yield buf.getvalue().encode("utf-8")
+        for batch in batches:
+            buf.seek(0)
+            buf.truncate()
+            for row in batch:
+                row = dict(row, tags=json.dumps(row["tags"], default=str))
+                writer.writerow([row[c] for c in EXPORT_COLUMNS])
+            yield buf.getvalue().encode("utf-8")
+
+    @staticmethod
+    def _parquet(batches: Iterator[List[Dict[str, Any]]]) -> Iterator[bytes]:
+        # One row group per batch; tags are stored as JSON text
+        schema = pa.schema([(c, pa.string()) for c in EXPORT_COLUMNS])
+        sink = _ChunkSink()
+        writer = pq.ParquetWriter(sink, schema)
+        try:
+            for batch in batches:
+                columns = {c: [row[c] for row in batch] for c in EXPORT_COLUMNS}
+                columns["tags"] = [json.dumps(t, default=str) for t in columns["tags"]]
+                writer.write_table(pa.table(columns, schema=schema))
+                yield sink.drain()
+        finally:
+            writer.close()
+        yield sink.drain()
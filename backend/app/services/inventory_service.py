@@ -1,14 +1,25 @@
 from __future__ import annotations
 
-from typing import List
-from datetime import datetime
+import base64
+import hashlib
+import json
+import time
+import uuid
+from collections import Counter
+from itertools import islice
+from typing import Callable, List, Optional
+from datetime import datetime, timezone
 
 from app.core.config import settings
 from app.db.arango import get_db, has_collection
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, func, text, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 from app.db.session import get_session
 from app.orm.models import AssetsInventory, CloudAccount
+from app.services.account_service import resolve_account_id
+from app.services.coverage_rollup_service import CoverageRollupService
+from app.services.protection_index_service import ProtectionIndexService
 from dateutil import parser as dateparser
 from app.models.inventory import (
     InventoryItem,
@@ -177,6 +188,7 @@ class InventoryService:
     def __init__(self) -> None:
         self.collection = settings.arango_inventory_collection
         self.fix_collection = settings.arango_fix_collection
+        self.protection_index = settings.arango_protection_index_collection
 
     @staticmethod
     def extract_service_name(kind: str) -> str:
@@ -198,7 +210,386 @@ class InventoryService:
                 resource_id and 
                 resource_id not in INVALID_RESOURCE_IDS)
 
-    def materialize_assets_from_fix(self, account_identifier: str | None = None) -> dict:
+    def _build_asset_row(self, r: dict, account_id) -> dict:
+        """Map one materialization AQL row onto `assets_inventory` column values."""
+        kind = str(r.get("kind", "unknown"))
+        rid = str(r.get("resourceId", ""))
+        provider = str(r.get("provider", "aws"))
+        svc = str(r.get("service", "unknown")).strip()
+
+        # Ensure service is not empty, use helper function as fallback
+        if not svc or svc == "unknown":
+            svc = self.extract_service_name(kind)
+
+        type_label = kind
+        if kind.startswith("aws_") or kind.startswith("gcp_"):
+            rest = kind[4:]
+            if "_" in rest:
+                _, type_part = rest.split("_", 1)
+                type_label = f"{svc.upper()} " + type_part.replace("_", " ").title()
+            else:
+                type_label = f"{svc.upper()} {rest.replace('_', ' ').title()}"
+
+        last_backup_raw = r.get("last_backup")
+        last_backup_dt = None
+        if last_backup_raw:
+            try:
+                last_backup_dt = dateparser.parse(str(last_backup_raw))
+            except Exception:
+                last_backup_dt = None
+
+        return {
+            "account_id": account_id,
+            "provider": provider,
+            "service": svc,
+            "kind": kind,
+            "resource_id": rid,
+            "name": r.get("name") or rid,
+            "type": type_label,
+            "status": str(r.get("status", "unprotected")),
+            "region": r.get("region"),
+            "last_backup": last_backup_dt,
+            "tags": r.get("tags") or {},
+            "arango_id": r.get("sourceId"),
+            "source_hash": self._source_hash(r),
+        }
+
+    @staticmethod
+    def _source_hash(r: dict) -> str:
+        """Stable digest of an AQL row; changes when the source revision or any derived value does."""
+        payload = json.dumps(r, sort_keys=True, default=str, separators=(",", ":"))
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _load_existing_hashes(session: Session, account_id, resource_ids: List[str]) -> dict:
+        rows = session.execute(
+            select(
+                AssetsInventory.service,
+                AssetsInventory.kind,
+                AssetsInventory.resource_id,
+                AssetsInventory.source_hash,
+            ).where(
+                AssetsInventory.account_id == account_id,
+                AssetsInventory.resource_id.in_(resource_ids),
+            )
+        ).all()
+        return {(r.service, r.kind, r.resource_id): r.source_hash for r in rows}
+
+    @staticmethod
+    def _upsert_asset_batch(session: Session, rows: List[dict]) -> int:
+        """Bulk upsert rows into `assets_inventory` with a single INSERT ... ON CONFLICT statement."""
+        if not rows:
+            return 0
+        stmt = pg_insert(AssetsInventory).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_assets_inventory_asset",
+            set_={
+                "provider": stmt.excluded.provider,
+                "name": stmt.excluded.name,
+                "type": stmt.excluded.type,
+                "status": stmt.excluded.status,
+                "region": stmt.excluded.region,
+                "last_backup": stmt.excluded.last_backup,
+                "tags": stmt.excluded.tags,
+                "arango_id": stmt.excluded.arango_id,
+                "source_hash": stmt.excluded.source_hash,
+                "updated_at": func.now(),
+            },
+        )
+        session.execute(stmt)
+        return len(rows)
+
+    def _materialization_aql(self) -> str:
+        """Row-per-resource AQL for materialization; consumed through a streaming cursor."""
+        # Comprehensive materialization plan for all AWS and GCP resource types
+        # - Process ALL resources from fix collection
+        # - Apply protection heuristics for known resource types
+        # - Default to unprotected for unknown types
+        # AQL-level validation is done in Python instead (array size limits).
+        return f"""
+            /* Stream ALL resources from fix collection, one row per document.
+               Snapshot protection comes from point lookups into the protection index. */
+            FOR v IN {self.fix_collection}
+              LET kinds = v.kinds || []
+              /* Find the most specific kind (aws_* or gcp_* prefixed) */
+              LET primaryKind = (
+                FIRST(FOR k IN kinds 
+                  FILTER k != null AND (LIKE(k, 'aws_%', true) OR LIKE(k, 'gcp_%', true))
+                  FILTER k != 'aws_resource' AND k != 'gcp_resource'  /* Exclude generic resource types */
+                  SORT LENGTH(k) DESC
+                  RETURN k
+                ) ||
+                FIRST(FOR k IN kinds 
+                  FILTER k != null AND (LIKE(k, 'aws_%', true) OR LIKE(k, 'gcp_%', true))
+                  RETURN k
+                ) ||
+                FIRST(FOR k IN kinds FILTER k != null RETURN k)
+              )
+              FILTER primaryKind != null
+              
+              /* Determine provider and service */
+              LET isAws = LIKE(primaryKind, 'aws_%', true)
+              LET isGcp = LIKE(primaryKind, 'gcp_%', true)
+              LET provider = isAws ? 'aws' : (isGcp ? 'gcp' : 'unknown')
+              
+              /* Extract service name from kind */
+              LET pos = FIND_FIRST(primaryKind, '_', 4)
+              LET extracted = pos != null && pos > 0 ? SUBSTRING(primaryKind, 4, pos - 4) : null
+              LET serviceName = (
+                isAws ? (
+                  extracted != null && LENGTH(extracted) > 0 ? extracted :
+                  primaryKind == 'aws_resource' ? 'resource' :
+                  'unknown'
+                ) :
+                isGcp ? (
+                  extracted != null && LENGTH(extracted) > 0 ? extracted :
+                  primaryKind == 'gcp_resource' ? 'resource' :
+                  'unknown'
+                ) :
+                'unknown'
+              )
+              
+              /* Extract resource ID and name */
+              LET resourceId = (
+                v.reported.id || 
+                v.reported.arn || 
+                v.reported.name || 
+                v.reported.bucket || 
+                v.reported.db_instance_identifier ||
+                v.reported.instance_id ||
+                CONCAT(primaryKind, '_', TO_STRING(v._key))
+              )
+              
+              /* Basic filtering - detailed validation done in Python */
+              FILTER resourceId != null AND resourceId != ''
+              LET resourceName = (
+                v.reported.name || 
+                (v.reported.tags && v.reported.tags.Name) || 
+                v.reported.bucket || 
+                v.reported.db_instance_identifier ||
+                v.reported.instance_id ||
+                resourceId
+              )
+              
+              /* Extract region */
+              LET region = (
+                v.reported.region || 
+                (v.reported.availability_zone ? SUBSTRING(v.reported.availability_zone, 0, LENGTH(v.reported.availability_zone) - 1) : null) ||
+                (v.reported.location || null)
+              )
+              
+              /* Determine protection status based on resource type */
+              LET protectionStatus = (
+                /* EBS Volume protection via snapshots */
+                primaryKind == 'aws_ec2_volume' ? (
+                  LET snap = DOCUMENT('{self.protection_index}', resourceId)
+                  RETURN snap && snap.count > 0 ? 'protected' : 'unprotected'
+                ) :
+                
+                /* EC2 Instance protection via attached volume snapshots */
+                primaryKind == 'aws_ec2_instance' ? (
+                  LET hasProtectedVolumes = LENGTH(
+                    FOR att IN (v.reported.volume_attachments || [])
+                      LET snap = DOCUMENT('{self.protection_index}', att.volume_id)
+                      FILTER snap && snap.count > 0
+                      RETURN 1
+                  ) > 0
+                  RETURN hasProtectedVolumes ? 'protected' : 'unprotected'
+                ) :
+                
+                /* S3 Bucket protection via versioning/replication */
+                primaryKind == 'aws_s3_bucket' ? (
+                  LET versioning = v.reported.versioning && (v.reported.versioning.status || v.reported.versioning.Status)
+                  LET hasVersioning = versioning == 'Enabled' || versioning == true
+                  LET hasReplication = v.reported.replication_configuration != null
+                  RETURN (hasVersioning || hasReplication) ? 'protected' : 'unprotected'
+                ) :
+                
+                /* RDS Instance protection via backup retention */
+                primaryKind == 'aws_rds_db_instance' ? (
+                  LET retention = TO_NUMBER(v.reported.backup_retention_period)
+                  RETURN (retention != null && retention > 0) ? 'protected' : 'unprotected'
+                ) :
+                
+                /* GCP Disk protection via snapshots */
+                primaryKind == 'gcp_disk' ? (
+                  LET hasSnapshots = v.reported.snapshots && LENGTH(v.reported.snapshots) > 0
+                  RETURN hasSnapshots ? 'protected' : 'unprotected'
+                ) :
+                
+                /* GCP Instance protection via disk snapshots */
+                primaryKind == 'gcp_instance' ? (
+                  LET hasProtectedDisks = LENGTH(
+                    FOR disk IN (v.reported.disks || [])
+                      FILTER disk.snapshots && LENGTH(disk.snapshots) > 0
+                      RETURN 1
+                  ) > 0
+                  RETURN hasProtectedDisks ? 'protected' : 'unprotected'
+                ) :
+                
+                /* GCP Storage Bucket protection via versioning */
+                primaryKind == 'gcp_storage_bucket' ? (
+                  LET hasVersioning = v.reported.versioning && (v.reported.versioning.enabled || v.reported.versioning.Enabled)
+                  LET hasReplication = v.reported.replication && (v.reported.replication.enabled || v.reported.replication.Enabled)
+                  RETURN (hasVersioning || hasReplication) ? 'protected' : 'unprotected'
+                ) :
+                
+                /* GCP SQL Database Instance protection via backups */
+                primaryKind == 'gcp_sql_database_instance' ? (
+                  LET hasBackups = v.reported.backup_enabled || v.reported.backupConfiguration && v.reported.backupConfiguration.enabled
+                  RETURN hasBackups ? 'protected' : 'unprotected'
+                ) :
+                
+                /* GCP Filestore Instance protection via snapshots */
+                primaryKind == 'gcp_filestore_instance' ? (
+                  LET hasSnapshots = v.reported.snapshots && LENGTH(v.reported.snapshots) > 0
+                  RETURN hasSnapshots ? 'protected' : 'unprotected'
+                ) :
+                
+                /* GCP Container Cluster protection via backup policies */
+                primaryKind == 'gcp_container_cluster' ? (
+                  LET hasBackupPolicy = v.reported.backup_policy && v.reported.backup_policy.enabled
+                  RETURN hasBackupPolicy ? 'protected' : 'unprotected'
+                ) :
+                
+                /* GCP Snapshot protection (always protected) */
+                primaryKind == 'gcp_snapshot' ? 'protected' :
+                
+                /* GCP SQL Backup Run protection (always protected) */
+                primaryKind == 'gcp_sql_backup_run' ? 'protected' :
+                
+                /* Default to unprotected for other resource types */
+                'unprotected'
+              )
+              
+              /* Get last backup time if available */
+              LET lastBackup = (
+                primaryKind == 'aws_ec2_volume' ? (
+                  LET snap = DOCUMENT('{self.protection_index}', resourceId)
+                  RETURN snap ? snap.last : null
+                ) :
+                primaryKind == 'aws_ec2_instance' ? (
+                  LET lastBackups = (
+                    FOR att IN (v.reported.volume_attachments || [])
+                      LET snap = DOCUMENT('{self.protection_index}', att.volume_id)
+                      FILTER snap && snap.last
+                      RETURN snap.last
+                  )
+                  RETURN LENGTH(lastBackups) > 0 ? MAX(lastBackups) : null
+                ) :
+                primaryKind == 'gcp_disk' ? (
+                  LET snapshots = v.reported.snapshots || []
+                  LET lastSnapshots = (
+                    FOR snap IN snapshots
+                      FILTER snap.created_at
+                      RETURN snap.created_at
+                  )
+                  RETURN LENGTH(lastSnapshots) > 0 ? MAX(lastSnapshots) : null
+                ) :
+                primaryKind == 'gcp_instance' ? (
+                  LET lastSnapshots = (
+                    FOR disk IN (v.reported.disks || [])
+                      FOR snap IN (disk.snapshots || [])
+                        FILTER snap.created_at
+                        RETURN snap.created_at
+                  )
+                  RETURN LENGTH(lastSnapshots) > 0 ? MAX(lastSnapshots) : null
+                ) :
+                primaryKind == 'gcp_sql_database_instance' ? (
+                  v.reported.last_backup_time || v.reported.backupConfiguration && v.reported.backupConfiguration.startTime
+                ) :
+                primaryKind == 'gcp_snapshot' ? (
+                  v.reported.created_at || v.reported.creation_timestamp
+                ) :
+                primaryKind == 'gcp_sql_backup_run' ? (
+                  v.reported.start_time || v.reported.enqueued_time
+                ) :
+                null
+              )
+              
+              RETURN {{
+                provider: provider,
+                service: serviceName,
+                kind: primaryKind,
+                resourceId: resourceId,
+                name: resourceName,
+                region: region,
+                status: protectionStatus,
+                last_backup: lastBackup,
+                sourceId: TO_STRING(v._id),
+                sourceRev: v.hash || v._rev,
+                tags: v.reported.tags || {{}}
+              }}
+            """
+
+    def _stream_rows(self, db, batch_size: int):
+        """Yield lists of at most `batch_size` AQL rows as the server-side cursor delivers them."""
+        cursor = db.aql.execute(
+            self._materialization_aql(),
+            batch_size=batch_size,
+            stream=True,
+            count=False,
+            ttl=settings.materialize_cursor_ttl,
+        )
+        while True:
+            chunk = list(islice(cursor, batch_size))
+            if not chunk:
+                break
+            yield chunk
+
+    def _candidate_count(self, db) -> int:
+        """Documents the materialization cursor will read (denominator for progress reporting)."""
+        try:
+            return int(db.collection(self.fix_collection).count())
+        except Exception:
+            return 0
+
+    @staticmethod
+    def _mark_seen(session: Session, keys: List[tuple]) -> List[tuple]:
+        """Record `keys` in materialize_seen; returns those not seen earlier in this run."""
+        if not keys:
+            return []
+        services, kinds, resource_ids = (list(col) for col in zip(*keys))
+        rows = session.execute(
+            text(
+                "INSERT INTO materialize_seen (service, kind, resource_id)"
+                " SELECT * FROM unnest(CAST(:services AS text[]), CAST(:kinds AS text[]), CAST(:resource_ids AS text[]))"
+                " ON CONFLICT DO NOTHING RETURNING service, kind, resource_id"
+            ),
+            {"services": services, "kinds": kinds, "resource_ids": resource_ids},
+        ).all()
+        return [tuple(r) for r in rows]
+
+    def _write_batch(self, session: Session, assets: List[dict], account_id, incremental: bool) -> dict:
+        """Diff one batch against stored hashes (incremental) and bulk upsert what changed."""
+        stats = {"inserted": 0, "updated": 0, "unchanged": 0, "written": 0}
+        if incremental:
+            existing = self._load_existing_hashes(session, account_id, [a["resource_id"] for a in assets])
+        else:
+            existing = {}
+
+        changed = []
+        for a in assets:
+            prev = existing.get((a["service"], a["kind"], a["resource_id"]))
+            if prev is None:
+                stats["inserted"] += 1
+            elif prev == a["source_hash"]:
+                stats["unchanged"] += 1
+                continue
+            else:
+                stats["updated"] += 1
+            changed.append(a)
+
+        stats["written"] = self._upsert_asset_batch(session, changed)
+        return stats
+
+    def materialize_assets_from_fix(
+        self,
+        account_identifier: str | None = None,
+        batch_size: int | None = None,
+        incremental: bool | None = None,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> dict:
         """Scan the `fix` inventory and upsert selected priority assets into Postgres `assets_inventory`.
 
         - Includes only SELECTED resource types (instances, volumes, storage, RDS, S3, Kubernetes, Lambda, etc.).
@@ -206,479 +597,267 @@ class InventoryService:
           S3 versioning/replication, RDS retention). Other types default to "unprotected" until rules are added.
         - Persists each asset with an `account_id` field so that per-account views and rescans are supported.
 
-        Returns aggregate totals: { total, protected, unprotected } for the provided account if specified,
-        otherwise for the whole dataset.
+        - Rows stream from a batched AQL cursor (`stream=True`); each batch of `batch_size` rows (default
+          `settings.materialize_batch_size`) is validated and written with
+          `INSERT ... ON CONFLICT (account_id, service, kind, resource_id) DO UPDATE` before the next one is
+          fetched, so memory stays bounded by the batch size rather than the account size.
+        - In incremental mode (default `settings.materialize_incremental`) each row carries a
+          `source_hash` of its materialized values and the source document revision; rows whose hash
+          is unchanged are not written, and rows whose source disappeared are deleted. Full mode
+          deletes the account's rows and rebuilds them.
+        - `progress(rows_processed, rows_total)` is called after every batch; the total is the size of
+          the `fix` collection, since every document is a candidate row.
+
+        Returns aggregate totals: { total, protected, unprotected } for the provided account,
+        plus write statistics ({ mode, inserted, updated, unchanged, deleted, batches, elapsed_seconds,
+        rows_per_second }).
         """
         import logging
         logger = logging.getLogger(__name__)
-        
+
+        batch_size = max(1, int(batch_size or settings.materialize_batch_size))
+        if incremental is None:
+            incremental = settings.materialize_incremental
+        empty = {"total": 0, "protected": 0, "unprotected": 0}
+
         logger.info(f"Starting materialization for account: {account_identifier}")
-        
+
         db = get_db()
         if db is None:
             logger.warning("No ArangoDB connection available")
-            return {"total": 0, "protected": 0, "unprotected": 0}
-        
+            return empty
+
         logger.info(f"ArangoDB connected, using collections: {self.fix_collection}")
-        
+
+        session: Session = get_session()
         try:
-            # Comprehensive materialization plan for all AWS and GCP resource types
-            # - Process ALL resources from fix collection
-            # - Apply protection heuristics for known resource types
-            # - Default to unprotected for unknown types
-
-            # Note: AQL-level validation removed due to array size limits
-            # Validation will be done in Python instead
-            
-            aql = f"""
-            /* 1) Snapshot aggregation by EBS volume for protection analysis */
-            LET snapAgg = (
-              FOR s IN {self.fix_collection}
-                FILTER 'aws_ec2_snapshot' IN s.kinds
-                COLLECT volId = s.reported.volume_id INTO grp
-                LET times = (FOR g IN grp RETURN g.s.reported.created_at)
-                RETURN {{ volId, count: LENGTH(grp), last: MAX(times) }}
-            )
-            LET snapByVol = MERGE(FOR x IN snapAgg RETURN {{ [x.volId]: {{ count: x.count, last: x.last }} }})
-
-            /* 2) Process ALL resources from fix collection */
-            LET allResources = (
-              FOR v IN {self.fix_collection}
-                LET kinds = v.kinds || []
-                /* Find the most specific kind (aws_* or gcp_* prefixed) */
-                LET primaryKind = (
-                  FIRST(FOR k IN kinds 
-                    FILTER k != null AND (LIKE(k, 'aws_%', true) OR LIKE(k, 'gcp_%', true))
-                    FILTER k != 'aws_resource' AND k != 'gcp_resource'  /* Exclude generic resource types */
-                    SORT LENGTH(k) DESC
-                    RETURN k
-                  ) ||
-                  FIRST(FOR k IN kinds 
-                    FILTER k != null AND (LIKE(k, 'aws_%', true) OR LIKE(k, 'gcp_%', true))
-                    RETURN k
-                  ) ||
-                  FIRST(FOR k IN kinds FILTER k != null RETURN k)
-                )
-                FILTER primaryKind != null
-                
-                /* Determine provider and service */
-                LET isAws = LIKE(primaryKind, 'aws_%', true)
-                LET isGcp = LIKE(primaryKind, 'gcp_%', true)
-                LET provider = isAws ? 'aws' : (isGcp ? 'gcp' : 'unknown')
-                
-                /* Extract service name from kind */
-                LET pos = FIND_FIRST(primaryKind, '_', 4)
-                LET extracted = pos != null && pos > 0 ? SUBSTRING(primaryKind, 4, pos - 4) : null
-                LET serviceName = (
-                  isAws ? (
-                    extracted != null && LENGTH(extracted) > 0 ? extracted :
-                    primaryKind == 'aws_resource' ? 'resource' :
-                    'unknown'
-                  ) :
-                  isGcp ? (
-                    extracted != null && LENGTH(extracted) > 0 ? extracted :
-                    primaryKind == 'gcp_resource' ? 'resource' :
-                    'unknown'
-                  ) :
-                  'unknown'
-                )
-                
-                /* Extract resource ID and name */
-                LET resourceId = (
-                  v.reported.id || 
-                  v.reported.arn || 
-                  v.reported.name || 
-                  v.reported.bucket || 
-                  v.reported.db_instance_identifier ||
-                  v.reported.instance_id ||
-                  CONCAT(primaryKind, '_', TO_STRING(v._key))
-                )
-                
-                /* Basic filtering - detailed validation done in Python */
-                FILTER resourceId != null AND resourceId != ''
-                LET resourceName = (
-                  v.reported.name || 
-                  (v.reported.tags && v.reported.tags.Name) || 
-                  v.reported.bucket || 
-                  v.reported.db_instance_identifier ||
-                  v.reported.instance_id ||
-                  resourceId
-                )
-                
-                /* Extract region */
-                LET region = (
-                  v.reported.region || 
-                  (v.reported.availability_zone ? SUBSTRING(v.reported.availability_zone, 0, LENGTH(v.reported.availability_zone) - 1) : null) ||
-                  (v.reported.location || null)
-                )
-                
-                /* Determine protection status based on resource type */
-                LET protectionStatus = (
-                  /* EBS Volume protection via snapshots */
-                  primaryKind == 'aws_ec2_volume' ? (
-                    LET snap = snapByVol[resourceId]
-                    RETURN snap && snap.count > 0 ? 'protected' : 'unprotected'
-                  ) :
-                  
-                  /* EC2 Instance protection via attached volume snapshots */
-                  primaryKind == 'aws_ec2_instance' ? (
-                    LET hasProtectedVolumes = LENGTH(
-                      FOR att IN (v.reported.volume_attachments || [])
-                        LET snap = snapByVol[att.volume_id]
-                        FILTER snap && snap.count > 0
-                        RETURN 1
-                    ) > 0
-                    RETURN hasProtectedVolumes ? 'protected' : 'unprotected'
-                  ) :
-                  
-                  /* S3 Bucket protection via versioning/replication */
-                  primaryKind == 'aws_s3_bucket' ? (
-                    LET versioning = v.reported.versioning && (v.reported.versioning.status || v.reported.versioning.Status)
-                    LET hasVersioning = versioning == 'Enabled' || versioning == true
-                    LET hasReplication = v.reported.replication_configuration != null
-                    RETURN (hasVersioning || hasReplication) ? 'protected' : 'unprotected'
-                  ) :
-                  
-                  /* RDS Instance protection via backup retention */
-                  primaryKind == 'aws_rds_db_instance' ? (
-                    LET retention = TO_NUMBER(v.reported.backup_retention_period)
-                    RETURN (retention != null && retention > 0) ? 'protected' : 'unprotected'
-                  ) :
-                  
-                  /* GCP Disk protection via snapshots */
-                  primaryKind == 'gcp_disk' ? (
-                    LET hasSnapshots = v.reported.snapshots && LENGTH(v.reported.snapshots) > 0
-                    RETURN hasSnapshots ? 'protected' : 'unprotected'
-                  ) :
-                  
-                  /* GCP Instance protection via disk snapshots */
-                  primaryKind == 'gcp_instance' ? (
-                    LET hasProtectedDisks = LENGTH(
-                      FOR disk IN (v.reported.disks || [])
-                        FILTER disk.snapshots && LENGTH(disk.snapshots) > 0
-                        RETURN 1
-                    ) > 0
-                    RETURN hasProtectedDisks ? 'protected' : 'unprotected'
-                  ) :
-                  
-                  /* GCP Storage Bucket protection via versioning */
-                  primaryKind == 'gcp_storage_bucket' ? (
-                    LET hasVersioning = v.reported.versioning && (v.reported.versioning.enabled || v.reported.versioning.Enabled)
-                    LET hasReplication = v.reported.replication && (v.reported.replication.enabled || v.reported.replication.Enabled)
-                    RETURN (hasVersioning || hasReplication) ? 'protected' : 'unprotected'
-                  ) :
-                  
-                  /* GCP SQL Database Instance protection via backups */
-                  primaryKind == 'gcp_sql_database_instance' ? (
-                    LET hasBackups = v.reported.backup_enabled || v.reported.backupConfiguration && v.reported.backupConfiguration.enabled
-                    RETURN hasBackups ? 'protected' : 'unprotected'
-                  ) :
-                  
-                  /* GCP Filestore Instance protection via snapshots */
-                  primaryKind == 'gcp_filestore_instance' ? (
-                    LET hasSnapshots = v.reported.snapshots && LENGTH(v.reported.snapshots) > 0
-                    RETURN hasSnapshots ? 'protected' : 'unprotected'
-                  ) :
-                  
-                  /* GCP Container Cluster protection via backup policies */
-                  primaryKind == 'gcp_container_cluster' ? (
-                    LET hasBackupPolicy = v.reported.backup_policy && v.reported.backup_policy.enabled
-                    RETURN hasBackupPolicy ? 'protected' : 'unprotected'
-                  ) :
-                  
-                  /* GCP Snapshot protection (always protected) */
-                  primaryKind == 'gcp_snapshot' ? 'protected' :
-                  
-                  /* GCP SQL Backup Run protection (always protected) */
-                  primaryKind == 'gcp_sql_backup_run' ? 'protected' :
-                  
-                  /* Default to unprotected for other resource types */
-                  'unprotected'
-                )
-                
-                /* Get last backup time if available */
-                LET lastBackup = (
-                  primaryKind == 'aws_ec2_volume' ? (
-                    LET snap = snapByVol[resourceId]
-                    RETURN snap ? snap.last : null
-                  ) :
-                  primaryKind == 'aws_ec2_instance' ? (
-                    LET lastBackups = (
-                      FOR att IN (v.reported.volume_attachments || [])
-                        LET snap = snapByVol[att.volume_id]
-                        FILTER snap && snap.last
-                        RETURN snap.last
-                    )
-                    RETURN LENGTH(lastBackups) > 0 ? MAX(lastBackups) : null
-                  ) :
-                  primaryKind == 'gcp_disk' ? (
-                    LET snapshots = v.reported.snapshots || []
-                    LET lastSnapshots = (
-                      FOR snap IN snapshots
-                        FILTER snap.created_at
-                        RETURN snap.created_at
-                    )
-                    RETURN LENGTH(lastSnapshots) > 0 ? MAX(lastSnapshots) : null
-                  ) :
-                  primaryKind == 'gcp_instance' ? (
-                    LET lastSnapshots = (
-                      FOR disk IN (v.reported.disks || [])
-                        FOR snap IN (disk.snapshots || [])
-                          FILTER snap.created_at
-                          RETURN snap.created_at
-                    )
-                    RETURN LENGTH(lastSnapshots) > 0 ? MAX(lastSnapshots) : null
-                  ) :
-                  primaryKind == 'gcp_sql_database_instance' ? (
-                    v.reported.last_backup_time || v.reported.backupConfiguration && v.reported.backupConfiguration.startTime
-                  ) :
-                  primaryKind == 'gcp_snapshot' ? (
-                    v.reported.created_at || v.reported.creation_timestamp
-                  ) :
-                  primaryKind == 'gcp_sql_backup_run' ? (
-                    v.reported.start_time || v.reported.enqueued_time
-                  ) :
-                  null
+            # Resolve account UUID (force assign all scanned resources to this account;
+            # fix does not include the account id reliably)
+            acct_id = None
+            if account_identifier:
+                acct = (
+                    session.query(CloudAccount)
+                    .filter(CloudAccount.account_identifier == account_identifier)
+                    .one_or_none()
                 )
-                
-                RETURN {{
-                  provider: provider,
-                  service: serviceName,
-                  kind: primaryKind,
-                  resourceId: resourceId,
-                  name: resourceName,
-                  region: region,
-                  status: protectionStatus,
-                  last_backup: lastBackup,
-                  sourceId: TO_STRING(v._id),
-                  tags: v.reported.tags || {{}}
-                }}
-            )
+                acct_id = acct.id if acct else None
+                logger.info(f"Account lookup for {account_identifier}: {'found' if acct_id else 'not found'}")
+            if acct_id is None:
+                # Rows we cannot associate to an account are never persisted
+                logger.warning("Skipping materialization - no account association")
+                return empty
 
-            RETURN {{
-              total: LENGTH(allResources),
-              protected: LENGTH(FOR r IN allResources FILTER r.status == 'protected' RETURN 1),
-              unprotected: LENGTH(FOR r IN allResources FILTER r.status == 'unprotected' RETURN 1),
-              table: allResources
-            }}
-            """
+            # Keys materialized during this run (dedupe across batches, and the incremental delete
+            # sweep); temp table, dropped automatically on commit, so process memory stays flat
+            session.execute(text(
+                "CREATE TEMP TABLE materialize_seen (service text, kind text, resource_id text,"
+                " PRIMARY KEY (service, kind, resource_id)) ON COMMIT DROP"
+            ))
+            if not incremental:
+                logger.info(f"Cleaning existing assets for account {acct_id}")
+                session.execute(delete(AssetsInventory).where(AssetsInventory.account_id == acct_id))
 
-            logger.info("Executing AQL query...")
-            try:
-                cur = db.aql.execute(aql)
-                result = list(cur)
-                logger.info(f"AQL query executed successfully, got {len(result)} results")
-                payload = result[0] if result else {"total": 0, "protected": 0, "unprotected": 0, "table": []}
-                rows = payload.get("table", [])
-                logger.info(f"Extracted {len(rows)} rows from AQL result")
-            except Exception as e:
-                logger.error(f"Error executing AQL query: {e}")
-                import traceback
-                logger.error(f"AQL traceback: {traceback.format_exc()}")
-                raise
-            
-            logger.info(f"AQL query returned {len(rows)} resources")
-            logger.info(f"Total: {payload.get('total', 0)}, Protected: {payload.get('protected', 0)}, Unprotected: {payload.get('unprotected', 0)}")
-            
-            # Debug: Log first few resources to see what we're getting
-            if rows:
-                logger.info("Sample resources from AQL:")
-                for i, r in enumerate(rows[:5]):
-                    logger.info(f"  Resource {i+1}: service='{r.get('service', '')}', kind='{r.get('kind', '')}', resourceId='{r.get('resourceId', '')}', status='{r.get('status', '')}'")
-                
-                # Count by service and kind for statistics
-                service_counts = {}
-                kind_counts = {}
-                for r in rows:
-                    service = r.get('service', 'unknown')
-                    kind = r.get('kind', 'unknown')
-                    service_counts[service] = service_counts.get(service, 0) + 1
-                    kind_counts[kind] = kind_counts.get(kind, 0) + 1
-                
-                logger.info(f"Service distribution: {dict(sorted(service_counts.items(), key=lambda x: x[1], reverse=True)[:10])}")
-                logger.info(f"Kind distribution: {dict(sorted(kind_counts.items(), key=lambda x: x[1], reverse=True)[:10])}")
+            totals = {"total": 0, "protected": 0, "inserted": 0, "updated": 0, "unchanged": 0, "written": 0}
+            skipped_invalid = 0
+            batches = 0
+            service_counts: Counter = Counter()
+            kind_counts: Counter = Counter()
+            started = time.monotonic()
 
-            # Persist to Postgres assets_inventory
-            logger.info("Getting database session...")
-            session: Session = get_session()
-            logger.info("Database session obtained successfully")
-            try:
-                # Resolve account UUID (force assign all scanned resources to this account)
-                logger.info("Resolving account UUID...")
-                acct_id = None
-                if account_identifier:
-                    logger.info(f"Looking up account {account_identifier}...")
-                    acct = (
-                        session.query(CloudAccount)
-                        .filter(CloudAccount.account_identifier == account_identifier)
-                        .one_or_none()
-                    )
-                    acct_id = acct.id if acct else None
-                    logger.info(f"Account lookup for {account_identifier}: {'found' if acct_id else 'not found'}")
-
-                # Clean existing assets for this account (if specified)
-                if acct_id is not None:
-                    logger.info(f"Cleaning existing assets for account {acct_id}")
-                    session.execute(
-                        delete(AssetsInventory).where(AssetsInventory.account_id == acct_id)
-                    )
-                    session.commit()
+            # Volume -> snapshot lookups in the AQL read the protection index; pick up snapshots
+            # collected since the previous refresh (full rebuild alongside a full materialization).
+            ProtectionIndexService().refresh(full=not incremental)
 
-                total = 0
-                protected = 0
-                skipped_invalid = 0
-                skipped_duplicate = 0
+            rows_total = self._candidate_count(db) if progress else 0
+            rows_processed = 0
 
-                logger.info(f"Processing {len(rows)} resources...")
-                
-                for i, r in enumerate(rows):
-                    if i % 100 == 0:
-                        logger.info(f"Processed {i}/{len(rows)} resources...")
-                    
+            logger.info(f"Streaming resources in batches of {batch_size} ({'incremental' if incremental else 'full'} mode)...")
+            for chunk in self._stream_rows(db, batch_size):
+                rows_processed += len(chunk)
+                # Keyed on the uq_assets_inventory_asset columns: a single INSERT ... ON CONFLICT
+                # statement may not touch the same row twice
+                batch: dict[tuple, dict] = {}
+                for r in chunk:
                     kind = str(r.get("kind", "unknown"))
                     rid = str(r.get("resourceId", ""))
-                    provider = str(r.get("provider", "aws"))
-                    svc = str(r.get("service", "unknown")).strip()
-                    
-                    # Validate resource using helper function
                     if not self.is_valid_resource(kind, rid):
-                        logger.warning(f"Skipping invalid resource: kind='{kind}', id='{rid}'")
+                        logger.debug(f"Skipping invalid resource: kind='{kind}', id='{rid}'")
                         skipped_invalid += 1
                         continue
-                    
-                    # Ensure service is not empty, use helper function as fallback
-                    if not svc or svc == "unknown" or svc.strip() == "":
-                        svc = self.extract_service_name(kind)
-                    
-                    type_label = kind
-                    
-                    try:
-                        if kind.startswith("aws_"):
-                            rest = kind[4:]
-                            if "_" in rest:
-                                _, type_part = rest.split("_", 1)
-                                type_label = f"{svc.upper()} " + type_part.replace("_", " ").title()
-                            else:
-                                type_label = f"{svc.upper()} {rest.replace('_', ' ').title()}"
-                        elif kind.startswith("gcp_"):
-                            rest = kind[4:]
-                            if "_" in rest:
-                                _, type_part = rest.split("_", 1)
-                                type_label = f"{svc.upper()} " + type_part.replace("_", " ").title()
-                            else:
-                                type_label = f"{svc.upper()} {rest.replace('_', ' ').title()}"
-                    except Exception as e:
-                        logger.warning(f"Error processing type label for {kind}: {e}")
-                        pass
-
-                    last_backup_raw = r.get("last_backup")
-                    last_backup_dt = None
-                    if last_backup_raw:
-                        try:
-                            last_backup_dt = dateparser.parse(str(last_backup_raw))
-                        except Exception as e:
-                            logger.warning(f"Error parsing last_backup for {rid}: {e}")
-                            last_backup_dt = None
-
-                    # Assign ALL rows to the provided account id (fix does not include account id reliably)
-                    row_account_uuid = acct_id
-                    if row_account_uuid is None:
-                        # Skip rows we cannot associate to an account
-                        logger.warning(f"Skipping resource {rid} - no account association")
-                        continue
+                    asset = self._build_asset_row(r, acct_id)
+                    batch.setdefault((asset["service"], asset["kind"], asset["resource_id"]), asset)
+                # Only the first occurrence of a resource in the whole run is counted and written
+                assets = [batch[key] for key in self._mark_seen(session, list(batch))]
+
+                if not assets:
+                    if progress:
+                        progress(rows_processed, max(rows_total, rows_processed))
+                    continue
+                for a in assets:
+                    totals["total"] += 1
+                    if a["status"] == "protected":
+                        totals["protected"] += 1
+                    service_counts[a["service"]] += 1
+                    kind_counts[a["kind"]] += 1
+
+                stats = self._write_batch(session, assets, acct_id, incremental)
+                for k, v in stats.items():
+                    totals[k] += v
+                batches += 1
+                logger.info(f"Batch {batches}: {totals['total']} resources processed, {totals['written']} written")
+                if progress:
+                    progress(rows_processed, max(rows_total, rows_processed))
+
+            deleted = 0
+            if incremental:
+                # Rows whose source document disappeared from `fix` since the previous scan
+                deleted = session.execute(
+                    text(
+                        "DELETE FROM assets_inventory a WHERE a.account_id = :account_id AND NOT EXISTS ("
+                        " SELECT 1 FROM materialize_seen s"
+                        " WHERE s.service = a.service AND s.kind = a.kind AND s.resource_id = a.resource_id)"
+                    ),
+                    {"account_id": acct_id},
+                ).rowcount or 0
+
+            # Dashboard aggregates are rebuilt in the same transaction as the rows they count
+            CoverageRollupService.refresh(session, acct_id)
+
+            logger.info(f"Committing {totals['written']} upserted rows ({batches} batches), {deleted} deletions to database...")
+            session.commit()
+            elapsed = time.monotonic() - started
+
+            logger.info(f"Service distribution: {dict(service_counts.most_common(10))}")
+            logger.info(f"Kind distribution: {dict(kind_counts.most_common(10))}")
+
+            result = {
+                "total": int(totals["total"]),
+                "protected": int(totals["protected"]),
+                "unprotected": int(totals["total"] - totals["protected"]),
+                "mode": "incremental" if incremental else "full",
+                "inserted": totals["inserted"],
+                "updated": totals["updated"],
+                "unchanged": totals["unchanged"],
+                "deleted": deleted,
+                "batches": batches,
+                "elapsed_seconds": round(elapsed, 3),
+                "rows_per_second": round(totals["written"] / elapsed, 1) if elapsed > 0 else float(totals["written"]),
+            }
+            logger.info(f"Materialization completed: {result}")
+            logger.info(f"Validation stats: {skipped_invalid} invalid resources skipped")
+            return result
 
-                    # Upsert: try to find existing
-                    existing = (
-                        session.query(AssetsInventory)
-                        .filter(
-                            AssetsInventory.account_id == row_account_uuid,
-                            AssetsInventory.service == svc,
-                            AssetsInventory.kind == kind,
-                            AssetsInventory.resource_id == rid,
-                        )
-                        .one_or_none()
-                    )
-                    
-                    if existing:
-                        # Update existing record
-                        existing.provider = provider
-                        existing.name = r.get("name") or rid
-                        existing.type = type_label
-                        existing.status = str(r.get("status", "unprotected"))
-                        existing.region = r.get("region")
-                        existing.last_backup = last_backup_dt
-                        existing.tags = r.get("tags", {})
-                        existing.arango_id = r.get("sourceId")
-                        logger.debug(f"Updated existing asset: {svc}/{kind}/{rid}")
-                    else:
-                        # Create new record
-                        try:
-                            row = AssetsInventory(
-                                account_id=row_account_uuid,
-                                provider=provider,
-                                service=svc,
-                                kind=kind,
-                                resource_id=rid,
-                                name=r.get("name") or rid,
-                                type=type_label,
-                                status=str(r.get("status", "unprotected")),
-                                region=r.get("region"),
-                                last_backup=last_backup_dt,
-                                tags=r.get("tags", {}),
-                                arango_id=r.get("sourceId"),
-                            )
-                            session.add(row)
-                            logger.debug(f"Added new asset: {svc}/{kind}/{rid}")
-                        except Exception as e:
-                            logger.error(f"Failed to add asset {svc}/{kind}/{rid}: {e}")
-                            continue
-
-                    total += 1
-                    if str(r.get("status", "unprotected")) == "protected":
-                        protected += 1
-
-                logger.info(f"Committing {total} resources to database...")
-                session.commit()
-                
-                result = {"total": int(total), "protected": int(protected), "unprotected": int(total - protected)}
-                logger.info(f"Materialization completed: {result}")
-                logger.info(f"Validation stats: {skipped_invalid} invalid resources skipped")
-                return result
-                
-            except Exception as e:
-                import traceback
-                logger.error(f"Error during database operations: {e}")
-                logger.error(f"Traceback: {traceback.format_exc()}")
-                session.rollback()
-                raise
-            finally:
-                session.close()
-                
         except Exception as e:
+            import traceback
             logger.error(f"Error during materialization: {e}")
-            return {"total": 0, "protected": 0, "unprotected": 0}
+            logger.error(f"Traceback: {traceback.format_exc()}")
+            session.rollback()
+            return empty
+        finally:
+            session.close()
+
+    def list_persisted(self, **kwargs) -> InventoryListResponse:
+        return self.list(**kwargs)
+
+    # Sortable columns; nullable ones are coalesced so keyset comparisons stay total
+    SORT_COLUMNS = {
+        "name": func.coalesce(AssetsInventory.name, AssetsInventory.resource_id),
+        "service": AssetsInventory.service,
+        "kind": AssetsInventory.kind,
+        "status": func.coalesce(AssetsInventory.status, ""),
+        "region": func.coalesce(AssetsInventory.region, ""),
+        "last_backup": func.coalesce(AssetsInventory.last_backup, datetime(1970, 1, 1, tzinfo=timezone.utc)),
+    }
+
+    @staticmethod
+    def encode_cursor(sort_value, asset_id) -> str:
+        if isinstance(sort_value, datetime):
+            sort_value = sort_value.isoformat()
+        payload = json.dumps([sort_value, str(asset_id)], separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def decode_cursor(cursor: str, sort: str):
+        """Inverse of encode_cursor; raises ValueError for a malformed cursor."""
+        try:
+            sort_value, asset_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+            if sort == "last_backup":
+                sort_value = dateparser.isoparse(sort_value)
+            return sort_value, uuid.UUID(asset_id)
+        except Exception as e:
+            raise ValueError(f"Invalid cursor: {cursor}") from e
+
+    def list(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        service: Optional[str] = None,
+        status: Optional[str] = None,
+        region: Optional[str] = None,
+        account_id: Optional[str] = None,
+        kind: Optional[str] = None,
+        sort: str = "name",
+        order: str = "asc",
+        account_identifier: Optional[str] = None,
+    ) -> InventoryListResponse:
+        """Return one page of assets from Postgres assets_inventory.
+
+        Pages are keyset-paginated on (sort column, id): pass the previous page's `next_cursor`
+        as `cursor`. Summary counts cover every asset matching the filters, not just the page.
+        `account_identifier` is resolved to the account UUID once and scopes every query.
+        """
+        if sort not in self.SORT_COLUMNS:
+            raise ValueError(f"Unsupported sort: {sort}")
+        sort_col = self.SORT_COLUMNS[sort]
+        descending = order.lower() == "desc"
 
-    def list_persisted(self) -> InventoryListResponse:
-        return self.list()
+        filters = []
+        if service:
+            filters.append(AssetsInventory.service == service.lower())
+        if status:
+            filters.append(AssetsInventory.status == status.lower())
+        if region:
+            filters.append(AssetsInventory.region == region)
+        if account_id:
+            filters.append(AssetsInventory.account_id == account_id)
+        if kind:
+            filters.append(AssetsInventory.kind == kind)
 
-    def list(self) -> InventoryListResponse:
-        """Return assets from Postgres assets_inventory table."""
         session: Session = get_session()
         try:
-            rows = session.execute(
-                select(
-                    AssetsInventory.id,
-                    AssetsInventory.resource_id,
-                    AssetsInventory.name,
-                    AssetsInventory.type,
-                    AssetsInventory.service,
-                    AssetsInventory.status,
-                    AssetsInventory.region,
-                    AssetsInventory.last_backup,
-                    AssetsInventory.tags,
-                    AssetsInventory.account_id,
-                )
-            ).all()
+            if account_identifier:
+                acct_id = resolve_account_id(session, account_identifier)
+                if acct_id is None:
+                    return InventoryListResponse(summary=InventorySummary(assets=0, coverage=0.0), items=[], limit=limit)
+                filters.append(AssetsInventory.account_id == acct_id)
+
+            query = select(
+                AssetsInventory.id,
+                AssetsInventory.resource_id,
+                AssetsInventory.name,
+                AssetsInventory.type,
+                AssetsInventory.service,
+                AssetsInventory.status,
+                AssetsInventory.region,
+                AssetsInventory.last_backup,
+                AssetsInventory.tags,
+                AssetsInventory.account_id,
+                sort_col.label("sort_value"),
+            ).where(*filters)
+            if cursor:
+                key = tuple_(sort_col, AssetsInventory.id)
+                after = tuple_(*self.decode_cursor(cursor, sort))
+                query = query.where(key < after if descending else key > after)
+            if descending:
+                query = query.order_by(sort_col.desc(), AssetsInventory.id.desc())
+            else:
+                query = query.order_by(sort_col, AssetsInventory.id)
+            # One extra row tells us whether there is a next page
+            rows = session.execute(query.limit(limit + 1)).all()
+            next_cursor = None
+            if len(rows) > limit:
+                rows = rows[:limit]
+                next_cursor = self.encode_cursor(rows[-1].sort_value, rows[-1].id)
 
             def norm_service(val: str) -> str:
                 v = (val or "unknown").lower()
@@ -699,43 +878,38 @@ class InventoryService:
                 )
                 for r in rows
             ]
-            total = len(items)
-            protected = sum(1 for i in items if i.status == "protected")
+
+            counts = session.execute(
+                select(AssetsInventory.status, func.count())
+                .where(*filters)
+                .group_by(AssetsInventory.status)
+            ).all()
+            total = sum(int(c) for _, c in counts)
+            protected = sum(int(c) for st, c in counts if st == "protected")
             coverage = (protected / total) if total else 0.0
-            return InventoryListResponse(summary=InventorySummary(assets=total, coverage=coverage), items=items)
+            return InventoryListResponse(
+                summary=InventorySummary(assets=total, coverage=coverage),
+                items=items,
+                next_cursor=next_cursor,
+                limit=limit,
+            )
         finally:
             session.close()
 
     def list_from_arango(self) -> InventoryListResponse:
         """Return inventory list using Arango if configured.
 
-        If the 'fix' collection exists, executes the pre-aggregation AQL the user provided
-        to compute EC2/EBS protection and a unified table. Otherwise, falls back to the
-        simple mock response.
+        If the 'fix' collection exists, executes the AQL the user provided to compute EC2/EBS
+        protection (snapshot counts come from the protection index) and a unified table.
+        Otherwise, falls back to the simple mock response.
         """
         db = get_db()
         try:
             if db is not None and has_collection(self.fix_collection):
+                if not has_collection(self.protection_index):
+                    ProtectionIndexService().refresh(full=True)
                 aql = f"""
-                /* -------------------- 1) Pre-aggregate snapshots by volume -------------------- */
-                LET snapAgg = (
-                  FOR s IN {self.fix_collection}
-                    FILTER 'aws_ec2_snapshot' IN s.kinds
-                    COLLECT volId = s.reported.volume_id INTO grp
-                    LET times = grp[*].s.reported.created_at
-                    RETURN {{
-                      volId,
-                      count: LENGTH(grp),
-                      last: MAX(times)
-                    }}
-                )
-
-                LET snapByVol = MERGE(
-                  FOR x IN snapAgg
-                    RETURN {{ [x.volId]: {{ count: x.count, last: x.last }} }}
-                )
-
-                /* -------------------- 2) Volume rows (EBS) -------------------- */
+                /* -------------------- 1) Volume rows (EBS) -------------------- */
                 LET volumeRows = (
                   FOR v IN {self.fix_collection}
                     FILTER 'aws_ec2_volume' IN v.kinds
@@ -744,7 +918,7 @@ class InventoryService:
                     LET az = v.reported.availability_zone
                     LET region = az ? SUBSTRING(az, 0, LENGTH(az) - 1) : null
 
-                    LET snap = snapByVol[volId]
+                    LET snap = DOCUMENT('{self.protection_index}', volId)
                     LET hasSnap = snap && snap.count > 0
 
                     RETURN {{
@@ -758,7 +932,7 @@ class InventoryService:
                     }}
                 )
 
-                /* -------------------- 3) Instance rows -------------------- */
+                /* -------------------- 2) Instance rows -------------------- */
                 LET instanceRows = (
                   FOR v IN {self.fix_collection}
                     FILTER 'aws_ec2_volume' IN v.kinds
@@ -768,7 +942,7 @@ class InventoryService:
 
                       LET perVol = (
                         FOR g IN grp
-                          LET snap = snapByVol[g.volId]
+                          LET snap = DOCUMENT('{self.protection_index}', g.volId)
                           RETURN {{ volumeId: g.volId, hasSnap: snap && snap.count > 0, last: snap ? snap.last : null }}
                       )
 
@@ -789,7 +963,7 @@ class InventoryService:
                       }}
                 )
 
-                /* -------------------- 4) S3 bucket rows -------------------- */
+                /* -------------------- 3) S3 bucket rows -------------------- */
                 LET s3Rows = (
                   FOR b IN {self.fix_collection}
                     FILTER 'aws_s3_bucket' IN b.kinds
@@ -809,7 +983,7 @@ class InventoryService:
                     }}
                 )
 
-                /* -------------------- 5) RDS instance rows -------------------- */
+                /* -------------------- 4) RDS instance rows -------------------- */
                 LET rdsRows = (
                   FOR r IN {self.fix_collection}
                     FILTER 'aws_rds_db_instance' IN r.kinds
@@ -892,20 +1066,24 @@ class InventoryService:
             items=items,
         )
 
-    def details(self) -> InventoryDetailsResponse:
+    def details(self, account_identifier: Optional[str] = None) -> InventoryDetailsResponse:
         # Build minimal details from assets_inventory (no deep config yet)
         session: Session = get_session()
         try:
-            rows = session.execute(
-                select(
-                    AssetsInventory.resource_id,
-                    AssetsInventory.name,
-                    AssetsInventory.service,
-                    AssetsInventory.region,
-                    AssetsInventory.status,
-                    AssetsInventory.last_backup,
-                )
-            ).all()
+            query = select(
+                AssetsInventory.resource_id,
+                AssetsInventory.name,
+                AssetsInventory.service,
+                AssetsInventory.region,
+                AssetsInventory.status,
+                AssetsInventory.last_backup,
+            )
+            if account_identifier:
+                acct_id = resolve_account_id(session, account_identifier)
+                if acct_id is None:
+                    return InventoryDetailsResponse(details=[])
+                query = query.where(AssetsInventory.account_id == acct_id)
+            rows = session.execute(query).all()
             details = [
                 InventoryDetails(
                     id=str(r.resource_id or ""),
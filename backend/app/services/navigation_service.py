@@ -1,94 +1,188 @@
 from __future__ import annotations
 
-from typing import Dict, Any
-from sqlalchemy import func, select
+from typing import Dict, Any, Optional
+from uuid import UUID
+from sqlalchemy import func, select, case, text
 from sqlalchemy.orm import Session
 
 from app.db.session import get_session
+from app.models.scan_types import ScanType
 from app.orm.models import AssetsInventory, DiscoveryScan, CloudAccount
+from app.services.account_service import resolve_account_id
+from app.services.coverage_rollup_service import CoverageRollupService
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Everything the sidebar needs in one round-trip. `scope` holds the accounts matching the
+# identifier (all accounts when it is NULL); compliance figures are global, as before. Only
+# inventory scans count towards recovery posture: compliance evaluation jobs share discovery_scans
+# but carry no recovery score.
+NAVIGATION_SNAPSHOT_SQL = text("""
+WITH scope AS (
+    SELECT id FROM cloud_accounts
+    WHERE CAST(:account_identifier AS text) IS NULL OR account_identifier = :account_identifier
+),
+inv AS (
+    SELECT service,
+           sum(asset_count)::bigint AS total,
+           coalesce(sum(asset_count) FILTER (WHERE status = 'protected'), 0)::bigint AS protected
+    FROM coverage_rollups
+    WHERE account_id IN (SELECT id FROM scope)
+    GROUP BY service
+),
+scans AS (
+    SELECT start_time, status, recovery_score, backup_coverage
+    FROM discovery_scans
+    WHERE account_id IN (SELECT id FROM scope) AND scan_type = 'inventory'
+),
+latest AS (
+    SELECT recovery_score, backup_coverage FROM scans ORDER BY start_time DESC LIMIT 1
+),
+recent AS (
+    SELECT recovery_score FROM scans ORDER BY start_time DESC LIMIT 7
+)
+SELECT
+    (SELECT coalesce(json_object_agg(service, total), '{}'::json) FROM inv) AS service_counts,
+    (SELECT coalesce(sum(total), 0)::bigint FROM inv) AS total_assets,
+    (SELECT coalesce(sum(protected), 0)::bigint FROM inv) AS protected_assets,
+    (SELECT count(*) FROM latest) AS has_scan,
+    (SELECT recovery_score FROM latest) AS recovery_score,
+    (SELECT backup_coverage FROM latest) AS backup_coverage,
+    (SELECT count(*) FROM scans) AS total_scans,
+    (SELECT count(*) FILTER (WHERE status = 'completed') FROM scans) AS completed_scans,
+    (SELECT avg(recovery_score) FROM recent) AS avg_recent_score,
+    (SELECT count(*) FROM scope) AS total_accounts,
+    (SELECT count(DISTINCT account_id) FROM discovery_scans
+      WHERE status = 'completed' AND scan_type = 'inventory'
+        AND account_id IN (SELECT id FROM scope)) AS active_accounts,
+    (SELECT compliance_score FROM compliance_evaluations ORDER BY created_at DESC LIMIT 1) AS compliance_score,
+    (SELECT count(*) FROM compliance_evaluations) AS audit_reports,
+    (SELECT coalesce(sum(asset_count), 0)::bigint FROM coverage_rollups) AS total_resources,
+    (SELECT count(*) FROM compliance_rules) AS total_rules,
+    (SELECT count(*) FILTER (WHERE enabled) FROM compliance_rules) AS enabled_rules,
+    (SELECT coalesce(array_agg(name ORDER BY name), '{}') FROM compliance_frameworks WHERE enabled) AS frameworks
+""")
+
 
 class NavigationService:
     """Service for providing navigation menu data"""
     
     def __init__(self):
         self.session = get_session()
+        self._account_ids: Dict[str, Optional[UUID]] = {}
+
+    def _account_id(self, account_identifier: str) -> Optional[UUID]:
+        """Resolve the account identifier once per service instance."""
+        if account_identifier not in self._account_ids:
+            self._account_ids[account_identifier] = resolve_account_id(self.session, account_identifier)
+        return self._account_ids[account_identifier]
     
     def get_navigation_data(self, account_identifier: str = None) -> Dict[str, Any]:
-        """Get navigation data for the sidebar menu"""
+        """Get navigation data for the sidebar menu (a single SQL round-trip)"""
         try:
-            # Get inventory data
-            inventory_data = self._get_inventory_data(account_identifier)
-            
-            # Get recovery posture data
-            posture_data = self._get_recovery_posture_data(account_identifier)
-            
-            # Get discovery data
-            discovery_data = self._get_discovery_data(account_identifier)
-            
-            # Get compliance data
-            compliance_data = self._get_compliance_data(account_identifier)
-            
-            # Get drift data
-            drift_data = self._get_drift_data(account_identifier)
-            
-            # Get recovery testing data
-            testing_data = self._get_recovery_testing_data(account_identifier)
-            
+            row = self.session.execute(
+                NAVIGATION_SNAPSHOT_SQL, {"account_identifier": account_identifier}
+            ).mappings().one()
+
             return {
-                "inventory": inventory_data,
-                "recovery_posture": posture_data,
-                "discovery": discovery_data,
-                "compliance": compliance_data,
-                "drift": drift_data,
-                "recovery_testing": testing_data,
+                "inventory": self._inventory_from_snapshot(row),
+                "recovery_posture": self._posture_from_snapshot(row),
+                "discovery": {
+                    "total_accounts": row["total_accounts"],
+                    "active_accounts": row["active_accounts"],
+                    "badge": str(row["active_accounts"]) if row["active_accounts"] > 0 else "0",
+                },
+                "compliance": self._compliance_from_snapshot(row),
+                # _get_drift_data reports zeros either way; skip its count query
+                "drift": self._get_default_navigation_data()["drift"],
+                "recovery_testing": self._get_recovery_testing_data(account_identifier),
             }
-            
+
         except Exception as e:
             logger.error(f"Failed to get navigation data: {e}")
             return self._get_default_navigation_data()
-    
+
+    @staticmethod
+    def _inventory_from_snapshot(row) -> Dict[str, Any]:
+        total_assets = int(row["total_assets"])
+        protected_assets = int(row["protected_assets"])
+        coverage_percentage = (protected_assets / total_assets * 100) if total_assets > 0 else 0
+        return {
+            "total_assets": total_assets,
+            "protected_assets": protected_assets,
+            "unprotected_assets": total_assets - protected_assets,
+            "coverage_percentage": round(coverage_percentage, 1),
+            "service_counts": {k: int(v) for k, v in (row["service_counts"] or {}).items()},
+            "badge": str(total_assets) if total_assets > 0 else "0"
+        }
+
+    @staticmethod
+    def _posture_from_snapshot(row) -> Dict[str, Any]:
+        if not row["has_scan"]:
+            return {"recovery_score": 0, "backup_coverage": 0, "badge": "0%"}
+        recovery_score = row["recovery_score"] or 0
+        total_scans = row["total_scans"]
+        completed_scans = row["completed_scans"]
+        success_rate = (completed_scans / total_scans * 100) if total_scans > 0 else 0
+        avg_recent_score = float(row["avg_recent_score"] or 0)
+        return {
+            "recovery_score": recovery_score,
+            "backup_coverage": row["backup_coverage"] or 0,
+            "total_scans": total_scans,
+            "completed_scans": completed_scans,
+            "success_rate": round(success_rate, 1),
+            "avg_recent_score": round(avg_recent_score, 1),
+            "badge": f"{recovery_score}%" if recovery_score > 0 else "0%"
+        }
+
+    @staticmethod
+    def _compliance_from_snapshot(row) -> Dict[str, Any]:
+        if row["compliance_score"] is not None:
+            compliance_score = row["compliance_score"]
+        elif not row["total_resources"]:
+            compliance_score = 0
+        elif row["total_rules"] == 0:
+            compliance_score = 0
+        elif row["enabled_rules"] == row["total_rules"]:
+            # All rules enabled but no evaluation - show a moderate score
+            compliance_score = 75.0
+        else:
+            # Some rules disabled - show lower score
+            compliance_score = (row["enabled_rules"] / row["total_rules"] * 60) + 20
+        frameworks = row["frameworks"] or []
+        return {
+            "compliance_score": compliance_score,
+            "audit_reports": row["audit_reports"],
+            "policies": row["total_rules"],
+            "badge": frameworks[0] if frameworks else "N/A"
+        }
+
     def _get_inventory_data(self, account_identifier: str = None) -> Dict[str, Any]:
         """Get inventory-related data"""
         try:
-            # Get total asset count
-            query = self.session.query(func.count(AssetsInventory.id))
+            # Counts come from the coverage rollups, scoped by account_id rather than a join
+            account_id = None
             if account_identifier:
-                # Join with cloud_accounts to filter by account_identifier
-                query = query.join(CloudAccount, CloudAccount.id == AssetsInventory.account_id)\
-                            .filter(CloudAccount.account_identifier == account_identifier)
-            
-            total_assets = query.scalar() or 0
-            
-            # Get protected assets count
-            protected_query = self.session.query(func.count(AssetsInventory.id))\
-                                        .filter(AssetsInventory.status == "protected")
-            if account_identifier:
-                protected_query = protected_query.join(CloudAccount, CloudAccount.id == AssetsInventory.account_id)\
-                                               .filter(CloudAccount.account_identifier == account_identifier)
-            
-            protected_assets = protected_query.scalar() or 0
-            
+                account_id = self._account_id(account_identifier)
+                if account_id is None:
+                    return self._get_default_navigation_data()["inventory"]
+
+            service_counts: Dict[str, int] = {}
+            total_assets = 0
+            protected_assets = 0
+            for service, _, status, count in CoverageRollupService.load(self.session, account_id):
+                service_counts[service] = service_counts.get(service, 0) + count
+                total_assets += count
+                if status == "protected":
+                    protected_assets += count
+
             # Get unprotected assets count
             unprotected_assets = total_assets - protected_assets
-            
+
             # Get coverage percentage
             coverage_percentage = (protected_assets / total_assets * 100) if total_assets > 0 else 0
-            
-            # Get assets by service
-            service_query = self.session.query(
-                AssetsInventory.service,
-                func.count(AssetsInventory.id).label('count')
-            )
-            if account_identifier:
-                service_query = service_query.join(CloudAccount, CloudAccount.id == AssetsInventory.account_id)\
-                                           .filter(CloudAccount.account_identifier == account_identifier)
-            
-            service_counts = dict(service_query.group_by(AssetsInventory.service).all())
-            
+
             return {
                 "total_assets": total_assets,
                 "protected_assets": protected_assets,
@@ -107,10 +201,9 @@ class NavigationService:
         """Get recovery posture data"""
         try:
             # Get latest scan for the account
-            query = self.session.query(DiscoveryScan)
+            query = self.session.query(DiscoveryScan).filter(DiscoveryScan.scan_type == ScanType.INVENTORY.value)
             if account_identifier:
-                query = query.join(CloudAccount, CloudAccount.id == DiscoveryScan.account_id)\
-                            .filter(CloudAccount.account_identifier == account_identifier)
+                query = query.filter(DiscoveryScan.account_id == self._account_id(account_identifier))
             
             latest_scan = query.order_by(DiscoveryScan.start_time.desc()).first()
             
@@ -120,9 +213,11 @@ class NavigationService:
             recovery_score = latest_scan.recovery_score or 0
             backup_coverage = latest_scan.backup_coverage or 0
             
-            # Get scan statistics
-            total_scans = query.count()
-            completed_scans = query.filter(DiscoveryScan.status == "completed").count()
+            # Get scan statistics (one aggregate pass instead of two counts)
+            total_scans, completed_scans = query.with_entities(
+                func.count(DiscoveryScan.id),
+                func.count(case((DiscoveryScan.status == "completed", 1))),
+            ).order_by(None).one()
             success_rate = (completed_scans / total_scans * 100) if total_scans > 0 else 0
             
             # Get recent scan trends (last 7 scans)
@@ -157,7 +252,8 @@ class NavigationService:
             # Get active accounts (with recent scans)
             active_query = self.session.query(func.count(CloudAccount.id.distinct()))\
                                      .join(DiscoveryScan, DiscoveryScan.account_id == CloudAccount.id)\
-                                     .filter(DiscoveryScan.status == "completed")
+                                     .filter(DiscoveryScan.status == "completed",
+                                             DiscoveryScan.scan_type == ScanType.INVENTORY.value)
             if account_identifier:
                 active_query = active_query.filter(CloudAccount.account_identifier == account_identifier)
             
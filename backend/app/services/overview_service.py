@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func, desc
 
 from app.db.session import get_session
+from app.models.scan_types import ScanType
 from app.orm.models import CloudAccount, DiscoveryScan, AssetsInventory, ComplianceFramework, ComplianceRule
 import logging
 
@@ -24,9 +25,10 @@ class OverviewService:
             # Get total accounts
             total_accounts = self.session.query(CloudAccount).count()
             
-            # Get latest scan data
+            # Get latest scan data (compliance evaluation jobs carry no recovery figures)
             latest_scans = self.session.query(DiscoveryScan).filter(
-                DiscoveryScan.status == "completed"
+                DiscoveryScan.status == "completed",
+                DiscoveryScan.scan_type == ScanType.INVENTORY.value,
             ).order_by(desc(DiscoveryScan.end_time)).limit(10).all()
             
             # Calculate aggregate metrics from latest scans
@@ -123,6 +125,7 @@ class OverviewService:
             
             recent_scans = self.session.query(DiscoveryScan).filter(
                 DiscoveryScan.status == "completed",
+                DiscoveryScan.scan_type == ScanType.INVENTORY.value,
                 DiscoveryScan.end_time >= thirty_days_ago
             ).order_by(DiscoveryScan.end_time).all()
             
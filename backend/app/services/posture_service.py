@@ -3,10 +3,9 @@ from __future__ import annotations
 from collections import defaultdict
 from typing import Dict, List
 
-from sqlalchemy import select, func
 from sqlalchemy.orm import Session
 from app.db.session import get_session
-from app.orm.models import AssetsInventory
+from app.services.coverage_rollup_service import CoverageRollupService
 from app.models.posture import (
     ScorecardResponse,
     OverallPosture,
@@ -50,10 +49,8 @@ class PostureService:
     def _compute_from_pg(self) -> Dict[str, Dict[str, int]]:
         session: Session = get_session()
         try:
-            rows = session.execute(
-                select(AssetsInventory.service, AssetsInventory.status, func.count())
-                .group_by(AssetsInventory.service, AssetsInventory.status)
-            ).all()
+            # Precomputed per-(service, region, status) counts; O(groups) rather than O(assets)
+            rows = [(svc, status, cnt) for svc, _, status, cnt in CoverageRollupService.load(session)]
             agg: Dict[str, Dict[str, int]] = defaultdict(lambda: {"total": 0, "protected": 0})
 
             def norm_service(svc: str) -> str:
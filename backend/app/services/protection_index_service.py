@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timezone
+from typing import Dict
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.db.arango import get_db
+from app.db.session import engine
+
+logger = logging.getLogger(__name__)
+
+
+class ProtectionIndexService:
+    """Maintains the snapshot-based protection index in Arango.
+
+    The index collection holds one document per EBS volume that has snapshots:
+        { _key: <volume id>, volume_id, count, last, refreshed_at }
+    where `count` is the number of `aws_ec2_snapshot` documents in `fix` referencing the volume and
+    `last` the newest snapshot `created_at`. Readers use `DOCUMENT(<index>, volumeId)` point lookups
+    instead of aggregating every snapshot on each query.
+
+    A `watermark` document records when the previous refresh started (Arango server time, less
+    `protection_index_overlap_seconds`); an incremental refresh only re-aggregates volumes referenced
+    by snapshots written to `fix` after it. Every refresh drops entries whose volume has no snapshot
+    left, and every `protection_index_full_every`th one is a full rebuild, which also corrects the
+    count and newest snapshot of volumes that lost only some of their snapshots.
+
+    Refreshes are serialized across processes with a Postgres advisory lock: a full refresh sweeps
+    every entry it did not write itself, which would drop the entries of an overlapping refresh.
+    """
+
+    WATERMARK_KEY = "watermark"
+    LOCK_KEY = "protection_index_refresh"
+
+    def __init__(self) -> None:
+        self.fix_collection = settings.arango_fix_collection
+        self.collection = settings.arango_protection_index_collection
+
+    def ensure_collection(self) -> bool:
+        db = get_db()
+        if db is None:
+            return False
+        if not db.has_collection(self.collection):
+            db.create_collection(self.collection)
+            logger.info(f"Created protection index collection {self.collection}")
+        return True
+
+    def refresh(self, full: bool = False) -> Dict[str, object]:
+        """Bring the index up to date with `fix`. Falls back to a full rebuild when no watermark exists."""
+        db = get_db()
+        if db is None or not self.ensure_collection():
+            return {"mode": "skipped", "volumes": 0}
+
+        # Released when the transaction ends; waiting refreshes start from the new watermark
+        with engine.begin() as conn:
+            conn.execute(text("SELECT pg_advisory_xact_lock(hashtext(:key))"), {"key": self.LOCK_KEY})
+            return self._refresh(db, full)
+
+    def _refresh(self, db, full: bool) -> Dict[str, object]:
+        meta = db.collection(self.collection).get(self.WATERMARK_KEY) or {}
+        since = meta.get("since_ms")
+        runs = int(meta.get("incremental_runs") or 0)
+        every = settings.protection_index_full_every
+        if not isinstance(since, (int, float)) or (every > 0 and runs + 1 >= every):
+            full = True
+        # Taken before reading `fix`: documents written while this refresh runs are picked up next time
+        started_ms = next(iter(db.aql.execute("RETURN DATE_NOW()")))
+        stamp = datetime.now(timezone.utc).isoformat()
+
+        if full:
+            aql = f"""
+            FOR s IN {self.fix_collection}
+              FILTER 'aws_ec2_snapshot' IN s.kinds AND s.reported.volume_id != null
+              COLLECT volId = s.reported.volume_id
+                AGGREGATE cnt = COUNT(1), last = MAX(s.reported.created_at)
+              UPSERT {{ _key: volId }}
+                INSERT {{ _key: volId, volume_id: volId, count: cnt, last: last, refreshed_at: @stamp }}
+                REPLACE {{ _key: volId, volume_id: volId, count: cnt, last: last, refreshed_at: @stamp }}
+                IN {self.collection}
+              RETURN volId
+            """
+            bind_vars = {"stamp": stamp}
+        else:
+            # `updated` is when the collect wrote the node (ingestion time), so a collect that
+            # finishes late is still picked up whatever its snapshots' own timestamps are
+            aql = f"""
+            LET touched = (
+              FOR s IN {self.fix_collection}
+                FILTER 'aws_ec2_snapshot' IN s.kinds AND s.reported.volume_id != null
+                  AND DATE_TIMESTAMP(s.updated || s.created) >= @since
+                RETURN DISTINCT s.reported.volume_id
+            )
+            FOR volId IN touched
+              LET snaps = (
+                FOR s IN {self.fix_collection}
+                  FILTER s.reported.volume_id == volId AND 'aws_ec2_snapshot' IN s.kinds
+                  RETURN s.reported.created_at
+              )
+              UPSERT {{ _key: volId }}
+                INSERT {{ _key: volId, volume_id: volId, count: LENGTH(snaps), last: MAX(snaps), refreshed_at: @stamp }}
+                REPLACE {{ _key: volId, volume_id: volId, count: LENGTH(snaps), last: MAX(snaps), refreshed_at: @stamp }}
+                IN {self.collection}
+              RETURN volId
+            """
+            bind_vars = {"stamp": stamp, "since": since}
+        touched = list(db.aql.execute(aql, bind_vars=bind_vars))
+
+        if full:
+            # Volumes that no longer have any snapshot were not touched by the rebuild
+            removed = list(db.aql.execute(
+                f"""
+                FOR p IN {self.collection}
+                  FILTER p._key != @meta AND p.refreshed_at != @stamp
+                  REMOVE p IN {self.collection}
+                  RETURN 1
+                """,
+                bind_vars={"meta": self.WATERMARK_KEY, "stamp": stamp},
+            ))
+        else:
+            # Deleted snapshots leave no trace to scan for; drop entries whose volume has none left
+            # (point lookups on idx_fix_reported_volume_id)
+            removed = list(db.aql.execute(
+                f"""
+                FOR p IN {self.collection}
+                  FILTER p._key != @meta
+                  LET remaining = FIRST(
+                    FOR s IN {self.fix_collection}
+                      FILTER s.reported.volume_id == p._key AND 'aws_ec2_snapshot' IN s.kinds
+                      LIMIT 1
+                      RETURN 1
+                  )
+                  FILTER remaining == null
+                  REMOVE p IN {self.collection}
+                  RETURN 1
+                """,
+                bind_vars={"meta": self.WATERMARK_KEY},
+            ))
+
+        # Overlap covers collects that were still committing when this refresh read `fix`
+        since_ms = started_ms - settings.protection_index_overlap_seconds * 1000
+        db.aql.execute(
+            f"""
+            UPSERT {{ _key: @meta }}
+              INSERT {{ _key: @meta, since_ms: @since, incremental_runs: @runs, refreshed_at: @stamp }}
+              REPLACE {{ _key: @meta, since_ms: @since, incremental_runs: @runs, refreshed_at: @stamp }}
+              IN {self.collection}
+            """,
+            bind_vars={"meta": self.WATERMARK_KEY, "since": since_ms, "runs": 0 if full else runs + 1, "stamp": stamp},
+        )
+
+        result = {
+            "mode": "full" if full else "incremental",
+            "volumes": len(touched),
+            "removed": len(removed),
+            "since_ms": since_ms,
+        }
+        logger.info(f"Protection index refreshed: {result}")
+        return result
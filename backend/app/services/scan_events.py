@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, List, Optional, Set
+
+import psycopg
+from psycopg.conninfo import make_conninfo
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Postgres channel the discovery_scans trigger (migration 0017) publishes progress on
+CHANNEL = "scan_progress"
+# Subscription key that receives the events of every scan
+ALL_SCANS = "*"
+# Events buffered per subscriber; a slow client drops the oldest (the newest state is what matters)
+QUEUE_SIZE = 64
+# Latest event kept per scan for clients that connect mid-scan
+LATEST_CACHE_SIZE = 1000
+
+TERMINAL_STATUSES = {"completed", "failed", "cancelled"}
+
+# State of in-flight scans and of the given (cached) scans, in the trigger's payload shape
+SNAPSHOT_SQL = """
+SELECT json_build_object(
+    'scan_id', scan_id,
+    'status', status,
+    'current_phase', current_phase,
+    'phase_progress', phase_progress,
+    'overall_progress', progress,
+    'total_phases', total_phases,
+    'estimated_completion', estimated_completion,
+    'error_message', left(error_message, 500),
+    'phase_rows', scan_metadata -> 'phase_rows',
+    'updated_at', updated_at
+)::text
+FROM discovery_scans
+WHERE status NOT IN ('completed', 'failed', 'cancelled') OR scan_id = ANY(%s)
+ORDER BY updated_at
+"""
+
+
+def progress_event(progress: Dict[str, Any]) -> Dict[str, Any]:
+    """Event shape of a ScanProgressService.get_scan_progress() row (same keys as the trigger payload)."""
+    return {
+        "scan_id": progress.get("scan_id"),
+        "status": progress.get("status"),
+        "current_phase": progress.get("current_phase"),
+        "phase_progress": progress.get("phase_progress", 0),
+        "overall_progress": progress.get("overall_progress", 0),
+        "total_phases": progress.get("total_phases", 1),
+        "estimated_completion": progress.get("estimated_completion"),
+        "error_message": progress.get("error_message"),
+        "phase_rows": (progress.get("scan_metadata") or {}).get("phase_rows"),
+    }
+
+
+class ScanEventBus:
+    """In-process fan-out of scan progress events to asyncio subscribers.
+
+    Only touched from the event loop, so it needs no locking.
+    """
+
+    def __init__(self) -> None:
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = defaultdict(set)
+        self._latest: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def subscribe(self, scan_id: str = ALL_SCANS) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        self._subscribers[scan_id].add(queue)
+        return queue
+
+    def unsubscribe(self, scan_id: str, queue: asyncio.Queue) -> None:
+        subscribers = self._subscribers.get(scan_id)
+        if subscribers is not None:
+            subscribers.discard(queue)
+            if not subscribers:
+                del self._subscribers[scan_id]
+
+    def latest(self, scan_id: str) -> Optional[Dict[str, Any]]:
+        return self._latest.get(scan_id)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Latest event of every recently seen scan, oldest first."""
+        return list(self._latest.values())
+
+    def in_flight(self) -> List[str]:
+        """Scans whose cached state is not terminal (their end may have been missed)."""
+        return [scan_id for scan_id, e in self._latest.items() if e.get("status") not in TERMINAL_STATUSES]
+
+    def reconcile(self, events: List[Dict[str, Any]]) -> None:
+        """Replace the cached state of in-flight scans with `events` read from the database.
+
+        Events are also published, so subscribers learn about transitions missed while the
+        listener was down; in-flight scans absent from `events` no longer exist and are dropped.
+        """
+        for scan_id in self.in_flight():
+            del self._latest[scan_id]
+        for event in events:
+            self.publish(event)
+
+    def publish(self, event: Dict[str, Any]) -> None:
+        scan_id = event.get("scan_id")
+        if not scan_id:
+            return
+        self._latest[scan_id] = event
+        self._latest.move_to_end(scan_id)
+        while len(self._latest) > LATEST_CACHE_SIZE:
+            self._latest.popitem(last=False)
+
+        for queue in self._subscribers.get(scan_id, set()) | self._subscribers.get(ALL_SCANS, set()):
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+
+class ScanProgressListener:
+    """One LISTEN connection per API process feeding the bus; reconnects with backoff.
+
+    Notifications sent while no connection is listening are lost, so every (re)connect
+    reconciles the bus with discovery_scans once LISTEN is active.
+    """
+
+    def __init__(self, bus: ScanEventBus) -> None:
+        self.bus = bus
+        self._task: Optional[asyncio.Task] = None
+
+    def ensure_started(self) -> None:
+        """Start listening on first use, from the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    @staticmethod
+    def _conninfo() -> str:
+        return make_conninfo(
+            host=settings.pg_host,
+            port=settings.pg_port,
+            dbname=settings.pg_db,
+            user=settings.pg_user,
+            password=settings.pg_password,
+        )
+
+    def _publish(self, payload: str) -> None:
+        try:
+            self.bus.publish(json.loads(payload))
+        except ValueError:
+            logger.warning(f"Ignoring malformed scan progress payload: {payload[:200]}")
+
+    async def _run(self) -> None:
+        backoff = 1.0
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(self._conninfo(), autocommit=True) as conn:
+                    # Notifications arriving while the snapshot query runs reach handlers, not
+                    # notifies(); hold them until the (possibly older) snapshot is applied
+                    pending: List[str] = []
+                    conn.add_notify_handler(lambda notify: pending.append(notify.payload))
+                    await conn.execute(f"LISTEN {CHANNEL}")
+                    cur = await conn.execute(SNAPSHOT_SQL, [self.bus.in_flight()])
+                    self.bus.reconcile([json.loads(row[0]) for row in await cur.fetchall()])
+                    for payload in pending:
+                        self._publish(payload)
+                    logger.info(f"Listening for scan progress on '{CHANNEL}'")
+                    backoff = 1.0
+                    async for notify in conn.notifies():
+                        self._publish(notify.payload)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Scan progress listener disconnected: {e}; retrying in {backoff:.0f}s")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+
+
+bus = ScanEventBus()
+listener = ScanProgressListener(bus)
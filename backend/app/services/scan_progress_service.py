@@ -1,17 +1,112 @@
 from __future__ import annotations
 
-from typing import Optional, Dict, Any
+import json
+import time
+from typing import Optional, Dict, Any, Callable
 from datetime import datetime, timezone, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import update
+from sqlalchemy import update, text
 
-from app.db.session import get_session
+from app.core.config import settings
+from app.db.session import get_session, engine
 from app.orm.models import DiscoveryScan
 from app.models.scan_types import ScanType, ScanPhase, get_scan_phases, get_phase_progress, get_scan_config
 import logging
 
 logger = logging.getLogger(__name__)
 
+# phase_progress plus the row counters merged into scan_metadata.phase_rows
+PHASE_PROGRESS_SQL = text("""
+UPDATE discovery_scans
+SET phase_progress = :phase_progress,
+    updated_at = now(),
+    scan_metadata = (coalesce(scan_metadata::jsonb, '{}'::jsonb)
+                     || jsonb_build_object('phase_rows', CAST(:phase_rows AS jsonb)))::json
+WHERE scan_id = :scan_id
+""")
+
+
+class PhaseProgressReporter:
+    """Throttled rows-processed progress for one long-running phase of a scan.
+
+    Call it with (rows_processed, rows_total) as often as convenient; it writes phase_progress and
+    throughput at most once per `every_rows` rows or `every_seconds` seconds. Writes go through a
+    dedicated autocommit connection, so they never join or wait on the phase's own bulk-write
+    transaction and are visible to pollers immediately.
+    """
+
+    def __init__(
+        self,
+        scan_id: str,
+        every_rows: Optional[int] = None,
+        every_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.scan_id = scan_id
+        self.every_rows = max(1, every_rows or settings.scan_progress_every_rows)
+        self.every_seconds = every_seconds if every_seconds is not None else settings.scan_progress_every_seconds
+        self.clock = clock
+        self.started = clock()
+        self.processed = 0
+        self.total = 0
+        self._last_rows = 0
+        self._last_time = self.started
+        self._conn = None
+
+    def __call__(self, processed: int, total: int) -> None:
+        self.processed = processed
+        self.total = total
+        now = self.clock()
+        if processed - self._last_rows >= self.every_rows or now - self._last_time >= self.every_seconds:
+            self._write(now)
+
+    def snapshot(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """phase_progress (0-99 until finished) and the row counters as stored on the scan."""
+        elapsed = (now if now is not None else self.clock()) - self.started
+        # The total is an estimate (every candidate document); keep 100 for an actually finished phase
+        percent = min(99, int(self.processed * 100 / self.total)) if self.total else 0
+        return {
+            "phase_progress": percent,
+            "rows_processed": self.processed,
+            "rows_total": self.total,
+            "rows_per_second": round(self.processed / elapsed, 1) if elapsed > 0 else 0.0,
+        }
+
+    def close(self, finished: bool = True) -> None:
+        """Write the final counters (100% when `finished`) and release the connection."""
+        try:
+            if self.processed or finished:
+                if finished:
+                    self.total = max(self.total, self.processed)
+                self._write(self.clock(), final=finished)
+        finally:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _write(self, now: float, final: bool = False) -> None:
+        values = self.snapshot(now)
+        phase_progress = 100 if final else values["phase_progress"]
+        del values["phase_progress"]
+        self._store(phase_progress, values)
+        self._last_rows = self.processed
+        self._last_time = now
+
+    def _store(self, phase_progress: int, phase_rows: Dict[str, Any]) -> None:
+        try:
+            if self._conn is None:
+                self._conn = engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+            self._conn.execute(
+                PHASE_PROGRESS_SQL,
+                {"scan_id": self.scan_id, "phase_progress": phase_progress, "phase_rows": json.dumps(phase_rows)},
+            )
+        except Exception as e:
+            # Progress is best-effort; never fail the phase over it
+            logger.warning(f"Failed to report progress for scan {self.scan_id}: {e}")
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
 
 class ScanProgressService:
     """Service for tracking scan progress and phases"""
@@ -137,6 +232,41 @@ class ScanProgressService:
             self.session.rollback()
             return False
     
+    def update_status(self, scan_id: str, status: str) -> bool:
+        """Set the scan status (e.g. pending -> running for queued jobs)"""
+        try:
+            self.session.execute(
+                update(DiscoveryScan)
+                .where(DiscoveryScan.scan_id == scan_id)
+                .values({DiscoveryScan.status: status, DiscoveryScan.updated_at: datetime.now(timezone.utc)})
+            )
+            self.session.commit()
+            return True
+        except Exception as e:
+            logger.error(f"Failed to update status for scan {scan_id}: {e}")
+            self.session.rollback()
+            return False
+
+    def update_scan_metadata(self, scan_id: str, values: Dict[str, Any]) -> bool:
+        """Merge values into the scan's scan_metadata (counters, results)"""
+        try:
+            scan = self.session.query(DiscoveryScan).filter(DiscoveryScan.scan_id == scan_id).first()
+            if not scan:
+                return False
+            metadata = dict(scan.scan_metadata or {})
+            metadata.update(values)
+            self.session.execute(
+                update(DiscoveryScan)
+                .where(DiscoveryScan.scan_id == scan_id)
+                .values({DiscoveryScan.scan_metadata: metadata, DiscoveryScan.updated_at: datetime.now(timezone.utc)})
+            )
+            self.session.commit()
+            return True
+        except Exception as e:
+            logger.error(f"Failed to update metadata for scan {scan_id}: {e}")
+            self.session.rollback()
+            return False
+    
     def complete_scan(self, scan_id: str, success: bool = True, error_message: Optional[str] = None) -> bool:
         """Mark a scan as completed or failed"""
         try:
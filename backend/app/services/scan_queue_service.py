@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy import select, text, update, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.session import get_session
+from app.orm.models import ScanJob
+
+logger = logging.getLogger(__name__)
+
+# A job whose worker died is retried this many times before it is marked failed
+MAX_ATTEMPTS = 3
+
+# Oldest queued job whose account is below its running-scan limit; rows other workers are
+# claiming are skipped rather than waited on
+CLAIM_SQL = text("""
+SELECT j.id, j.scan_id, j.account_id
+FROM scan_jobs j
+WHERE j.status = 'queued'
+  AND (SELECT count(*) FROM scan_jobs r
+       WHERE r.account_id = j.account_id AND r.status = 'running') < :limit
+ORDER BY j.created_at
+LIMIT 1
+FOR UPDATE SKIP LOCKED
+""")
+
+RUNNING_FOR_ACCOUNT_SQL = text(
+    "SELECT count(*) FROM scan_jobs WHERE account_id = :account_id AND status = 'running'"
+)
+
+# Serializes stale-job sweeps across workers
+RECOVER_LOCK_KEY = "scan_jobs_recover_stale"
+
+
+@dataclass
+class ClaimedJob:
+    id: UUID
+    scan_id: str
+    account_id: UUID
+
+
+class ScanQueueService:
+    """Postgres-backed scan job queue (scan_jobs) shared by the API and the scan workers."""
+
+    @staticmethod
+    def enqueue(session: Session, account_id: UUID, scan_id: str, scan_type: str, triggered_by: str) -> Optional[str]:
+        """Queue a job in the caller's transaction.
+
+        Returns None when queued, or the scan_id of the already-queued job for the same account
+        and scan type (the request is deduplicated onto it).
+        """
+        stmt = (
+            pg_insert(ScanJob)
+            .values(account_id=account_id, scan_id=scan_id, scan_type=scan_type, triggered_by=triggered_by)
+            .on_conflict_do_nothing(
+                index_elements=[ScanJob.account_id, ScanJob.scan_type],
+                index_where=ScanJob.status == "queued",
+            )
+            .returning(ScanJob.scan_id)
+        )
+        if session.execute(stmt).scalar_one_or_none() is not None:
+            return None
+        return ScanQueueService.find_queued(session, account_id, scan_type)
+
+    @staticmethod
+    def find_queued(session: Session, account_id: UUID, scan_type: str) -> Optional[str]:
+        return session.execute(
+            select(ScanJob.scan_id).where(
+                ScanJob.account_id == account_id,
+                ScanJob.scan_type == scan_type,
+                ScanJob.status == "queued",
+            )
+        ).scalar_one_or_none()
+
+    def claim(self, worker_id: str) -> Optional[ClaimedJob]:
+        """Atomically take the next runnable job, honouring the per-account concurrency limit."""
+        session: Session = get_session()
+        try:
+            limit = max(1, settings.scan_account_concurrency)
+            row = session.execute(CLAIM_SQL, {"limit": limit}).first()
+            if row is None:
+                session.rollback()
+                return None
+            # Two workers can pick different jobs of one account at once; serialize the recheck
+            session.execute(text("SELECT pg_advisory_xact_lock(hashtext(:key))"), {"key": str(row.account_id)})
+            if session.execute(RUNNING_FOR_ACCOUNT_SQL, {"account_id": row.account_id}).scalar_one() >= limit:
+                session.rollback()
+                return None
+            session.execute(
+                update(ScanJob)
+                .where(ScanJob.id == row.id)
+                .values(
+                    status="running",
+                    worker_id=worker_id,
+                    attempts=ScanJob.attempts + 1,
+                    started_at=func.now(),
+                    heartbeat_at=func.now(),
+                )
+            )
+            session.commit()
+            return ClaimedJob(id=row.id, scan_id=row.scan_id, account_id=row.account_id)
+        except Exception as e:
+            logger.error(f"Failed to claim scan job: {e}")
+            session.rollback()
+            return None
+        finally:
+            session.close()
+
+    def heartbeat(self, job_id: UUID) -> None:
+        session: Session = get_session()
+        try:
+            session.execute(update(ScanJob).where(ScanJob.id == job_id).values(heartbeat_at=func.now()))
+            session.commit()
+        except Exception as e:
+            logger.warning(f"Failed to heartbeat scan job {job_id}: {e}")
+            session.rollback()
+        finally:
+            session.close()
+
+    def finish(self, job_id: UUID, success: bool, error_message: Optional[str] = None) -> None:
+        session: Session = get_session()
+        try:
+            session.execute(
+                update(ScanJob)
+                .where(ScanJob.id == job_id)
+                .values(
+                    status="completed" if success else "failed",
+                    error_message=error_message,
+                    finished_at=func.now(),
+                )
+            )
+            session.commit()
+        except Exception as e:
+            logger.error(f"Failed to finish scan job {job_id}: {e}")
+            session.rollback()
+        finally:
+            session.close()
+
+    def recover_stale(self, stale_seconds: Optional[int] = None) -> List[str]:
+        """Requeue running jobs whose worker stopped heartbeating; returns scan_ids given up on.
+
+        At most one stale job per account and scan type is requeued (the queue allows a single
+        queued job each); the others are failed, as are jobs that used up their attempts or whose
+        account and scan type already has a queued job.
+        """
+        stale_seconds = stale_seconds or settings.scan_job_stale_seconds
+        session: Session = get_session()
+        try:
+            # Concurrent sweeps would each pick a job to requeue for the same account and scan type
+            session.execute(text("SELECT pg_advisory_xact_lock(hashtext(:key))"), {"key": RECOVER_LOCK_KEY})
+            failed = session.execute(
+                text("""
+                WITH stale AS (
+                    SELECT id, attempts, account_id, scan_type,
+                           ROW_NUMBER() OVER (
+                               PARTITION BY account_id, scan_type
+                               ORDER BY attempts >= :max_attempts, created_at, id
+                           ) AS rn
+                    FROM scan_jobs
+                    WHERE status = 'running' AND heartbeat_at < now() - make_interval(secs => :stale)
+                )
+                UPDATE scan_jobs j
+                SET status = 'failed', error_message = 'Scan worker stopped responding', finished_at = now()
+                FROM stale s
+                WHERE j.id = s.id
+                  AND (s.attempts >= :max_attempts OR s.rn > 1 OR EXISTS (
+                      SELECT 1 FROM scan_jobs q
+                      WHERE q.status = 'queued' AND q.account_id = s.account_id AND q.scan_type = s.scan_type))
+                RETURNING j.scan_id
+                """),
+                {"stale": stale_seconds, "max_attempts": MAX_ATTEMPTS},
+            ).scalars().all()
+            # What is left is at most one job per account and scan type with none queued
+            requeued = session.execute(
+                text("""
+                UPDATE scan_jobs
+                SET status = 'queued', worker_id = NULL
+                WHERE status = 'running' AND heartbeat_at < now() - make_interval(secs => :stale)
+                RETURNING scan_id
+                """),
+                {"stale": stale_seconds},
+            ).scalars().all()
+            session.commit()
+            if failed or requeued:
+                logger.warning(f"Stale scan jobs: requeued {requeued}, failed {failed}")
+            return list(failed)
+        except Exception as e:
+            logger.error(f"Failed to recover stale scan jobs: {e}")
+            session.rollback()
+            return []
+        finally:
+            session.close()
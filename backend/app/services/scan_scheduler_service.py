@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import select, func
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.session import get_session
+from app.models.scan_types import ScanType
+from app.orm.models import CloudAccount, ScanJob
+
+logger = logging.getLogger(__name__)
+
+# Scheduled slots are counted from this instant, so they do not drift with restarts
+SCHEDULE_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+NAMED_FREQUENCIES = {
+    "hourly": timedelta(hours=1),
+    "every hour": timedelta(hours=1),
+    "daily": timedelta(days=1),
+    "every day": timedelta(days=1),
+    "weekly": timedelta(weeks=1),
+    "every week": timedelta(weeks=1),
+    "monthly": timedelta(days=30),
+}
+
+# '6h', '12 hours', 'Every 6 hours', '30m', '2d'
+_FREQUENCY_RE = re.compile(r"^(?:every\s+)?(\d+)\s*(m|min|mins|minutes?|h|hrs?|hours?|d|days?)$")
+_UNIT_SECONDS = {"m": 60, "h": 3600, "d": 86400}
+
+
+def parse_frequency(value: Optional[str]) -> Optional[timedelta]:
+    """Interval for a discovery_frequency value as stored by the UI; None means not scheduled."""
+    if not value:
+        return None
+    value = value.strip().lower()
+    if value in NAMED_FREQUENCIES:
+        return NAMED_FREQUENCIES[value]
+    match = _FREQUENCY_RE.match(value)
+    if not match or int(match.group(1)) <= 0:
+        return None
+    return timedelta(seconds=int(match.group(1)) * _UNIT_SECONDS[match.group(2)[0]])
+
+
+def parse_preferred_time(value: Optional[str]) -> Optional[timedelta]:
+    """Offset from midnight UTC for an 'HH:MM' preferred_time_utc, or None."""
+    if not value:
+        return None
+    try:
+        hours, minutes = value.strip().split(":")[:2]
+        offset = timedelta(hours=int(hours), minutes=int(minutes))
+    except ValueError:
+        return None
+    return offset if timedelta(0) <= offset < timedelta(days=1) else None
+
+
+def account_jitter(account_id, window: timedelta) -> timedelta:
+    """Stable offset in [0, window) derived from the account id."""
+    window_seconds = int(window.total_seconds())
+    if window_seconds <= 0:
+        return timedelta(0)
+    digest = hashlib.sha256(str(account_id).encode("utf-8")).digest()
+    return timedelta(seconds=int.from_bytes(digest[:8], "big") % window_seconds)
+
+
+def next_run_at(
+    account_id,
+    frequency: Optional[str],
+    preferred_time: Optional[str],
+    after: datetime,
+    jitter_window: Optional[timedelta] = None,
+) -> Optional[datetime]:
+    """First scheduled start strictly after `after`, or None when the account is not scheduled.
+
+    Slots repeat every `frequency` from `preferred_time` (midnight UTC when unset). Each account
+    is shifted by a stable jitter: within `jitter_window` of the preferred time, or across the
+    whole interval when no time was chosen, so accounts sharing a schedule do not all start at once.
+    """
+    interval = parse_frequency(frequency)
+    if interval is None:
+        return None
+    offset = parse_preferred_time(preferred_time)
+    if jitter_window is None:
+        jitter_window = timedelta(seconds=settings.scan_schedule_jitter_seconds)
+    window = interval if offset is None else min(jitter_window, interval)
+    anchor = SCHEDULE_EPOCH + (offset or timedelta(0)) + account_jitter(account_id, window)
+    periods = math.floor((after - anchor) / interval) + 1
+    return anchor + periods * interval
+
+
+def upcoming_scan(session: Session, account_identifier: Optional[str] = None) -> Optional[datetime]:
+    """Earliest planned scan of the scheduled accounts (or of one account)."""
+    query = select(func.min(CloudAccount.next_scan_at)).where(
+        CloudAccount.discovery_enabled.is_(True),
+        CloudAccount.discovery_frequency.is_not(None),
+    )
+    if account_identifier:
+        query = query.where(CloudAccount.account_identifier == account_identifier)
+    return session.execute(query).scalar_one_or_none()
+
+
+class ScanSchedulerService:
+    """Queues scans for accounts whose next_scan_at has passed.
+
+    Safe to run from several worker hosts: due accounts are claimed with SKIP LOCKED.
+    """
+
+    def tick(self, now: Optional[datetime] = None) -> int:
+        """Plan unscheduled accounts and queue due ones; returns the number of scans queued."""
+        # Import here to avoid circular imports
+        from app.services.discovery_service import DiscoveryService
+
+        now = now or datetime.now(timezone.utc)
+        session: Session = get_session()
+        try:
+            self._plan_unscheduled(session, now)
+
+            inflight = session.execute(
+                select(func.count()).select_from(ScanJob).where(ScanJob.status.in_(("queued", "running")))
+            ).scalar_one()
+            room = settings.scan_schedule_max_inflight - inflight
+            if room <= 0:
+                session.commit()
+                logger.info(f"Scan scheduler: {inflight} scans in flight, deferring due accounts")
+                return 0
+
+            # Most overdue first; accounts beyond the cap stay due for the next tick
+            due = session.execute(
+                select(CloudAccount)
+                .where(
+                    CloudAccount.discovery_enabled.is_(True),
+                    CloudAccount.discovery_frequency.is_not(None),
+                    CloudAccount.next_scan_at <= now,
+                )
+                .order_by(CloudAccount.next_scan_at)
+                .limit(room)
+                .with_for_update(skip_locked=True)
+            ).scalars().all()
+
+            queued = 0
+            for acct in due:
+                scan_id, is_new = DiscoveryService.queue_scan(session, acct, "scheduled", ScanType.INVENTORY)
+                queued += int(is_new)
+                acct.next_scan_at = next_run_at(acct.id, acct.discovery_frequency, acct.preferred_time_utc, now)
+                logger.info(
+                    f"Scheduled scan {scan_id} for account {acct.account_identifier}"
+                    f"{'' if is_new else ' (already queued)'}; next at {acct.next_scan_at}"
+                )
+            session.commit()
+            return queued
+        except Exception as e:
+            logger.error(f"Scan scheduler tick failed: {e}")
+            session.rollback()
+            return 0
+        finally:
+            session.close()
+
+    @staticmethod
+    def _plan_unscheduled(session: Session, now: datetime) -> None:
+        """Give accounts with a frequency but no next_scan_at (new or migrated) their first slot."""
+        accounts = session.execute(
+            select(CloudAccount)
+            .where(
+                CloudAccount.discovery_enabled.is_(True),
+                CloudAccount.discovery_frequency.is_not(None),
+                CloudAccount.next_scan_at.is_(None),
+            )
+            .with_for_update(skip_locked=True)
+        ).scalars().all()
+        for acct in accounts:
+            acct.next_scan_at = next_run_at(acct.id, acct.discovery_frequency, acct.preferred_time_utc, now)
+            if acct.next_scan_at is None:
+                logger.debug(
+                    f"Account {acct.account_identifier}: unrecognised discovery_frequency "
+                    f"{acct.discovery_frequency!r}, not scheduling"
+                )
+
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+# Keys that identify an item inside a list of objects (checked in order). When every item of
+# both lists carries the same key with unique values, items are matched by it instead of by
+# position, so a reordered or inserted security group does not show up as N changes.
+IDENTITY_KEYS = (
+    "group_id",
+    "volume_id",
+    "instance_id",
+    "snapshot_id",
+    "subnet_id",
+    "id",
+    "arn",
+    "key",
+    "name",
+)
+
+
+def escape_pointer(token: Any) -> str:
+    """Escape one JSON-pointer reference token (RFC 6901)."""
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def pointer_to_field(path: str) -> str:
+    """'/security_groups/0/group_name' -> 'security_groups.0.group_name'."""
+    return ".".join(p.replace("~1", "/").replace("~0", "~") for p in path.split("/")[1:])
+
+
+class _Digests:
+    """Memoized subtree digests.
+
+    Digests are computed bottom-up in a single iterative pass per root and cached by object
+    identity, so every node is hashed once no matter how often it is compared.
+    """
+
+    def __init__(self) -> None:
+        self._cache: Dict[int, str] = {}
+        # Keep containers alive so their ids cannot be reused while cached
+        self._keep: List[Any] = []
+
+    @staticmethod
+    def _leaf(value: Any) -> bytes:
+        # repr keeps JSON scalar types apart (1, 1.0, True, '1') and is much cheaper than hashing each leaf
+        return repr(value).encode("utf-8")
+
+    def get(self, root: Any) -> str:
+        if not isinstance(root, (dict, list)):
+            return hashlib.sha1(self._leaf(root)).hexdigest()
+        if id(root) in self._cache:
+            return self._cache[id(root)]
+
+        stack: List[Tuple[Any, bool]] = [(root, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if id(node) in self._cache:
+                continue
+            children = node.values() if isinstance(node, dict) else node
+            if not expanded:
+                stack.append((node, True))
+                stack.extend((c, False) for c in children if isinstance(c, (dict, list)) and id(c) not in self._cache)
+                continue
+            parts: List[bytes] = []
+            if isinstance(node, dict):
+                parts.append(b"{")
+                for k in sorted(node, key=str):
+                    parts.append(self._leaf(k))
+                    parts.append(b":")
+                    parts.append(self._child(node[k]))
+                    parts.append(b",")
+            else:
+                parts.append(b"[")
+                for c in node:
+                    parts.append(self._child(c))
+                    parts.append(b",")
+            self._cache[id(node)] = hashlib.sha1(b"".join(parts)).hexdigest()
+            self._keep.append(node)
+        return self._cache[id(root)]
+
+    def _child(self, value: Any) -> bytes:
+        if isinstance(value, (dict, list)):
+            return self._cache[id(value)].encode("ascii")
+        return self._leaf(value)
+
+
+def _identity_key(old: List[Any], new: List[Any]) -> Optional[str]:
+    items = old + new
+    if not items or not all(isinstance(i, dict) for i in items):
+        return None
+    for key in IDENTITY_KEYS:
+        if all(i.get(key) is not None for i in items):
+            old_ids = [json.dumps(i[key], sort_keys=True, default=str) for i in old]
+            new_ids = [json.dumps(i[key], sort_keys=True, default=str) for i in new]
+            if len(set(old_ids)) == len(old_ids) and len(set(new_ids)) == len(new_ids):
+                return key
+    return None
+
+
+def _match_list(old: List[Any], new: List[Any], digests: _Digests) -> List[Tuple[Optional[int], Optional[int]]]:
+    """Pair old/new list indices; (i, None) is a removal, (None, j) an addition."""
+    key = _identity_key(old, new)
+    if key is not None:
+        ident = lambda item: json.dumps(item[key], sort_keys=True, default=str)  # noqa: E731
+        new_by_id = {ident(item): j for j, item in enumerate(new)}
+        pairs: List[Tuple[Optional[int], Optional[int]]] = []
+        seen = set()
+        for i, item in enumerate(old):
+            j = new_by_id.get(ident(item))
+            pairs.append((i, j))
+            if j is not None:
+                seen.add(j)
+        pairs.extend((None, j) for j in range(len(new)) if j not in seen)
+        return pairs
+
+    # No identity key: identical items pair up by digest (order-insensitive), the leftovers
+    # are paired positionally and the remainder is added/removed.
+    unmatched_new: Dict[str, List[int]] = {}
+    for j, item in enumerate(new):
+        unmatched_new.setdefault(digests.get(item), []).append(j)
+    pairs = []
+    left_old: List[int] = []
+    for i, item in enumerate(old):
+        bucket = unmatched_new.get(digests.get(item))
+        if bucket:
+            pairs.append((i, bucket.pop(0)))
+        else:
+            left_old.append(i)
+    left_new = sorted(j for bucket in unmatched_new.values() for j in bucket)
+    for i, j in zip(left_old, left_new):
+        pairs.append((i, j))
+    pairs.extend((i, None) for i in left_old[len(left_new):])
+    pairs.extend((None, j) for j in left_new[len(left_old):])
+    return pairs
+
+
+def diff(old: Any, new: Any, base_path: str = "") -> List[Dict[str, Any]]:
+    """Structural diff of two JSON-like values.
+
+    Returns one entry per changed leaf or whole added/removed subtree:
+        {"path": "/security_groups/1/group_name", "op": "changed", "old": ..., "new": ...}
+    `op` is one of "added", "removed", "changed". Paths are JSON pointers; list items matched by
+    identity key use the index in the new document (the old one for removals). Keys that are
+    missing on one side and null on the other are not reported. Identical subtrees are skipped by
+    digest comparison without being walked again.
+    """
+    # One cache serves both documents: digests depend only on content, ids are unique while alive
+    digests = _Digests()
+    changes: List[Dict[str, Any]] = []
+    stack: List[Tuple[str, Any, Any]] = [(base_path, old, new)]
+
+    while stack:
+        path, o, n = stack.pop()
+        if isinstance(o, (dict, list)) or isinstance(n, (dict, list)):
+            if digests.get(o) == digests.get(n):
+                continue
+        elif o == n:
+            continue
+
+        if isinstance(o, dict) and isinstance(n, dict):
+            pending = []
+            for k in sorted(set(o) | set(n), key=str):
+                child = f"{path}/{escape_pointer(k)}"
+                # A missing key and an explicit null are the same to the collector
+                if o.get(k) is None and n.get(k) is None:
+                    continue
+                if n.get(k) is None:
+                    changes.append({"path": child, "op": "removed", "old": o[k], "new": None})
+                elif o.get(k) is None:
+                    changes.append({"path": child, "op": "added", "old": None, "new": n[k]})
+                else:
+                    pending.append((child, o[k], n[k]))
+            stack.extend(reversed(pending))
+        elif isinstance(o, list) and isinstance(n, list):
+            pending = []
+            for i, j in _match_list(o, n, digests):
+                if j is None:
+                    changes.append({"path": f"{path}/{i}", "op": "removed", "old": o[i], "new": None})
+                elif i is None:
+                    changes.append({"path": f"{path}/{j}", "op": "added", "old": None, "new": n[j]})
+                else:
+                    pending.append((f"{path}/{j}", o[i], n[j]))
+            stack.extend(reversed(pending))
+        else:
+            changes.append({"path": path, "op": "changed", "old": o, "new": n})
+
+    changes.sort(key=lambda c: c["path"])
+    return changes
+
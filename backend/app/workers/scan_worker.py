@@ -0,0 +1,144 @@
+"""Scan worker pool: executes discovery scans queued in scan_jobs.
+
+Run alongside the API:
+
+    python -m app.workers.scan_worker [--processes N]
+
+The parent process also runs the scan scheduler (SCAN_SCHEDULER_ENABLED), which queues scans for
+accounts whose discovery_frequency/preferred_time_utc slot has come.
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# How often an idle worker also sweeps for jobs abandoned by a dead worker
+STALE_SWEEP_SECONDS = 60
+# A worker that dies sooner than this after starting is failing at start-up; the pool exits
+# instead of respawning it in a loop
+MIN_WORKER_UPTIME_SECONDS = 30
+
+
+def _heartbeat(queue, job_id, done: threading.Event) -> None:
+    interval = max(1.0, settings.scan_job_stale_seconds / 3)
+    while not done.wait(interval):
+        queue.heartbeat(job_id)
+
+
+def run_worker(worker_id: str, stop) -> None:
+    """Claim and execute jobs until `stop` is set."""
+    # The parent handles Ctrl-C/SIGTERM and lets the current scan finish
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    # Imported in the worker process so each one opens its own database connections
+    from app.services.discovery_service import DiscoveryService
+    from app.services.scan_progress_service import ScanProgressService
+    from app.services.scan_queue_service import ScanQueueService
+
+    queue = ScanQueueService()
+    last_sweep = 0.0
+    logger.info(f"Scan worker {worker_id} started")
+    while not stop.is_set():
+        if time.monotonic() - last_sweep > STALE_SWEEP_SECONDS:
+            for scan_id in queue.recover_stale():
+                ScanProgressService().complete_scan(scan_id, success=False, error_message="Scan worker stopped responding")
+            last_sweep = time.monotonic()
+
+        job = queue.claim(worker_id)
+        if job is None:
+            stop.wait(settings.scan_worker_poll_seconds)
+            continue
+
+        logger.info(f"Worker {worker_id} running scan {job.scan_id}")
+        done = threading.Event()
+        beat = threading.Thread(target=_heartbeat, args=(queue, job.id, done), daemon=True)
+        beat.start()
+        try:
+            result = DiscoveryService().execute_scan(job.scan_id)
+            queue.finish(job.id, success=result.status == "completed", error_message=result.error_message)
+        except Exception as e:
+            logger.error(f"Scan {job.scan_id} crashed: {e}")
+            ScanProgressService().complete_scan(job.scan_id, success=False, error_message=str(e))
+            queue.finish(job.id, success=False, error_message=str(e))
+        finally:
+            done.set()
+            beat.join()
+    logger.info(f"Scan worker {worker_id} stopped")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Execute queued discovery scans")
+    parser.add_argument("--processes", type=int, default=settings.scan_worker_processes)
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    # Spawned (not forked) so no SQLAlchemy pool or Arango client is shared between processes
+    ctx = multiprocessing.get_context("spawn")
+    stop = ctx.Event()
+    host = socket.gethostname()
+    workers = {}
+
+    def spawn(i: int) -> None:
+        p = ctx.Process(target=run_worker, args=(f"{host}:{os.getpid()}:{i}", stop), name=f"scan-worker-{i}")
+        p.start()
+        workers[i] = (p, time.monotonic())
+
+    for i in range(max(1, args.processes)):
+        spawn(i)
+
+    def shutdown(signum, frame):
+        logger.info("Stopping scan workers after their current scan...")
+        stop.set()
+
+    signal.signal(signal.SIGTERM, shutdown)
+    signal.signal(signal.SIGINT, shutdown)
+
+    # The parent queues scheduled scans while the children execute them
+    scheduler = None
+    if settings.scan_scheduler_enabled:
+        from app.services.scan_scheduler_service import ScanSchedulerService
+
+        scheduler = ScanSchedulerService()
+    exit_code = 0
+    while not stop.is_set():
+        # A crashed child's job is requeued by the stale sweep; its slot gets a fresh process
+        for i, (p, started) in list(workers.items()):
+            if p.is_alive():
+                continue
+            if time.monotonic() - started < MIN_WORKER_UPTIME_SECONDS:
+                logger.error(f"{p.name} exited with code {p.exitcode} right after starting; stopping scan workers")
+                exit_code = 1
+                stop.set()
+                break
+            logger.warning(f"{p.name} exited with code {p.exitcode}; restarting it")
+            spawn(i)
+        if stop.is_set():
+            break
+        if scheduler is not None:
+            scheduler.tick()
+        stop.wait(settings.scan_scheduler_poll_seconds)
+    for p, _ in workers.values():
+        p.join()
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Benchmark the navigation sidebar: one combined SQL statement vs. the per-section queries
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+
+def per_section(service, account_identifier):
+    """The previous path: each sidebar section issues its own queries."""
+    return {
+        "inventory": service._get_inventory_data(account_identifier),
+        "recovery_posture": service._get_recovery_posture_data(account_identifier),
+        "discovery": service._get_discovery_data(account_identifier),
+        "compliance": service._get_compliance_data(account_identifier),
+        "drift": service._get_drift_data(account_identifier),
+        "recovery_testing": service._get_recovery_testing_data(account_identifier),
+    }
+
+
+def combined(service, account_identifier):
+    return service.get_navigation_data(account_identifier)
+
+
+def bench(label, fn, account_identifier, iterations):
+    from app.services.navigation_service import NavigationService
+
+    timings = []
+    result = None
+    for _ in range(iterations):
+        service = NavigationService()
+        started = time.perf_counter()
+        result = fn(service, account_identifier)
+        timings.append((time.perf_counter() - started) * 1000)
+        service.session.close()
+    print(
+        f"{label:<12} median {statistics.median(timings):8.2f} ms   "
+        f"p95 {sorted(timings)[int(len(timings) * 0.95) - 1]:8.2f} ms   ({iterations} runs)"
+    )
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--account-identifier", default=None)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    old = bench("per-section", per_section, args.account_identifier, args.iterations)
+    new = bench("combined", combined, args.account_identifier, args.iterations)
+    for section in old:
+        if old[section] != new[section]:
+            print(f"⚠️  {section} differs:\n  per-section: {old[section]}\n  combined:    {new[section]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+import shlex
+import sys
+import threading
+import time
+
+from app.services.collect_orchestrator import CollectOrchestrator, CollectTarget
+from app.services.config_service import ConfigService
+
+# Each "account" sleeps for as many seconds as its identifier says
+SLEEP_TEMPLATE = f'{shlex.quote(sys.executable)} -c "import sys, time; time.sleep(float(sys.argv[1]))" {{account}}'
+
+
+def _orchestrator(handed_off, **kwargs):
+    def on_collected(targets):
+        handed_off.append((time.monotonic(), [t.account_identifier for t in targets]))
+        return {t.account_identifier: f"scan-{t.account_identifier}" for t in targets}
+
+    return CollectOrchestrator(command_template=SLEEP_TEMPLATE, on_collected=on_collected, **kwargs)
+
+
+def test_collects_run_concurrently_and_hand_off_as_each_finishes():
+    """Test total time tracks the slowest collect and fast accounts are handed on first"""
+    handed_off = []
+    targets = [CollectTarget("aws", "0.8"), CollectTarget("aws", "0.1"), CollectTarget("gcp", "0.4")]
+    started = time.monotonic()
+    results = _orchestrator(handed_off, concurrency=3).run_sync(targets)
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 1.2  # serial would be 1.3s plus interpreter start-ups
+    assert [accounts for _, accounts in handed_off] == [["0.1"], ["0.4"], ["0.8"]]
+    assert handed_off[0][0] - started < 0.6
+    assert all(r.collected and r.returncode == 0 for r in results)
+    assert results[0].scans == {"0.8": "scan-0.8"}
+
+
+def test_identical_commands_share_one_run_and_timeouts_skip_hand_off():
+    """Test accounts rendering the same command are collected once; a timed-out run is killed"""
+    handed_off = []
+    orchestrator = _orchestrator(handed_off, concurrency=2, timeout_seconds=0.5)
+    orchestrator.command_template = SLEEP_TEMPLATE.replace("{account}", "{provider}")
+    results = orchestrator.run_sync([
+        CollectTarget("0.1", "a"), CollectTarget("0.1", "b"), CollectTarget("5", "c"),
+    ])
+
+    assert [r.accounts for r in results] == [["a", "b"], ["c"]]
+    assert handed_off[0][1] == ["a", "b"]
+    assert results[1].timed_out and not results[1].collected
+    assert len(handed_off) == 1
+
+
+def test_background_collect_folds_requests_into_one_follow_up_run():
+    """Test restart-and-collect returns at once and requests made during a run trigger one more"""
+    runs = []
+    release = threading.Event()
+    done = threading.Event()
+
+    class RecordingConfigService(ConfigService):
+        def restart_fixworker_and_collect(self, extra_targets=None):
+            runs.append([t.account_identifier for t in extra_targets or []])
+            if len(runs) == 1:
+                release.wait(5)
+            else:
+                done.set()
+            return True
+
+    service = RecordingConfigService()
+    assert service.start_restart_fixworker_and_collect([CollectTarget("gcp", "p1")]) is True
+    assert service.start_restart_fixworker_and_collect([CollectTarget("gcp", "p2")]) is False
+    assert service.start_restart_fixworker_and_collect() is False
+    release.set()
+
+    assert done.wait(5)
+    assert runs == [["p1"], ["p2"]]
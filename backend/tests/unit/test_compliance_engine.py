@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.compliance_engine import RuleEngine, compile_predicate, compile_rule
+
+
+def _rule(**kw):
+    base = dict(rule_id="r1", resource_type="aws_s3_bucket", field_path="reported.public",
+                operator="equals", expected_value=False)
+    base.update(kw)
+    return SimpleNamespace(**base)
+
+
+def test_rule_only_visits_its_resource_type():
+    """Test bucketing by type and failed resource output"""
+    resources = [
+        {"id": "1", "name": "a", "type": "aws_s3_bucket", "reported": {"public": True}},
+        {"id": "2", "name": "b", "type": "aws_s3_bucket", "reported": {"public": False}},
+        {"id": "3", "name": "c", "type": "aws_ec2_instance", "reported": {"public": True}},
+    ]
+    engine = RuleEngine(resources)
+
+    passed, failed = engine.evaluate(compile_rule(_rule()))
+
+    assert passed is False
+    assert [f["resource_id"] for f in failed] == ["1"]
+    assert engine.stats.resources_touched == 2
+
+
+def test_predicates_fail_closed():
+    """Test operator edge cases keep _evaluate_condition semantics"""
+    assert compile_predicate("greater_than", 5)("7") is True
+    assert compile_predicate("greater_than", 5)("not-a-number") is False
+    assert compile_predicate("greater_than", "x")(7) is False
+    assert compile_predicate("contains", "prod")(None) is False
+    assert compile_predicate("unknown", 1)(1) is False
+
+
+def test_columnar_matches_row_evaluation():
+    """Test vectorized operators agree with the per-row predicates"""
+    pytest.importorskip("numpy")
+    values = [None, True, False, 0, 1, 2.5, "7", "x", "", [], {"a": 1}]
+    resources = [
+        {"id": str(i), "name": "r", "type": "aws_s3_bucket", "reported": {"public": v}}
+        for i, v in enumerate(values)
+    ]
+    for operator, expected in [("equals", False), ("not_equals", "x"), ("greater_than", 2),
+                               ("less_than", "3"), ("is_true", None), ("is_null", None)]:
+        compiled = compile_rule(_rule(operator=operator, expected_value=expected))
+        rows = RuleEngine(resources, columnar=False).evaluate_sample(compiled)
+        columns = RuleEngine(resources, columnar=True).evaluate_sample(compiled)
+        assert columns == rows, operator
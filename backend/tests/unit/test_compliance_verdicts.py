@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from app.services.compliance_verdict_service import AssetState, plan_incremental
+
+T0 = datetime(2025, 9, 1, tzinfo=timezone.utc)
+T1 = datetime(2025, 9, 2, tzinfo=timezone.utc)
+
+
+def _rule(id, resource_type="aws_s3_bucket", updated_at=T0):
+    return SimpleNamespace(id=id, resource_type=resource_type, updated_at=updated_at)
+
+
+def test_only_edited_rules_and_changed_assets_are_replanned():
+    """Test stale rules fetch every candidate, fresh rules only changed assets"""
+    rules = [_rule("r1"), _rule("r2", resource_type="aws_ec2_instance", updated_at=T1)]
+    assets = [
+        AssetState("a1", "aws_s3_bucket", "h1"),
+        AssetState("a2", "aws_s3_bucket", "h2-new"),
+        AssetState("a3", "aws_ec2_instance", "h3"),
+    ]
+    rule_state = {"r1": (T0, T0), "r2": (T0, T0)}
+    asset_state = {"a1": ("h1", "h1"), "a2": ("h2", "h2"), "a3": ("h3", "h3")}
+
+    plan = plan_incremental(rules, assets, rule_state, asset_state)
+
+    assert plan.stale_rules == {"r2"}
+    assert plan.fresh_rules == {"r1"}
+    assert plan.changed_assets == {"a2"}
+    assert plan.fetch_assets == {"a2", "a3"}
+
+
+def test_force_replans_everything():
+    """Test force_evaluation ignores stored verdicts"""
+    rules = [_rule("r1")]
+    assets = [AssetState("a1", "aws_s3_bucket", "h1")]
+
+    plan = plan_incremental(rules, assets, {"r1": (T0, T0)}, {"a1": ("h1", "h1")}, force=True)
+
+    assert plan.stale_rules == {"r1"}
+    assert plan.fetch_assets == {"a1"}
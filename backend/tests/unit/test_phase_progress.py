@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+
+from app.services.scan_progress_service import PhaseProgressReporter
+
+
+class RecordingReporter(PhaseProgressReporter):
+    def __init__(self, **kwargs):
+        self.now = 0.0
+        self.writes = []
+        super().__init__("scan-test", clock=lambda: self.now, **kwargs)
+
+    def _store(self, phase_progress, phase_rows):
+        self.writes.append((phase_progress, phase_rows))
+
+
+def test_progress_writes_are_throttled_by_rows_and_time():
+    """Test one write per every_rows rows or every_seconds, whichever comes first"""
+    reporter = RecordingReporter(every_rows=5000, every_seconds=1.0)
+    for batch in range(1, 11):
+        reporter.now = batch * 0.1
+        reporter(batch * 1000, 20000)
+    # 10 batches of 1000 rows in one second: writes at 5000 and 10000 rows
+    assert [w[1]["rows_processed"] for w in reporter.writes] == [5000, 10000]
+    assert reporter.writes[-1][0] == 50
+
+    reporter.now = 2.5
+    reporter(10500, 20000)
+    assert reporter.writes[-1][1]["rows_processed"] == 10500
+    assert reporter.writes[-1][1]["rows_per_second"] == 4200.0
+
+
+def test_progress_stays_below_100_until_closed():
+    """Test an underestimated total never reports a finished phase early"""
+    reporter = RecordingReporter(every_rows=1, every_seconds=60)
+    reporter.now = 1.0
+    reporter(12000, 10000)
+    assert reporter.writes[-1][0] == 99
+    reporter.close()
+    assert reporter.writes[-1][0] == 100
+    assert reporter.writes[-1][1]["rows_total"] == 12000
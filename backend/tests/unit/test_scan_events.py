@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+
+import asyncio
+
+from app.services.scan_events import ALL_SCANS, QUEUE_SIZE, ScanEventBus
+
+
+def test_events_fan_out_to_scan_and_all_scan_subscribers():
+    """Test one published event reaches every matching subscriber and is cached"""
+    async def run():
+        bus = ScanEventBus()
+        one, two = bus.subscribe("scan-1"), bus.subscribe("scan-1")
+        everything, other = bus.subscribe(ALL_SCANS), bus.subscribe("scan-2")
+
+        bus.publish({"scan_id": "scan-1", "status": "running", "phase_progress": 40})
+
+        for queue in (one, two, everything):
+            assert (await queue.get())["phase_progress"] == 40
+        assert other.empty()
+        assert bus.latest("scan-1")["status"] == "running"
+
+        bus.unsubscribe("scan-1", one)
+        bus.publish({"scan_id": "scan-1", "status": "completed"})
+        assert one.empty() and two.qsize() == 1
+
+    asyncio.run(run())
+
+
+def test_slow_subscriber_keeps_newest_events():
+    """Test a full queue drops its oldest event instead of blocking the publisher"""
+    async def run():
+        bus = ScanEventBus()
+        queue = bus.subscribe("scan-1")
+        for i in range(QUEUE_SIZE + 5):
+            bus.publish({"scan_id": "scan-1", "phase_progress": i})
+        assert queue.qsize() == QUEUE_SIZE
+        assert (await queue.get())["phase_progress"] == 5
+
+    asyncio.run(run())
+
+
+def test_reconcile_replaces_stale_in_flight_state():
+    """Test a reconnect snapshot corrects in-flight scans whose end was missed"""
+    async def run():
+        bus = ScanEventBus()
+        bus.publish({"scan_id": "scan-1", "status": "running"})
+        bus.publish({"scan_id": "scan-2", "status": "running"})
+        bus.publish({"scan_id": "scan-3", "status": "completed"})
+        queue = bus.subscribe("scan-1")
+        assert sorted(bus.in_flight()) == ["scan-1", "scan-2"]
+
+        # scan-1 finished while disconnected, scan-2 was deleted, scan-4 started
+        bus.reconcile([
+            {"scan_id": "scan-1", "status": "completed"},
+            {"scan_id": "scan-4", "status": "pending"},
+        ])
+
+        assert (await queue.get())["status"] == "completed"
+        assert bus.latest("scan-2") is None
+        assert bus.latest("scan-3")["status"] == "completed"
+        assert bus.in_flight() == ["scan-4"]
+
+    asyncio.run(run())
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+
+from datetime import datetime, timedelta, timezone
+
+from app.services.scan_scheduler_service import next_run_at, parse_frequency
+
+NOW = datetime(2025, 10, 3, 10, 30, tzinfo=timezone.utc)
+NO_JITTER = timedelta(0)
+
+
+def test_parse_frequency_accepts_ui_values():
+    """Test both connect wizards' frequency values map to intervals"""
+    assert parse_frequency("Every 6 hours") == timedelta(hours=6)
+    assert parse_frequency("12h") == timedelta(hours=12)
+    assert parse_frequency("Daily") == timedelta(days=1)
+    assert parse_frequency("hourly") == timedelta(hours=1)
+    assert parse_frequency("weekly") == timedelta(weeks=1)
+    assert parse_frequency(None) is None
+    assert parse_frequency("manual") is None
+
+
+def test_next_run_follows_preferred_time():
+    """Test slots repeat every interval from the preferred time"""
+    assert next_run_at("a", "daily", "02:00", NOW, NO_JITTER) == datetime(2025, 10, 4, 2, 0, tzinfo=timezone.utc)
+    assert next_run_at("a", "6h", "02:00", NOW, NO_JITTER) == datetime(2025, 10, 3, 14, 0, tzinfo=timezone.utc)
+    # Strictly after: a scan due right now is planned for the following slot
+    slot = datetime(2025, 10, 3, 14, 0, tzinfo=timezone.utc)
+    assert next_run_at("a", "6h", "02:00", slot, NO_JITTER) == slot + timedelta(hours=6)
+    assert next_run_at("a", None, "02:00", NOW) is None
+
+
+def test_jitter_is_stable_and_spreads_accounts():
+    """Test accounts on one schedule start at distinct, repeatable times inside the window"""
+    window = timedelta(minutes=15)
+    runs = [next_run_at(f"acct-{i}", "daily", "02:00", NOW, window) for i in range(50)]
+    base = datetime(2025, 10, 4, 2, 0, tzinfo=timezone.utc)
+    assert all(base <= r < base + window for r in runs)
+    assert len(set(runs)) > 25
+    assert runs == [next_run_at(f"acct-{i}", "daily", "02:00", NOW, window) for i in range(50)]
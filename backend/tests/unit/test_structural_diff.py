@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+
+from app.services.structural_diff import diff, pointer_to_field
+
+
+def test_nested_change_has_pointer_path():
+    """Test nested dict changes are reported at the leaf"""
+    old = {"encryption": {"sse": {"algorithm": "AES256"}}}
+    new = {"encryption": {"sse": {"algorithm": "aws:kms"}}}
+
+    assert diff(old, new) == [
+        {"path": "/encryption/sse/algorithm", "op": "changed", "old": "AES256", "new": "aws:kms"}
+    ]
+
+
+def test_list_items_matched_by_identity_key():
+    """Test reordered security groups only report the real change"""
+    old = {"security_groups": [{"group_id": "sg-1", "name": "web"}, {"group_id": "sg-2", "name": "db"}]}
+    new = {"security_groups": [{"group_id": "sg-2", "name": "db-new"}, {"group_id": "sg-1", "name": "web"}]}
+
+    changes = diff(old, new)
+    assert [(c["path"], c["op"]) for c in changes] == [("/security_groups/0/name", "changed")]
+    assert pointer_to_field(changes[0]["path"]) == "security_groups.0.name"
+
+
+def test_added_removed_and_identical():
+    """Test additions, removals, escaping and the identical short-circuit"""
+    old = {"a/b": 1, "gone": True, "tags": ["x", "y"]}
+    new = {"a/b": 1, "tags": ["y", "x"], "new": {"k": 1}, "missing_vs_null": None}
+
+    assert [(c["path"], c["op"]) for c in diff(old, new)] == [("/gone", "removed"), ("/new", "added")]
+    assert diff(old, old) == []
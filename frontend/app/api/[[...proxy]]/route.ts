@@ -18,11 +18,19 @@ async function forward(req: NextRequest, path: string, method: string) {
     init.body = body;
   }
 
+  // Abort the upstream request when the browser goes away (ends server-sent event streams)
+  init.signal = req.signal;
+
   const res = await fetch(url, init as any);
-  const text = await res.text();
   const respHeaders = new Headers();
   const resCT = res.headers.get("content-type");
   if (resCT) respHeaders.set("content-type", resCT);
+  if (resCT && resCT.startsWith("text/event-stream")) {
+    // Pass server-sent events through as they arrive instead of buffering the body
+    respHeaders.set("cache-control", "no-cache");
+    return new Response(res.body, { status: res.status, headers: respHeaders });
+  }
+  const text = await res.text();
   // CORS not needed for same-origin proxy
   return new Response(text, { status: res.status, headers: respHeaders });
 }
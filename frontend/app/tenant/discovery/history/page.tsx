@@ -18,7 +18,7 @@ type Scan = {
   accountName: string
   accountId: string
   type: "full" | "incremental" | "compliance" | "backup-validation"
-  status: "completed" | "running" | "failed" | "cancelled"
+  status: "completed" | "running" | "pending" | "failed" | "cancelled"
   startTime: string
   endTime?: string
   durationSec: number
@@ -196,55 +196,40 @@ export default function DiscoveryHistory() {
     load()
   }, [])
 
-  // Auto-refresh for running scans
+  // Live progress for running scans, pushed by the backend over server-sent events
+  const hasActiveScans = scans.some(s => s.status === "running" || s.status === "pending")
   useEffect(() => {
-    const runningScanIds = scans.filter(s => s.status === "running").map(s => s.id)
-    setRunningScans(new Set(runningScanIds))
-    
-    if (runningScanIds.length === 0) return
+    setRunningScans(new Set(scans.filter(s => s.status === "running").map(s => s.id)))
+  }, [scans])
 
-    const interval = setInterval(async () => {
+  useEffect(() => {
+    if (!hasActiveScans) return
+
+    const source = new EventSource("/api/tenant/discovery/history/progress/stream")
+    source.addEventListener("progress", (message) => {
       try {
-        // Update progress for each running scan
-        const updatedScans = await Promise.all(
-          scans.map(async (scan) => {
-            if (scan.status === "running") {
-              try {
-                const progressRes = await fetch(`/api/tenant/discovery/history/progress/${scan.id}`, { cache: "no-store" })
-                if (progressRes.ok) {
-                  const progressData = await progressRes.json()
-                  return {
-                    ...scan,
-                    progress: progressData.overall_progress,
-                    currentPhase: progressData.current_phase,
-                    phaseProgress: progressData.phase_progress,
-                    totalPhases: progressData.total_phases,
-                    estimatedCompletion: progressData.estimated_completion,
-                    errorMessage: progressData.error_message,
-                    status: progressData.status
-                  }
-                }
-              } catch (e) {
-                console.error(`Failed to get progress for scan ${scan.id}:`, e)
-              }
-            }
-            return scan
-          })
-        )
-        
-        setScans(updatedScans)
-        
-        // Remove completed scans from running set
-        const stillRunning = updatedScans.filter(s => s.status === "running").map(s => s.id)
-        setRunningScans(new Set(stillRunning))
-        
+        const progressData = JSON.parse((message as MessageEvent).data)
+        setScans(prev => prev.map(scan => scan.id === progressData.scan_id ? {
+          ...scan,
+          progress: progressData.overall_progress ?? scan.progress,
+          currentPhase: progressData.current_phase,
+          phaseProgress: progressData.phase_progress,
+          totalPhases: progressData.total_phases,
+          estimatedCompletion: progressData.estimated_completion,
+          errorMessage: progressData.error_message,
+          status: progressData.status
+        } : scan))
       } catch (e) {
-        console.error("Failed to update scan progress:", e)
+        console.error("Failed to apply scan progress:", e)
       }
-    }, 2000) // Poll every 2 seconds
+    })
+    source.onerror = () => {
+      // EventSource reconnects on its own; nothing to do beyond noting it
+      console.warn("Scan progress stream interrupted, reconnecting")
+    }
 
-    return () => clearInterval(interval)
-  }, [scans.filter(s => s.status === "running").length]) // Re-run when running scans change
+    return () => source.close()
+  }, [hasActiveScans])
 
   const filteredScans = scans.filter((scan) => {
     const matchesSearch =
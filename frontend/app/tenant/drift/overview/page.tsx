@@ -169,6 +169,9 @@ const recommendations = [
   },
 ]
 
+// Findings requested per page from /api/tenant/drift/overview
+const DRIFT_PAGE_SIZE = 100
+
 export default function DriftOverviewPage() {
   const [selectedResources, setSelectedResources] = useState<string[]>([])
   const [isFixingAll, setIsFixingAll] = useState(false)
@@ -190,21 +193,35 @@ export default function DriftOverviewPage() {
     nextScan: null
   })
   const [rows, setRows] = useState<any[]>([])
+  const [totalFindings, setTotalFindings] = useState(0)
   const [loading, setLoading] = useState(true)
+  const [loadingMore, setLoadingMore] = useState(false)
 
   const [selectedDriftItem, setSelectedDriftItem] = useState<any>(null)
   const [driftDetails, setDriftDetails] = useState<any>(null)
   const [loadingDetails, setLoadingDetails] = useState(false)
 
+  // Findings are served most severe first, one page at a time
+  const fetchFindings = async (offset: number) => {
+    const params = new URLSearchParams({
+      account_identifier: "142141431503",
+      limit: String(DRIFT_PAGE_SIZE),
+      offset: String(offset),
+    })
+    const res = await fetch(`/api/tenant/drift/overview?${params}`, { cache: "no-store" })
+    if (!res.ok) return null
+    const data = await res.json()
+    if (data?.summary) setSummary(data.summary)
+    setTotalFindings(data?.pagination?.total ?? 0)
+    return Array.isArray(data?.items) ? data.items : []
+  }
+
   useEffect(() => {
     const load = async () => {
       try {
         setLoading(true)
-        const res = await fetch("/api/tenant/drift/overview?account_identifier=142141431503", { cache: "no-store" })
-        if (!res.ok) return
-        const data = await res.json()
-        if (data?.summary) setSummary(data.summary)
-        if (Array.isArray(data?.items)) setRows(data.items)
+        const items = await fetchFindings(0)
+        if (items) setRows(items)
       } catch (error) {
         console.error('Failed to load drift data:', error)
       } finally {
@@ -214,6 +231,18 @@ export default function DriftOverviewPage() {
     load()
   }, [])
 
+  const handleLoadMore = async () => {
+    setLoadingMore(true)
+    try {
+      const items = await fetchFindings(rows.length)
+      if (items) setRows((prev) => [...prev, ...items])
+    } catch (error) {
+      console.error('Failed to load more drift findings:', error)
+    } finally {
+      setLoadingMore(false)
+    }
+  }
+
   const handleViewDetails = async (item: any) => {
     setSelectedDriftItem(item)
     setLoadingDetails(true)
@@ -837,6 +866,19 @@ export default function DriftOverviewPage() {
               )}
             </TableBody>
           </Table>
+          {rows.length > 0 && (
+            <div className="flex items-center justify-between pt-4">
+              <p className="text-sm text-muted-foreground">
+                Showing {rows.length} of {totalFindings} drifting resources
+              </p>
+              {rows.length < totalFindings && (
+                <Button variant="outline" size="sm" onClick={handleLoadMore} disabled={loadingMore}>
+                  {loadingMore && <RefreshCw className="h-4 w-4 mr-2 animate-spin" />}
+                  Load more
+                </Button>
+              )}
+            </div>
+          )}
         </CardContent>
       </Card>
 
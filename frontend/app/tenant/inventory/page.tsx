@@ -35,50 +35,21 @@ interface ServiceStats {
 
 type RegionStat = { region: string; total: number; protected: number; coverage: number }
 
+// Assets requested per page from /api/tenant/inventory
+const INVENTORY_PAGE_SIZE = 100
+
 export default function InventoryPage() {
   const [searchTerm, setSearchTerm] = useState("")
   const [serviceFilter, setServiceFilter] = useState("all")
   const [regionFilter, setRegionFilter] = useState("all")
   const [statusFilter, setStatusFilter] = useState("all")
   const [resourcesData, setResourcesData] = useState<Resource[]>([])
-  const [protectedCount, setProtectedCount] = useState(0)
-  const [unprotectedCount, setUnprotectedCount] = useState(0)
-  
-  // Derived: service and region stats from resourcesData
-  const svcStats: ServiceStats[] = (() => {
-    const map = new Map<string, { total: number; prot: number }>()
-    for (const r of resourcesData) {
-      const key = r.service || "Unknown"
-      const prev = map.get(key) || { total: 0, prot: 0 }
-      prev.total += 1
-      if (r.status === "protected") prev.prot += 1
-      map.set(key, prev)
-    }
-    return Array.from(map.entries()).map(([service, v]) => ({
-      service,
-      total: v.total,
-      protected: v.prot,
-      unprotected: v.total - v.prot,
-      coverage: v.total ? Math.round((v.prot / v.total) * 100) : 0,
-    }))
-  })()
-
-  const regStats: RegionStat[] = (() => {
-    const map = new Map<string, { total: number; prot: number }>()
-    for (const r of resourcesData) {
-      const key = r.region || "unknown"
-      const prev = map.get(key) || { total: 0, prot: 0 }
-      prev.total += 1
-      if (r.status === "protected") prev.prot += 1
-      map.set(key, prev)
-    }
-    return Array.from(map.entries()).map(([region, v]) => ({
-      region,
-      total: v.total,
-      protected: v.prot,
-      coverage: v.total ? Math.round((v.prot / v.total) * 100) : 0,
-    }))
-  })()
+  const [nextCursor, setNextCursor] = useState<string | null>(null)
+  const [loadingMore, setLoadingMore] = useState(false)
+  // Counts and per-service/region stats cover every asset, not just the loaded pages
+  const [totals, setTotals] = useState({ total: 0, protected: 0, unprotected: 0, coverage: 0 })
+  const [svcStats, setSvcStats] = useState<ServiceStats[]>([])
+  const [regStats, setRegStats] = useState<RegionStat[]>([])
 
   const toRelative = (val?: string | number | null): string | undefined => {
     if (val === undefined || val === null) return undefined
@@ -93,51 +64,110 @@ export default function InventoryPage() {
     return `${days} days ago`
   }
 
+  const toResource = (it: any): Resource => {
+    const statusRaw = String(it.status ?? "unprotected").toLowerCase()
+    const status: Resource["status"] = statusRaw === "protected" ? "protected" : statusRaw === "partial" ? "partial" : "unprotected"
+    return {
+      id: String(it.id ?? ""),
+      name: String(it.name ?? it.id ?? "unknown"),
+      type: String(it.type ?? "unknown"),
+      service: String(it.service ?? it.type ?? "unknown"),
+      region: String(it.region ?? "unknown"),
+      status,
+      lastBackup: toRelative(it.last_backup),
+      rpo: "-",
+      rto: "-",
+      criticality: status === "unprotected" ? "high" : "low",
+    }
+  }
+
+  // One page of assets; service, region and status filters are applied by the server
+  const fetchPage = async (cursor: string | null) => {
+    const params = new URLSearchParams({ limit: String(INVENTORY_PAGE_SIZE) })
+    if (cursor) params.set("cursor", cursor)
+    if (serviceFilter !== "all") params.set("service", serviceFilter)
+    if (regionFilter !== "all") params.set("region", regionFilter)
+    if (statusFilter !== "all") params.set("status", statusFilter)
+    const res = await fetch(`/api/tenant/inventory?${params}`, { cache: "no-store" })
+    if (!res.ok) return null
+    const data = await res.json()
+    return {
+      items: (Array.isArray(data?.items) ? data.items : []).map(toResource),
+      nextCursor: (data?.next_cursor as string | null) ?? null,
+    }
+  }
+
   useEffect(() => {
-    const load = async () => {
+    const loadCoverage = async () => {
       try {
-        const res = await fetch("/api/tenant/inventory", { cache: "no-store" })
+        const res = await fetch("/api/tenant/inventory/coverage", { cache: "no-store" })
         if (!res.ok) return
         const data = await res.json()
-        const items = Array.isArray(data?.items) ? data.items : []
-        const mapped: Resource[] = items.map((it: any) => {
-          const statusRaw = String(it.status ?? "unprotected").toLowerCase()
-          const status: Resource["status"] = statusRaw === "protected" ? "protected" : statusRaw === "partial" ? "partial" : "unprotected"
-          return {
-            id: String(it.id ?? ""),
-            name: String(it.name ?? it.id ?? "unknown"),
-            type: String(it.type ?? "unknown"),
-            service: String(it.service ?? it.type ?? "unknown"),
-            region: String(it.region ?? "unknown"),
-            status,
-            lastBackup: toRelative(it.last_backup),
-            rpo: "-",
-            rto: "-",
-            criticality: status === "unprotected" ? "high" : "low",
-          }
+        const summary = data?.summary ?? {}
+        setTotals({
+          total: Number(summary.total ?? 0),
+          protected: Number(summary.protected ?? 0),
+          unprotected: Number(summary.unprotected ?? 0),
+          coverage: Number(summary.coverage ?? 0),
         })
-        setResourcesData(mapped)
-        const prot = mapped.filter((r) => r.status === "protected").length
-        const unprot = mapped.filter((r) => r.status === "unprotected").length
-        setProtectedCount(prot)
-        setUnprotectedCount(unprot)
+        setSvcStats(
+          (Array.isArray(data?.by_service) ? data.by_service : []).map((s: any) => ({
+            service: String(s.service),
+            total: Number(s.total ?? 0),
+            protected: Number(s.protected ?? 0),
+            unprotected: Number(s.unprotected ?? 0),
+            coverage: Math.round(Number(s.coverage ?? 0)),
+          }))
+        )
+        setRegStats(
+          (Array.isArray(data?.by_region) ? data.by_region : []).map((r: any) => ({
+            region: String(r.region),
+            total: Number(r.total ?? 0),
+            protected: Number(r.protected ?? 0),
+            coverage: Math.round(Number(r.coverage ?? 0)),
+          }))
+        )
+      } catch (e) {
+        // ignore; keep zero counts
+      }
+    }
+    loadCoverage()
+  }, [])
+
+  useEffect(() => {
+    const load = async () => {
+      try {
+        const page = await fetchPage(null)
+        if (!page) return
+        setResourcesData(page.items)
+        setNextCursor(page.nextCursor)
       } catch (e) {
         // ignore; keep empty list
       }
     }
     load()
-  }, [])
+  }, [serviceFilter, regionFilter, statusFilter])
 
-  const filteredResources = resourcesData.filter((resource) => {
-    const matchesSearch =
-      resource.name.toLowerCase().includes(searchTerm.toLowerCase()) ||
-      resource.type.toLowerCase().includes(searchTerm.toLowerCase())
-    const matchesService = serviceFilter === "all" || resource.service === serviceFilter
-    const matchesRegion = regionFilter === "all" || resource.region === regionFilter
-    const matchesStatus = statusFilter === "all" || resource.status === statusFilter
+  const handleLoadMore = async () => {
+    if (!nextCursor) return
+    setLoadingMore(true)
+    try {
+      const page = await fetchPage(nextCursor)
+      if (!page) return
+      setResourcesData((prev) => [...prev, ...page.items])
+      setNextCursor(page.nextCursor)
+    } catch (e) {
+      // ignore; keep loaded pages
+    } finally {
+      setLoadingMore(false)
+    }
+  }
 
-    return matchesSearch && matchesService && matchesRegion && matchesStatus
-  })
+  // Search narrows the loaded pages; the other filters were applied by the server
+  const filteredResources = resourcesData.filter((resource) =>
+    resource.name.toLowerCase().includes(searchTerm.toLowerCase()) ||
+    resource.type.toLowerCase().includes(searchTerm.toLowerCase())
+  )
 
   const getStatusBadgeVariant = (status: string) => {
     switch (status) {
@@ -205,7 +235,7 @@ export default function InventoryPage() {
             <CardTitle className="text-sm font-medium">Total Resources</CardTitle>
           </CardHeader>
           <CardContent>
-            <div className="text-2xl font-bold">{resourcesData.length}</div>
+            <div className="text-2xl font-bold">{totals.total}</div>
             <p className="text-xs text-muted-foreground">Across all services</p>
           </CardContent>
         </Card>
@@ -214,10 +244,8 @@ export default function InventoryPage() {
             <CardTitle className="text-sm font-medium">Protected</CardTitle>
           </CardHeader>
           <CardContent>
-            <div className="text-2xl font-bold text-success">{protectedCount}</div>
-            <p className="text-xs text-muted-foreground">
-              {resourcesData.length ? `${Math.round((protectedCount / resourcesData.length) * 1000) / 10}% coverage` : "0% coverage"}
-            </p>
+            <div className="text-2xl font-bold text-success">{totals.protected}</div>
+            <p className="text-xs text-muted-foreground">{`${totals.coverage}% coverage`}</p>
           </CardContent>
         </Card>
         <Card>
@@ -225,7 +253,7 @@ export default function InventoryPage() {
             <CardTitle className="text-sm font-medium">Unprotected</CardTitle>
           </CardHeader>
           <CardContent>
-            <div className="text-2xl font-bold text-critical">{unprotectedCount}</div>
+            <div className="text-2xl font-bold text-critical">{totals.unprotected}</div>
             <p className="text-xs text-muted-foreground">Needs attention</p>
           </CardContent>
         </Card>
@@ -234,7 +262,7 @@ export default function InventoryPage() {
             <CardTitle className="text-sm font-medium">Critical Assets</CardTitle>
           </CardHeader>
           <CardContent>
-            <div className="text-2xl font-bold text-warning">{resourcesData.filter((r) => r.criticality === "high").length}</div>
+            <div className="text-2xl font-bold text-warning">{totals.unprotected}</div>
             <p className="text-xs text-muted-foreground">High priority</p>
           </CardContent>
         </Card>
@@ -381,6 +409,13 @@ export default function InventoryPage() {
                   ))}
                 </TableBody>
               </Table>
+              {nextCursor && (
+                <div className="flex justify-center">
+                  <Button variant="outline" onClick={handleLoadMore} disabled={loadingMore}>
+                    {loadingMore ? "Loading..." : "Load more"}
+                  </Button>
+                </div>
+              )}
             </TabsContent>
 
             <TabsContent value="services" className="space-y-4">
@@ -70,6 +70,9 @@ export interface ComplianceDashboard {
   total_resources_evaluated: number
 }
 
+// Interval between progress checks of a queued compliance evaluation
+const EVALUATION_POLL_MS = 2000
+
 export function useComplianceData(accountId: string) {
   const [frameworks, setFrameworks] = useState<ComplianceFramework[]>([])
   const [rules, setRules] = useState<ComplianceRule[]>([])
@@ -132,6 +135,22 @@ export function useComplianceData(accountId: string) {
     }
   }
 
+  // Polls a queued evaluation job until it completes or fails; resolves to its final result
+  const waitForEvaluation = async (evaluationId: string) => {
+    while (true) {
+      const response = await fetch(`http://localhost:8000/api/compliance/evaluate/${evaluationId}`)
+      if (!response.ok) throw new Error('Failed to fetch evaluation progress')
+      const job = await response.json()
+      if (job.status === 'completed' || job.status === 'failed' || job.status === 'cancelled') {
+        if (job.status !== 'completed') {
+          throw new Error(job.error_message || 'Compliance evaluation failed')
+        }
+        return job.result
+      }
+      await new Promise((resolve) => setTimeout(resolve, EVALUATION_POLL_MS))
+    }
+  }
+
   const evaluateCompliance = async (frameworkId?: string, force = false) => {
     try {
       const response = await fetch('http://localhost:8000/api/compliance/evaluate', {
@@ -148,16 +167,15 @@ export function useComplianceData(accountId: string) {
       
       if (!response.ok) throw new Error('Failed to evaluate compliance')
       const data = await response.json()
-      
-      if (data.success) {
-        // Refresh data after evaluation
-        await Promise.all([
-          fetchScores(),
-          fetchDashboard(),
-        ])
-      }
-      
-      return data
+      if (!data.success) return data
+
+      // The POST only queues the job; scores change once it has finished
+      const result = await waitForEvaluation(data.evaluation_id)
+      await Promise.all([
+        fetchScores(),
+        fetchDashboard(),
+      ])
+      return result ?? data
     } catch (err) {
       console.error('Error evaluating compliance:', err)
       setError('Failed to evaluate compliance')